@@ -2,8 +2,11 @@
 import sys
 import time
 import random
+import socket
 import argparse
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -12,14 +15,50 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 
-from common.browser_utils import open_browser
-from locators.okey101_locators import RegisterLocators, LoginLocators, Okey101Locators
+from common.browser_utils import BASE_URL, close_browser
+from common.browser_pool import acquire_browser
+from common.account_pool import Account, AccountPool
+from common.unique_ids import next_id
+from common import timing
+from common.checkpoint import RetryPolicy, TableCheckpoint
+from common.log import get_logger, log_context
+from common.resource_monitor import get_monitor
+from common.lean_mode import LEAN_MODE, NETWORK_STATS, finish_network_stats
+from common.page_watch import wait_for_xpath_event
+from common.lobby_index import locate_table, release_index
+from common.form_fill import fill_form
+from common.session_store import SESSION_SNAPSHOTS, discard_session, restore_session, save_session
+from common.locator_registry import LocatorRegistry
+from common.frame_cache import DEFAULT_CONTEXT, FrameCache, iter_contexts, switch_to_context
+from locators.okey101_locators import LOCATOR_STRATEGIES, RegisterLocators, LoginLocators, Okey101Locators
+
+log = get_logger("101")
 
 # CI flag: CI ortamında human_delay devre dışı
 CI_MODE = os.getenv("CI", "0") == "1"
 
+# Hızlı form modu: formlar tek script çağrısıyla doldurulup submit edilir (CI'da varsayılan açık)
+FAST_FORMS = os.getenv("FAST_FORMS", "1" if CI_MODE else "0") == "1"
+
+# Oyuncu kurulumunda aynı anda kaç tarayıcı açılsın (1 => eski seri davranış)
+SETUP_WORKERS = int(os.getenv("SETUP_WORKERS", "4"))
+
+# Hesap modu: "register" => her oyuncu UI'dan yeni kayıt olur,
+# "pool" => ACCOUNT_POOL_DB'den hazır hesap kiralanır ve sadece login yapılır
+ACCOUNT_MODE = os.getenv("ACCOUNT_MODE", "register")
+
+# Alternatif bulucular arasından en hızlı çalışanı seçen registry (istatistikler LOCATOR_STATS'ta)
+LOCATORS = LocatorRegistry(LOCATOR_STRATEGIES)
+LOCATOR_TIMEOUT = 20
+
+# Guest'in lobisinde host'un masası en fazla kaç saniyede görünmeli
+TABLE_READY_TIMEOUT = float(os.getenv("TABLE_READY_TIMEOUT", "60"))
+# host_create_table yeniden denenmeden önce önceki denemenin masası lobide bu kadar saniye aranır
+TABLE_RECHECK_TIMEOUT = float(os.getenv("TABLE_RECHECK_TIMEOUT", "10"))
+
 
 def human_delay(min_s: float = 0.4, max_s: float = 1.2) -> None:
     if CI_MODE:
@@ -46,6 +85,9 @@ def type_slow(
 TABLE_NICKNAME_INPUT_XPATH = "//*[@id='root']/div/div[2]/div/form/input"
 TABLE_NICKNAME_SUBMIT_XPATH = "//*[@id='root']/div/div[2]/div/form/button"
 
+# Frame cache anahtarı: lobi, nickname popup'ları ve masa ekranı aynı 101 uygulamasında yaşar
+APP_FRAME_KEY = "okey101_app"
+
 
 @dataclass
 class Player:
@@ -55,38 +97,38 @@ class Player:
     email: str
     username: str
     password: str
+    leased: bool = False  # hesap AccountPool'dan kiralandıysa iş bitince iade edilir
+    # 101 ekranlarının hangi context'te (default/iframe) olduğunu hatırlar
+    frames: FrameCache = field(default_factory=FrameCache)
+    table_id: str | None = None  # timing kayıtları için masa kimliği
+    network_recorded: bool = False  # NETWORK_STATS kaydı alındı mı (kurulum sonunda ya da bırakırken)
 
 
 # -------------------- REGISTER FLOW --------------------
 
 
-def open_register_modal(driver, wait: WebDriverWait) -> None:
-    print("DEBUG | Opening registration modal...")
+def open_register_modal(driver, wait: WebDriverWait):
+    log.debug("Opening registration modal...")
     human_delay()
-    register_btn = wait.until(
-        EC.element_to_be_clickable((By.XPATH, RegisterLocators.REGISTER_BUTTON))
-    )
+    register_btn = LOCATORS.find(driver, "register_button", LOCATOR_TIMEOUT, clickable=True)
     register_btn.click()
 
-    wait.until(EC.presence_of_element_located((By.XPATH, RegisterLocators.EMAIL_INPUT)))
-    print("DEBUG | Registration modal is visible.")
+    email_el = LOCATORS.find(driver, "register_email_input", LOCATOR_TIMEOUT)
+    log.debug("Registration modal is visible.")
     human_delay()
+    return email_el
 
 
-def get_register_form_elements(driver):
-    email_el = driver.find_element(By.XPATH, RegisterLocators.EMAIL_INPUT)
-    username_el = driver.find_element(By.XPATH, RegisterLocators.USERNAME_INPUT)
-    password_el = driver.find_element(By.XPATH, RegisterLocators.PASSWORD_INPUT)
-    submit_el = driver.find_element(By.XPATH, RegisterLocators.SUBMIT_BUTTON)
+def get_register_form_elements(driver, email_el):
+    username_el = LOCATORS.find(driver, "register_username_input", 5)
+    password_el = LOCATORS.find(driver, "register_password_input", 5)
+    submit_el = LOCATORS.find(driver, "register_submit", 5)
     return email_el, username_el, password_el, submit_el
 
 
 def generate_valid_credentials():
-    """Her çağrıda oldukça unique email/username üretmeye çalışır."""
-    now_ms = int(time.time() * 1000)
-    rand = random.randint(1000, 9999)
-    base = f"{now_ms}{rand}"
-    suffix = base[-6:]
+    """Paralel job'lar arasında çakışmayan email/username üretir (node öneki + sayaç)."""
+    suffix = next_id()
 
     email = f"autotest{suffix}@example.com"
     username = f"autouser{suffix}"
@@ -96,30 +138,43 @@ def generate_valid_credentials():
 
 def register_new_user(driver, wait: WebDriverWait):
     """Yeni kullanıcı oluşturur ve başarılı kayıt sonrası modalın kapanmasını bekler."""
-    print("DEBUG | Starting positive registration flow...")
-    open_register_modal(driver, wait)
-    email_el, username_el, password_el, submit_el = get_register_form_elements(driver)
+    log.debug("Starting positive registration flow...")
+    email_el = open_register_modal(driver, wait)
 
     email, username, password = generate_valid_credentials()
-    print(f"DEBUG | Registering user: {email} | {username}")
+    log.debug("Registering user: %s | %s", email, username)
+
+    if FAST_FORMS:
+        fill_form(
+            driver,
+            LOCATORS,
+            {
+                "register_email_input": email,
+                "register_username_input": username,
+                "register_password_input": password,
+            },
+            clicks=["register_submit"],
+        )
+    else:
+        email_el, username_el, password_el, submit_el = get_register_form_elements(driver, email_el)
 
-    email_el.clear()
-    human_delay()
-    type_slow(email_el, email)
+        email_el.clear()
+        human_delay()
+        type_slow(email_el, email)
 
-    human_delay()
-    username_el.clear()
-    human_delay()
-    type_slow(username_el, username)
+        human_delay()
+        username_el.clear()
+        human_delay()
+        type_slow(username_el, username)
 
-    human_delay()
-    password_el.clear()
-    human_delay()
-    type_slow(password_el, password)
+        human_delay()
+        password_el.clear()
+        human_delay()
+        type_slow(password_el, password)
 
-    human_delay()
-    submit_el.click()
-    print("DEBUG | Register submit clicked, waiting for modal to disappear...")
+        human_delay()
+        submit_el.click()
+    log.debug("Register submit clicked, waiting for modal to disappear...")
 
     try:
         WebDriverWait(driver, 40).until(
@@ -127,10 +182,10 @@ def register_new_user(driver, wait: WebDriverWait):
                 (By.XPATH, RegisterLocators.REGISTER_MODAL_FORM)
             )
         )
-        print("DEBUG | Registration modal closed, registration assumed successful.")
+        log.debug("Registration modal closed, registration assumed successful.")
     except TimeoutException:
-        print(
-            "WARN  | Registration modal did not disappear within 40s. "
+        log.warning(
+            "Registration modal did not disappear within 40s. "
             "Continuing anyway (assuming registration succeeded)."
         )
 
@@ -140,69 +195,114 @@ def register_new_user(driver, wait: WebDriverWait):
 # -------------------- LOGIN FLOW (opsiyonel) --------------------
 
 
+class LoginRejected(Exception):
+    """Site kimlik bilgilerini reddetti (login modalında hata mesajı çıktı); timeout'lar bu değil."""
+
+
+def _visible_login_error(driver) -> str | None:
+    error_el = LOCATORS.find_now(driver, "login_error")
+    try:
+        if error_el is not None and error_el.is_displayed():
+            return error_el.text.strip() or "login rejected"
+    except StaleElementReferenceException:
+        pass
+    return None
+
+
 def login_if_login_button_visible(
     driver, wait: WebDriverWait, username: str, password: str
 ) -> None:
     """
     Header'da login butonu varsa login yapar.
-    Yoksa zaten login kabul eder.
+    Yoksa zaten login kabul eder. Site hata mesajı gösterirse LoginRejected fırlatır.
     """
-    print("DEBUG | Checking if login button is visible...")
+    log.debug("Checking if login button is visible...")
 
     try:
-        login_btn = wait.until(
-            EC.element_to_be_clickable((By.XPATH, LoginLocators.LOGIN_BUTTON_HEADER))
-        )
+        login_btn = LOCATORS.find(driver, "login_button_header", LOCATOR_TIMEOUT, clickable=True)
     except TimeoutException:
-        print("DEBUG | Login button not found; assuming already logged in. Skipping login.")
+        log.debug("Login button not found; assuming already logged in. Skipping login.")
         return
 
     human_delay()
     login_btn.click()
 
-    wait.until(EC.presence_of_element_located((By.XPATH, LoginLocators.USERNAME_INPUT)))
-    print("DEBUG | Login modal is visible.")
+    username_el = LOCATORS.find(driver, "login_username_input", LOCATOR_TIMEOUT)
+    log.debug("Login modal is visible.")
     human_delay()
 
-    username_el = driver.find_element(By.XPATH, LoginLocators.USERNAME_INPUT)
-    password_el = driver.find_element(By.XPATH, LoginLocators.PASSWORD_INPUT)
-    submit_el = driver.find_element(By.XPATH, LoginLocators.LOGIN_SUBMIT_BUTTON)
+    if FAST_FORMS:
+        fill_form(
+            driver,
+            LOCATORS,
+            {"login_username_input": username, "login_password_input": password},
+            clicks=["login_submit"],
+        )
+    else:
+        password_el = LOCATORS.find(driver, "login_password_input", 5)
+        submit_el = LOCATORS.find(driver, "login_submit", 5)
 
-    username_el.clear()
-    human_delay()
-    type_slow(username_el, username)
+        username_el.clear()
+        human_delay()
+        type_slow(username_el, username)
 
-    human_delay()
-    password_el.clear()
-    human_delay()
-    type_slow(password_el, password)
+        human_delay()
+        password_el.clear()
+        human_delay()
+        type_slow(password_el, password)
 
-    human_delay()
-    submit_el.click()
-    print("DEBUG | Login submit clicked, waiting for modal to disappear...")
+        human_delay()
+        submit_el.click()
+    log.debug("Login submit clicked, waiting for modal to disappear...")
 
-    wait.until(EC.invisibility_of_element_located((By.XPATH, LoginLocators.LOGIN_MODAL_FORM)))
-    print("DEBUG | Login completed (modal closed).")
+    modal_closed = EC.invisibility_of_element_located((By.XPATH, LoginLocators.LOGIN_MODAL_FORM))
 
+    def _login_done(d):
+        if modal_closed(d):
+            return True
+        # Reddedilen login'de modal kapanmaz; timeout'u beklemeden hatayı ayırt et
+        error = _visible_login_error(d)
+        if error:
+            raise LoginRejected(f"{username}: {error}")
+        return False
 
-# -------------------- NICKNAME HELPERS --------------------
+    wait.until(_login_done)
+    log.debug("Login completed (modal closed).")
 
 
-def _with_each_context(driver):
-    """default_content + tüm iframe context'lerini dolaşmak için küçük helper"""
-    driver.switch_to.default_content()
-    yield "default"
+def restore_saved_session(driver, username: str) -> bool:
+    """
+    Hesabın kayıtlı oturum snapshot'ını yükler.
+    Sayfa yenilendikten sonra header'da hâlâ login butonu varsa oturum geçersiz sayılır.
+    """
+    if not restore_session(driver, username):
+        return False
 
-    frames = driver.find_elements(By.TAG_NAME, "iframe")
-    for idx, frame in enumerate(frames):
-        driver.switch_to.default_content()
-        try:
-            driver.switch_to.frame(frame)
-            yield f"iframe[{idx}]"
-        except Exception:
-            continue
+    try:
+        LOCATORS.find(driver, "banner_101", LOCATOR_TIMEOUT)
+    except TimeoutException:
+        log.warning("%s: Page did not render after restoring session.", username)
+        return False
 
-    driver.switch_to.default_content()
+    if LOCATORS.find_now(driver, "login_button_header") is not None:
+        log.debug("%s: Saved session is no longer valid; falling back to login.", username)
+        discard_session(username)
+        return False
+
+    log.debug("%s: Restored saved session, skipping login.", username)
+    return True
+
+
+# -------------------- NICKNAME HELPERS --------------------
+
+
+def _with_each_context(player: Player, exclusive: bool = False):
+    """
+    default_content + tüm iframe context'lerini dolaşmak için küçük helper.
+    Oyuncunun frame cache'inde 101 uygulamasının yeri biliniyorsa önce orası,
+    exclusive=True ise sadece orası denenir.
+    """
+    yield from iter_contexts(player.driver, player.frames, APP_FRAME_KEY, exclusive)
 
 
 def _handle_table_nickname(player: Player) -> None:
@@ -211,14 +311,14 @@ def _handle_table_nickname(player: Player) -> None:
     NoSuchElement/Stale durumlarına karşı retry içerir.
     """
     driver = player.driver
-    print(f"DEBUG | {player.role}: Checking for table nickname popup...")
+    log.debug("%s: Checking for table nickname popup...", player.role)
 
     input_locator = (By.XPATH, TABLE_NICKNAME_INPUT_XPATH)
     button_locator = (By.XPATH, TABLE_NICKNAME_SUBMIT_XPATH)
 
     # popup bazen render/destroy olduğu için az sayıda deneme
     for attempt in range(3):
-        for ctx in _with_each_context(driver):
+        for ctx in _with_each_context(player, exclusive=True):
             try:
                 # input görünür mü?
                 nickname_el = WebDriverWait(driver, 2).until(
@@ -244,7 +344,8 @@ def _handle_table_nickname(player: Player) -> None:
                 WebDriverWait(driver, 10).until(
                     EC.invisibility_of_element_located(input_locator)
                 )
-                print(f"DEBUG | {player.role}: Table nickname popup closed.")
+                log.debug("%s: Table nickname popup closed.", player.role)
+                player.frames.remember(APP_FRAME_KEY, ctx)
                 driver.switch_to.default_content()
                 return
 
@@ -273,13 +374,13 @@ def _handle_lobby_nickname(player: Player) -> None:
         return
 
     driver = player.driver
-    print(f"DEBUG | {player.role}: Checking for lobby nickname popup...")
+    log.debug("%s: Checking for lobby nickname popup...", player.role)
 
     input_locator = (By.XPATH, lobby_input_xpath)
     button_locator = (By.XPATH, lobby_btn_xpath)
 
     for attempt in range(3):
-        for _ctx in _with_each_context(driver):
+        for ctx in _with_each_context(player, exclusive=True):
             try:
                 nickname_el = WebDriverWait(driver, 2).until(
                     EC.visibility_of_element_located(input_locator)
@@ -302,7 +403,8 @@ def _handle_lobby_nickname(player: Player) -> None:
                 WebDriverWait(driver, 10).until(
                     EC.invisibility_of_element_located(input_locator)
                 )
-                print(f"DEBUG | {player.role}: Lobby nickname popup closed.")
+                log.debug("%s: Lobby nickname popup closed.", player.role)
+                player.frames.remember(APP_FRAME_KEY, ctx)
                 driver.switch_to.default_content()
                 return
 
@@ -322,47 +424,36 @@ def _handle_lobby_nickname(player: Player) -> None:
 def go_to_101_lobby(player: Player) -> None:
     """Her oyuncu için 101 banner'a tıklayıp lobiye gir."""
     driver, wait = player.driver, player.wait
-    print(f"DEBUG | {player.role}: Navigating to 101 lobby...")
+    log.debug("%s: Navigating to 101 lobby...", player.role)
     human_delay()
 
-    banner = wait.until(EC.element_to_be_clickable((By.XPATH, Okey101Locators.BANNER_101)))
+    banner = LOCATORS.find(driver, "banner_101", LOCATOR_TIMEOUT, clickable=True)
     banner.click()
-    print(f"DEBUG | {player.role}: 101 banner clicked, waiting for lobby...")
+    log.debug("%s: 101 banner clicked, waiting for lobby...", player.role)
 
+    # Navigasyon oldu; eski frame bilgileri geçersiz
+    player.frames.invalidate()
     driver.switch_to.default_content()
 
     # Eğer lobi nickname popup varsa burada handle et (varsa)
     _handle_lobby_nickname(player)
 
-    # Lobi görünür mü? (default ya da iframe)
-    try:
-        wait.until(EC.presence_of_element_located((By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON)))
-        print(f"DEBUG | {player.role}: 101 lobby visible in default content.")
-        human_delay()
-        return
-    except TimeoutException:
-        print(
-            f"DEBUG | {player.role}: CREATE_TABLE_BUTTON not in default content. "
-            "Trying iframes..."
-        )
-
-    frames = driver.find_elements(By.TAG_NAME, "iframe")
-    print(f"DEBUG | {player.role}: Found {len(frames)} iframe(s).")
-
-    for idx, frame in enumerate(frames):
+    # Lobi görünür mü? Önce cache'teki context (popup'tan öğrenildiyse), sonra default ve iframe'ler.
+    # İlk denenen context'e tam wait süresi, diğerlerine 10s verilir.
+    locator = (By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON)
+    for attempt_idx, ctx in enumerate(_with_each_context(player)):
+        ctx_wait = wait if attempt_idx == 0 else WebDriverWait(driver, 10)
         try:
-            driver.switch_to.default_content()
-            driver.switch_to.frame(frame)
-            frame_wait = WebDriverWait(driver, 10)
-            frame_wait.until(
-                EC.presence_of_element_located((By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON))
-            )
-            print(f"DEBUG | {player.role}: 101 lobby found in iframe index {idx}.")
-            human_delay()
-            return
+            ctx_wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
+            log.debug("%s: CREATE_TABLE_BUTTON not in context %s.", player.role, ctx)
             continue
 
+        player.frames.remember(APP_FRAME_KEY, ctx)
+        log.debug("%s: 101 lobby visible in context %s.", player.role, ctx)
+        human_delay()
+        return
+
     driver.switch_to.default_content()
     raise TimeoutException("CREATE_TABLE_BUTTON could not be found in default content or any iframe.")
 
@@ -372,22 +463,13 @@ def is_101_lobby_visible(player: Player, short_timeout: float = 2.0) -> bool:
     driver = player.driver
     locator = (By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON)
 
-    driver.switch_to.default_content()
-    try:
-        WebDriverWait(driver, short_timeout).until(EC.presence_of_element_located(locator))
-        return True
-    except TimeoutException:
-        pass
-
-    frames = driver.find_elements(By.TAG_NAME, "iframe")
-    for frame in frames:
+    for ctx in _with_each_context(player):
         try:
-            driver.switch_to.default_content()
-            driver.switch_to.frame(frame)
             WebDriverWait(driver, short_timeout).until(EC.presence_of_element_located(locator))
-            return True
         except TimeoutException:
             continue
+        player.frames.remember(APP_FRAME_KEY, ctx)
+        return True
 
     driver.switch_to.default_content()
     return False
@@ -402,63 +484,70 @@ def _table_row_xpath(table_name: str) -> str:
 
 
 def generate_table_name() -> str:
-    """Masa adı için oldukça benzersiz bir suffix üretir."""
-    now_ms = int(time.time() * 1000)
-    rand = random.randint(100, 999)
-    suffix = f"{now_ms}{rand}"[-8:]
-    return f"auto_table_{suffix}"
+    """Paralel job'lar arasında çakışmayan masa adı üretir."""
+    return f"auto_table_{next_id()}"
 
 
-def host_create_table(host: Player, total_players: int) -> str:
+def host_create_table(host: Player, total_players: int, table_name: str | None = None) -> str:
     """
     Host 101 lobisinde masa oluşturur.
     total_players = 2 veya 4 (1 host + 1/3 guest).
+    table_name verilmezse yeni bir ad üretilir.
     Dönen değer: host'un input'a yazdığı masa adı.
     """
     driver, wait = host.driver, host.wait
-    print(f"DEBUG | {host.role}: Creating table for {total_players} players...")
-    human_delay()
+    log.debug("%s: Creating table for %s players...", host.role, total_players)
 
-    create_btn = wait.until(EC.element_to_be_clickable((By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON)))
-    create_btn.click()
+    if total_players == 2:
+        player_count_name = "player_count_2"
+    elif total_players == 4:
+        player_count_name = "player_count_4"
+    else:
+        raise ValueError(f"Unsupported total_players value: {total_players}")
 
-    wait.until(EC.presence_of_element_located((By.XPATH, Okey101Locators.TABLE_NAME_INPUT)))
-    print("DEBUG | Table creation modal is visible.")
     human_delay()
 
-    table_name_el = driver.find_element(By.XPATH, Okey101Locators.TABLE_NAME_INPUT)
-    bet_amount_el = driver.find_element(By.XPATH, Okey101Locators.BET_AMOUNT_INPUT)
+    create_btn = LOCATORS.find(driver, "create_table_button", LOCATOR_TIMEOUT, clickable=True)
+    create_btn.click()
 
-    table_name = generate_table_name()
-    table_name_el.clear()
+    table_name_el = LOCATORS.find(driver, "table_name_input", LOCATOR_TIMEOUT)
+    log.debug("Table creation modal is visible.")
     human_delay()
-    type_slow(table_name_el, table_name)
 
-    human_delay()
-    bet_amount_el.clear()
-    human_delay()
-    type_slow(bet_amount_el, "10")
+    table_name = table_name or generate_table_name()
+    log.debug("Selecting %s-player table.", total_players)
 
-    human_delay()
-    if total_players == 2:
-        player_count_el = driver.find_element(By.XPATH, Okey101Locators.PLAYER_COUNT_2)
-        print("DEBUG | Selecting 2-player table.")
-    elif total_players == 4:
-        player_count_el = driver.find_element(By.XPATH, Okey101Locators.PLAYER_COUNT_4)
-        print("DEBUG | Selecting 4-player table.")
+    if FAST_FORMS:
+        fill_form(
+            driver,
+            LOCATORS,
+            {"table_name_input": table_name, "bet_amount_input": "10"},
+            clicks=[player_count_name, "create_table_submit"],
+        )
     else:
-        raise ValueError(f"Unsupported total_players value: {total_players}")
+        bet_amount_el = LOCATORS.find(driver, "bet_amount_input", 5)
 
-    human_delay()
-    player_count_el.click()
+        table_name_el.clear()
+        human_delay()
+        type_slow(table_name_el, table_name)
 
-    human_delay()
-    submit_el = driver.find_element(By.XPATH, Okey101Locators.CREATE_TABLE_SUBMIT_BUTTON)
-    submit_el.click()
-    print("DEBUG | Masa Oluştur submit clicked, waiting for modal to close...")
+        human_delay()
+        bet_amount_el.clear()
+        human_delay()
+        type_slow(bet_amount_el, "10")
+
+        human_delay()
+        player_count_el = LOCATORS.find(driver, player_count_name, 5)
+        human_delay()
+        player_count_el.click()
+
+        human_delay()
+        submit_el = LOCATORS.find(driver, "create_table_submit", 5)
+        submit_el.click()
+    log.debug("Masa Oluştur submit clicked, waiting for modal to close...")
 
     wait.until(EC.invisibility_of_element_located((By.XPATH, Okey101Locators.TABLE_NAME_INPUT)))
-    print("DEBUG | Table creation modal closed; host has entered the table view.")
+    log.debug("Table creation modal closed; host has entered the table view.")
 
     return table_name
 
@@ -466,71 +555,317 @@ def host_create_table(host: Player, total_players: int) -> str:
 # -------------------- GUEST JOIN TABLE --------------------
 
 
-def guest_join_table(guest: Player, table_name: str) -> None:
-    """Guest belirtilen masa adına sahip masaya 'Sit/Otur' ile katılır."""
+class TableNotVisible(TimeoutException):
+    """Masa guest'in lobisine hiç düşmedi; sorun host tarafında, guest'i değiştirmek işe yaramaz."""
+
+
+def guest_join_table(guest: Player, table_name: str, join_btn=None) -> None:
+    """
+    Guest belirtilen masa adına sahip masaya 'Sit/Otur' ile katılır.
+    join_btn verilmişse (lobi indeksinden) doğrudan ona tıklanır, XPath taraması yapılmaz.
+    """
     driver, wait = guest.driver, guest.wait
-    print(f"DEBUG | {guest.role}: Joining table '{table_name}'...")
+    log.debug("%s: Joining table '%s'...", guest.role, table_name)
     human_delay()
 
     row_xpath = _table_row_xpath(table_name)
-    wait.until(EC.presence_of_element_located((By.XPATH, row_xpath)))
-
     join_btn_xpath = f"{row_xpath}//td[last()]//button"
-    join_btn = wait.until(EC.element_to_be_clickable((By.XPATH, join_btn_xpath)))
+    if join_btn is None:
+        wait.until(EC.presence_of_element_located((By.XPATH, row_xpath)))
+        join_btn = wait.until(EC.element_to_be_clickable((By.XPATH, join_btn_xpath)))
 
     human_delay()
-    join_btn.click()
-    print(f"DEBUG | {guest.role}: Clicked join button for table '{table_name}'.")
+    try:
+        join_btn.click()
+    except StaleElementReferenceException:
+        # Satır bu arada yeniden çizildiyse XPath ile tekrar bul
+        join_btn = wait.until(EC.element_to_be_clickable((By.XPATH, join_btn_xpath)))
+        join_btn.click()
+    log.debug("%s: Clicked join button for table '%s'.", guest.role, table_name)
+
+
+def wait_for_table_row(guest: Player, table_name: str, timeout: float = TABLE_READY_TIMEOUT):
+    """
+    Masa satırı guest'in kendi lobisinde görünene kadar bekler (sabit sleep yerine).
+    Önce sayfa içi lobi indeksi (ad -> satır, sayfalama/sanal liste dahil),
+    script çalışmazsa klasik WebDriverWait. Dönen değer: katıl butonu ya da None.
+    """
+    driver = guest.driver
+    try:
+        app_ctx = guest.frames.get(APP_FRAME_KEY)
+        switch_to_context(driver, DEFAULT_CONTEXT if app_ctx is None else app_ctx)
+        return locate_table(driver, table_name, timeout)
+    except WebDriverException as exc:
+        guest.frames.invalidate(APP_FRAME_KEY)
+        log.debug("%s: Lobby index failed (%s); polling for table row.", guest.role, exc.__class__.__name__)
+
+    join_btn_xpath = f"{_table_row_xpath(table_name)}//td[last()]//button"
+    try:
+        return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, join_btn_xpath)))
+    except TimeoutException:
+        return None
+
+
+def seat_guest(guest: Player, table_name: str) -> None:
+    """Masa satırı guest'in kendi lobisinde görünür görünmez katılır ve nickname popup'ını doldurur."""
+    join_btn = wait_for_table_row(guest, table_name)
+    if join_btn is None:
+        raise TableNotVisible(
+            f"Table '{table_name}' did not appear in {guest.role}'s lobby "
+            f"within {TABLE_READY_TIMEOUT:.0f}s"
+        )
+    guest_join_table(guest, table_name, join_btn=join_btn)
+    try:
+        release_index(guest.driver)
+    except WebDriverException:
+        pass
+    _handle_table_nickname(guest)
+
+
+def seat_guests_concurrently(guests, table_name: str, table_id: str | None = None, seat=None) -> dict:
+    """
+    Guest'leri paralel oturtur; guest'ler birbirini beklemez.
+    seat(guest) verilirse (run_table'ın retry'lı sürümü) seat_guest yerine o çağrılır.
+    Dönen değer: rol -> None (oturdu) ya da exception.
+    """
+    def run(guest: Player) -> None:
+        with log_context(table=table_id, player=guest.role):
+            if seat is not None:
+                seat(guest)
+                return
+            with timing.phase("guest_join_table", table=table_id, player=guest.role):
+                seat_guest(guest, table_name)
+
+    results = {}
+    if not guests:
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(guests), thread_name_prefix="seat") as pool:
+        futures = {pool.submit(run, g): g.role for g in guests}
+        for future in as_completed(futures):
+            role = futures[future]
+            try:
+                future.result()
+                results[role] = None
+                log.debug("%s: Seated at '%s'.", role, table_name)
+            except Exception as exc:
+                log.error("%s: Could not join table '%s': %r", role, table_name, exc)
+                results[role] = exc
+
+    return {g.role: results[g.role] for g in guests}
 
 
 # -------------------- GAME END WAIT --------------------
 
 
-def wait_for_game_end(host: Player, poll_interval: int = 10, max_wait_minutes: int = 40) -> None:
-    """Host'un tekrar 101 lobisine dönmesini bekler."""
-    print("INFO | Game is now running.")
-    print("INFO | Waiting for host to return to 101 lobby to end the script...")
+def wait_for_game_end(
+    host: Player,
+    poll_interval: int = 10,
+    max_wait_minutes: int = 40,
+    event_chunk_seconds: int = 10,
+    stop_event=None,
+) -> None:
+    """
+    Host'un tekrar 101 lobisine dönmesini bekler.
+    Önce sayfaya MutationObserver enjekte edip lobi butonu DOM'a düştüğü anda döner
+    (event_chunk_seconds'ta bir tek WebDriver çağrısı). Script çalıştırılamazsa
+    eski poll_interval'lı kontrole düşer. stop_event set edilirse beklemeyi bırakır.
+    """
+    log.info("Game is now running.")
+    log.info("Waiting for host to return to 101 lobby to end the script...")
 
+    driver = host.driver
     start = time.time()
-    while True:
+    deadline = start + max_wait_minutes * 60
+    event_failures = 0
+
+    while time.time() < deadline:
+        if stop_event is not None and stop_event.is_set():
+            log.info("Stop requested; no longer waiting for game end.")
+            return
+
+        if event_failures < 3:
+            chunk = min(event_chunk_seconds, max(1.0, deadline - time.time()))
+            try:
+                # Observer'ı 101 uygulamasının bilinen context'inde kur
+                app_ctx = host.frames.get(APP_FRAME_KEY)
+                switch_to_context(driver, DEFAULT_CONTEXT if app_ctx is None else app_ctx)
+                if wait_for_xpath_event(driver, Okey101Locators.CREATE_TABLE_BUTTON, chunk):
+                    log.info("Host is back in 101 lobby. Game assumed finished.")
+                    return
+                event_failures = 0
+                log.debug(
+                    "Game still running after %.1f min (lobby observer armed).",
+                    (time.time() - start) / 60.0,
+                )
+                continue
+            except WebDriverException as exc:
+                # Sayfa/iframe yeniden yüklendiyse observer düşer; bir kez klasik kontrol yap
+                event_failures += 1
+                host.frames.invalidate(APP_FRAME_KEY)
+                log.debug("Lobby observer interrupted (%s); re-checking.", exc.__class__.__name__)
+
         if is_101_lobby_visible(host, short_timeout=2.0):
-            print("INFO | Host is back in 101 lobby. Game assumed finished.")
-            break
-
-        elapsed_min = (time.time() - start) / 60.0
-        if elapsed_min > max_wait_minutes:
-            print(
-                f"WARN | Waited {max_wait_minutes} minutes, lobby not detected. "
-                "Stopping script anyway."
-            )
-            break
+            log.info("Host is back in 101 lobby. Game assumed finished.")
+            return
 
-        print(
-            f"DEBUG | Game still running (lobby not visible). "
-            f"Sleeping {poll_interval} seconds..."
-        )
-        time.sleep(poll_interval)
+        if event_failures >= 3:
+            log.debug("Game still running (lobby not visible). Sleeping %s seconds...", poll_interval)
+            if stop_event is not None:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+
+    log.warning("Waited %s minutes, lobby not detected. Stopping script anyway.", max_wait_minutes)
 
 
 # -------------------- PLAYER CREATION --------------------
 
 
-def create_player(role: str) -> Player:
-    driver, wait = open_browser()
-    print(f"DEBUG | Creating player for role={role}")
+def _lease_owner(role: str) -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{role}"
 
-    email, username, password = register_new_user(driver, wait)
-    login_if_login_button_visible(driver, wait, username, password)
 
-    print(f"DEBUG | {role} ready as {username}")
-    return Player(
-        role=role,
-        driver=driver,
-        wait=wait,
-        email=email,
-        username=username,
-        password=password,
-    )
+def create_player(role: str, account_mode: str = ACCOUNT_MODE, table_id: str | None = None) -> Player:
+    with log_context(table=table_id, player=role):
+        with timing.phase("open_browser", table=table_id, player=role):
+            driver, wait = acquire_browser()
+        log.debug("Creating player for role=%s (account mode: %s)", role, account_mode)
+
+        monitor = get_monitor() if table_id else None
+        if monitor is not None:
+            monitor.register(table_id, role, driver)
+
+        pool = AccountPool() if account_mode == "pool" else None
+        account = None
+        login_failed = False
+        try:
+            if pool is not None:
+                account = pool.lease(_lease_owner(role))
+                if account is None:
+                    log.warning("%s: Account pool is empty; registering a fresh account.", role)
+
+            restored = False
+            if account is None:
+                with timing.phase("register_new_user", table=table_id, player=role):
+                    email, username, password = register_new_user(driver, wait)
+                if pool is not None:
+                    # Havuz boştu; yeni hesabı kiralı olarak ekle ki iş bitince havuza dönsün
+                    account = Account(email=email, username=username, password=password)
+                    pool.add(account, leased_by=_lease_owner(role))
+            else:
+                email, username, password = account.email, account.username, account.password
+                log.debug("%s: Leased pooled account %s", role, username)
+                if SESSION_SNAPSHOTS:
+                    with timing.phase("restore_session", table=table_id, player=role):
+                        restored = restore_saved_session(driver, username)
+
+            if not restored:
+                try:
+                    with timing.phase("login", table=table_id, player=role):
+                        login_if_login_button_visible(driver, wait, username, password)
+                except LoginRejected:
+                    # Sadece sitenin reddettiği login'ler sayılır; timeout/ağ hatası hesabın suçu değil
+                    login_failed = True
+                    raise
+                # Sadece havuz hesapları tekrar kullanılıyor; onların oturumunu sakla
+                if SESSION_SNAPSHOTS and account is not None:
+                    try:
+                        save_session(driver, username)
+                    except Exception as exc:
+                        log.warning("%s: Could not save session snapshot: %r", role, exc)
+        except Exception:
+            # Yarım kalan oyuncunun tarayıcısı açık kalmasın, hesabı da havuza dönsün
+            close_browser(driver)
+            if monitor is not None:
+                monitor.unregister(table_id, role)
+            if account is not None and login_failed:
+                # Yanlış şifre / banlı / hiç kaydolmamış hesap tekrar tekrar kiralanmasın
+                if pool.release_failed_login(account.username):
+                    log.warning(
+                        "%s: Account %s marked broken after repeated login failures.",
+                        role,
+                        account.username,
+                    )
+            elif account is not None:
+                pool.release(account.username)
+            raise
+
+        log.debug("%s ready as %s", role, username)
+        return Player(
+            role=role,
+            driver=driver,
+            wait=wait,
+            email=email,
+            username=username,
+            password=password,
+            leased=account is not None,
+            table_id=table_id,
+        )
+
+
+def record_network_stats(player: Player) -> None:
+    """NETWORK_STATS açıksa oyuncunun kurulum trafiğini bir kez kaydeder ve toplamayı durdurur."""
+    if not NETWORK_STATS or player.network_recorded:
+        return
+    player.network_recorded = True
+    try:
+        stats = finish_network_stats(player.driver)
+        timing.record("network", table=player.table_id, player=player.role, lean=LEAN_MODE, **stats)
+        log.debug(
+            "%s: %s request(s), %.0f KiB, %s blocked.",
+            player.role,
+            stats["requests"],
+            stats["bytes"] / 1024,
+            stats["blocked_requests"],
+        )
+    except Exception as exc:
+        log.warning("%s: Could not collect network stats: %r", player.role, exc)
+
+
+def release_player(player: Player) -> None:
+    """Oyuncunun tarayıcısını kapatır, kiralık hesabı varsa havuza iade eder."""
+    if getattr(player, "driver", None):
+        # Masa kurulum bitmeden düştüyse istatistik burada alınır
+        record_network_stats(player)
+        close_browser(player.driver)
+        log.debug("%s driver quit.", player.role)
+        monitor = get_monitor()
+        if monitor is not None and player.table_id:
+            monitor.unregister(player.table_id, player.role)
+    if player.leased:
+        AccountPool().release(player.username)
+
+
+def create_players_concurrently(
+    roles,
+    max_workers: int = SETUP_WORKERS,
+    account_mode: str = ACCOUNT_MODE,
+    table_id: str | None = None,
+):
+    """
+    Verilen roller için create_player'ı paralel (en fazla max_workers) çalıştırır.
+    Bir oyuncunun hatası diğerlerini durdurmaz.
+    Dönen değer: (players, errors) -> players rol sırasında, errors: rol -> exception.
+    """
+    workers = max(1, min(max_workers, len(roles)))
+    log.debug("Creating %s player(s) with %s parallel worker(s)...", len(roles), workers)
+
+    created = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="setup") as pool:
+        make_player = partial(create_player, account_mode=account_mode, table_id=table_id)
+        futures = {pool.submit(make_player, role): role for role in roles}
+        for future in as_completed(futures):
+            role = futures[future]
+            try:
+                created[role] = future.result()
+            except Exception as exc:
+                log.error("%s: player setup failed: %r", role, exc)
+                errors[role] = exc
+
+    players = [created[role] for role in roles if role in created]
+    return players, errors
 
 
 # -------------------- ARG PARSING --------------------
@@ -543,6 +878,19 @@ def parse_args():
         type=int,
         help="Number of guest players (must be 1 or 3). Total players = 1 host + guests.",
     )
+    parser.add_argument(
+        "--setup-workers",
+        type=int,
+        default=SETUP_WORKERS,
+        help="How many players to create in parallel (1 = serial). Default: SETUP_WORKERS env or 4.",
+    )
+    parser.add_argument(
+        "--account-mode",
+        choices=("register", "pool"),
+        default=ACCOUNT_MODE,
+        help="register = sign up fresh users via the UI; pool = lease pre-registered accounts "
+        "from ACCOUNT_POOL_DB and only log in. Default: ACCOUNT_MODE env or 'register'.",
+    )
     args = parser.parse_args()
 
     if args.guests is None:
@@ -562,61 +910,281 @@ def parse_args():
     return args
 
 
-# -------------------- MAIN --------------------
+# -------------------- TABLE SCENARIO --------------------
 
 
-def main():
-    args = parse_args()
-    guest_count = args.guests
-    total_players = 1 + guest_count
+class TableCancelled(Exception):
+    """run_table dışarıdan (cancel_event ile) durdurulduğunda fırlatılır."""
 
-    host = None
-    guests = []
 
-    try:
-        host = create_player("HOST")
+def _check_cancelled(cancel_event) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise TableCancelled("Table run cancelled.")
 
-        for i in range(guest_count):
-            role = "GUEST" if guest_count == 1 else f"GUEST_{i + 1}"
-            guests.append(create_player(role))
 
-        print("\n=== Player Summary ===")
-        print(f"HOST      : {host.username} ({host.email})")
-        for g in guests:
-            print(f"{g.role:9}: {g.username} ({g.email})")
-        print(f"Total players planned for table: {total_players}")
-        print("===============================\n")
+def _reset_to_home(player: Player) -> None:
+    """Oyuncuyu ana sayfaya döndürür (login cookie'de kalır); frame bilgileri geçersiz olur."""
+    player.driver.switch_to.default_content()
+    player.driver.get(BASE_URL)
+    player.frames.invalidate()
 
-        all_players = [host] + guests
-        for p in all_players:
-            go_to_101_lobby(p)
 
-        # Host masa açar
-        table_name = host_create_table(host, total_players)
-        print(f"DEBUG | Host created table '{table_name}'.")
+def _recover_player(
+    seats: dict,
+    checkpoint: TableCheckpoint,
+    role: str,
+    attempt: int,
+    policy: RetryPolicy,
+    account_mode: str,
+    table_id: str,
+    enter_lobby: bool = True,
+    allow_replace: bool = True,
+) -> None:
+    """
+    Başarısız bir fazdan sonra oyuncuyu toparlar: önce aynı tarayıcıyla ana sayfaya döner,
+    policy.should_replace(attempt) ise (ve allow_replace) tarayıcı ve hesap tamamen yenisiyle değiştirilir.
+    enter_lobby=True ise oyuncu tekrar 101 lobisine sokulur.
+    """
+    if allow_replace and policy.should_replace(attempt):
+        log.warning("%s: Replacing player after %s failed attempt(s).", role, attempt)
+        old = seats.pop(role, None)
+        if old is not None:
+            release_player(old)
+        seats[role] = create_player(role, account_mode=account_mode, table_id=table_id)
+        checkpoint.replaced(role)
+        checkpoint.done(role, "player_setup")
+    else:
+        _reset_to_home(seats[role])
+
+    if enter_lobby:
+        with timing.phase("go_to_101_lobby", table=table_id, player=role):
+            go_to_101_lobby(seats[role])
+        checkpoint.done(role, "go_to_101_lobby")
+
+
+def _run_step(
+    seats: dict,
+    checkpoint: TableCheckpoint,
+    role: str,
+    step: str,
+    action,
+    policy: RetryPolicy,
+    account_mode: str,
+    table_id: str,
+    cancel_event=None,
+):
+    """
+    action(player)'ı bir faz olarak çalıştırır. Hata olursa sadece bu oyuncu için
+    backoff + toparlama yapıp policy.retries kez daha dener; diğer oyunculara dokunmaz.
+    """
+    while True:
+        try:
+            with timing.phase(step, table=table_id, player=role):
+                result = action(seats[role])
+            checkpoint.done(role, step)
+            return result
+        except TableCancelled:
+            raise
+        except Exception as exc:
+            attempt = checkpoint.failed(role, step, exc)
+            if attempt > policy.retries:
+                raise
+            log.warning("%s: %s failed (%r); retry %s/%s.", role, step, exc, attempt, policy.retries)
+            # Masa hiç görünmediyse oyuncu sağlam; sadece lobiyi tazele
+            allow_replace = not isinstance(exc, TableNotVisible)
+
+        policy.backoff(attempt, cancel_event)
+        _check_cancelled(cancel_event)
+        try:
+            _recover_player(
+                seats,
+                checkpoint,
+                role,
+                attempt,
+                policy,
+                account_mode,
+                table_id,
+                enter_lobby=step != "go_to_101_lobby",
+                allow_replace=allow_replace,
+            )
+        except Exception as exc:
+            # Sonraki deneme büyük ihtimalle yine düşer ve hakkını tüketir
+            log.warning("%s: Recovery before retry failed: %r", role, exc)
+
+
+def _setup_players(
+    roles,
+    checkpoint: TableCheckpoint,
+    policy: RetryPolicy,
+    setup_workers: int,
+    account_mode: str,
+    table_id: str,
+    cancel_event=None,
+) -> dict:
+    """Tüm rolleri kurar; sadece kurulamayan roller backoff ile yeniden denenir."""
+    seats = {}
+    pending = list(roles)
+    attempt = 0
+    try:
+        while True:
+            players, errors = create_players_concurrently(
+                pending, setup_workers, account_mode=account_mode, table_id=table_id
+            )
+            for p in players:
+                seats[p.role] = p
+                checkpoint.done(p.role, "player_setup")
+            if not errors:
+                return {role: seats[role] for role in roles}
+
+            for role, exc in errors.items():
+                attempt = max(attempt, checkpoint.failed(role, "player_setup", exc))
+            if attempt > policy.retries:
+                raise RuntimeError(f"Player setup failed for: {', '.join(errors)}")
+
+            log.warning("Retrying setup for %s (retry %s/%s).", ', '.join(errors), attempt, policy.retries)
+            pending = list(errors)
+            policy.backoff(attempt, cancel_event)
+            _check_cancelled(cancel_event)
+    except BaseException:
+        for p in seats.values():
+            release_player(p)
+        raise
+
+
+def run_table(
+    guest_count: int,
+    setup_workers: int = SETUP_WORKERS,
+    account_mode: str = ACCOUNT_MODE,
+    cancel_event=None,
+    policy: RetryPolicy | None = None,
+) -> str:
+    """
+    Tek masalık senaryo: oyuncuları kur, lobiye gir, host masa açsın, guest'ler otursun,
+    oyun bitene kadar bekle. Dönen değer: masa adı.
+    Bir oyuncunun fazı düşerse sadece o oyuncu/faz policy'ye göre yeniden denenir
+    (gerekirse oyuncu yenisiyle değiştirilir); haklar bitince masa düşer.
+    cancel_event (threading.Event) set edilirse faz aralarında TableCancelled fırlatılır.
+    Hata ya da iptalde tüm tarayıcılar kapatılır.
+    """
+    policy = policy or RetryPolicy()
+    total_players = 1 + guest_count
+    table_id = next_id()
+    checkpoint = TableCheckpoint(table_id)
+    table_started = time.time()
+    table_name = None
+    error = None
 
-        # Host masa görünümünde nickname popup çıkarsa doldur
-        _handle_table_nickname(host)
+    seats = {}
+
+    with log_context(table=table_id):
+        try:
+            roles = ["HOST"]
+            for i in range(guest_count):
+                roles.append("GUEST" if guest_count == 1 else f"GUEST_{i + 1}")
+            guest_roles = roles[1:]
+
+            def step(role, name, action):
+                return _run_step(
+                    seats, checkpoint, role, name, action, policy, account_mode, table_id, cancel_event
+                )
 
-        time.sleep(3)
+            with timing.phase("player_setup", table=table_id):
+                seats.update(
+                    _setup_players(
+                        roles, checkpoint, policy, setup_workers, account_mode, table_id, cancel_event
+                    )
+                )
+            _check_cancelled(cancel_event)
+
+            log.info("=== Player Summary ===")
+            for role in roles:
+                p = seats[role]
+                log.info("%-9s: %s (%s)", role, p.username, p.email)
+            log.info("Total players planned for table: %s", total_players)
+
+            for role in roles:
+                step(role, "go_to_101_lobby", go_to_101_lobby)
+            _check_cancelled(cancel_event)
+
+            # Host masa açar; masa görünümünde nickname popup çıkarsa doldurur.
+            # Önceki deneme submit'ten sonra düştüyse masa sunucuda açılmış olabilir: yenisini açmadan
+            # önce lobide o adı ara, varsa host ona oturur (yetim masa bırakılmaz).
+            attempted_names = []
+
+            def create_table(host: Player) -> str:
+                if attempted_names:
+                    previous = attempted_names[-1]
+                    join_btn = wait_for_table_row(host, previous, timeout=TABLE_RECHECK_TIMEOUT)
+                    if join_btn is not None:
+                        log.info("Table '%s' was created by the failed attempt; host is rejoining it.", previous)
+                        guest_join_table(host, previous, join_btn=join_btn)
+                        try:
+                            release_index(host.driver)
+                        except WebDriverException:
+                            pass
+                        _handle_table_nickname(host)
+                        return previous
+
+                name = generate_table_name()
+                attempted_names.append(name)
+                host_create_table(host, total_players, table_name=name)
+                _handle_table_nickname(host)
+                return name
+
+            table_name = step("HOST", "host_create_table", create_table)
+            log.debug("Host created table '%s'.", table_name)
+            _check_cancelled(cancel_event)
+
+            # Guest'ler masa lobilerinde görünür görünmez paralel oturur; düşen guest tek başına yeniden dener
+            seat_results = seat_guests_concurrently(
+                [seats[role] for role in guest_roles],
+                table_name,
+                table_id=table_id,
+                seat=lambda g: step(g.role, "guest_join_table", lambda p: seat_guest(p, table_name)),
+            )
+            failed = [role for role, exc in seat_results.items() if exc is not None]
+            if failed:
+                raise RuntimeError(f"Guest seating failed for: {', '.join(failed)}")
+
+            log.debug("All guests joined the host table.")
+            # Kurulum trafiği ölçüldü; oyun boyunca performance log biriktirmesin
+            for p in seats.values():
+                record_network_stats(p)
+            _check_cancelled(cancel_event)
+
+            host = seats["HOST"]
+            with timing.phase("wait_for_game_end", table=table_id, player=host.role):
+                wait_for_game_end(host, poll_interval=10, max_wait_minutes=40, stop_event=cancel_event)
+            _check_cancelled(cancel_event)
+            return table_name
+
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+
+        finally:
+            for p in seats.values():
+                release_player(p)
+
+            timing.record(
+                "table",
+                table=table_id,
+                table_name=table_name,
+                players=total_players,
+                start=table_started,
+                duration=round(time.time() - table_started, 3),
+                ok=error is None,
+                error=error,
+                **checkpoint.summary(),
+            )
 
-        # Tüm guest'ler masaya oturur
-        for g in guests:
-            guest_join_table(g, table_name)
-            _handle_table_nickname(g)
 
-        print("DEBUG | All guests attempted to join the host table.")
+# -------------------- MAIN --------------------
 
-        wait_for_game_end(host, poll_interval=10, max_wait_minutes=40)
 
-    finally:
-        if host and getattr(host, "driver", None):
-            host.driver.quit()
-            print("DEBUG | HOST driver quit.")
-        for g in guests:
-            if getattr(g, "driver", None):
-                g.driver.quit()
-                print(f"DEBUG | {g.role} driver quit.")
+def main():
+    args = parse_args()
+    run_table(args.guests, setup_workers=args.setup_workers, account_mode=args.account_mode)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+# bench/check_pool_network.py
+"""
+Havuzdan aynı tarayıcıyı arka arkaya iki kez kiralayıp her kiralamada NETWORK_STATS
+istatistiğinin dolu geldiğini doğrular (ilk kiralamanın sonundaki Network.disable
+ikincisine taşınmamalı). Repo kökünden: python -m bench.check_pool_network
+"""
+import os
+import sys
+import argparse
+import threading
+import importlib
+
+from bench.fake_site import make_server
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Checks network stats across two pooled browser leases.")
+    parser.add_argument("--headed", action="store_true", help="Show the browser (default headless, CI=1).")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    server = make_server()
+    threading.Thread(target=server.serve_forever, name="fake-site", daemon=True).start()
+
+    # common modülleri bu değerleri import anında okuyor
+    os.environ["BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/"
+    os.environ["NETWORK_STATS"] = "1"
+    os.environ["LEAN_MODE"] = "0"
+    if not args.headed:
+        os.environ["CI"] = "1"
+
+    browser_pool = importlib.import_module("common.browser_pool")
+    from common.browser_utils import close_browser
+    from common.lean_mode import finish_network_stats
+
+    # Arka plan doldurma thread'i başlatılmıyor: ikinci kiralama ilk tarayıcıyı almalı
+    pool = browser_pool.BrowserPool(size=1, max_uses=2)
+    leases = []
+    try:
+        for lease in (1, 2):
+            driver, _ = pool.acquire()
+            stats = finish_network_stats(driver)
+            leases.append((id(driver), stats))
+            print(f"INFO | lease {lease}: {stats['requests']} request(s), {stats['bytes']} byte(s)")
+            close_browser(driver)
+    finally:
+        pool.shutdown()
+        server.shutdown()
+
+    if leases[0][0] != leases[1][0]:
+        print("FAIL | second lease did not reuse the pooled browser")
+        sys.exit(1)
+    if not all(stats["requests"] for _, stats in leases):
+        print("FAIL | a lease reported no network requests")
+        sys.exit(1)
+    print("OK   | both leases of the pooled browser recorded network stats")
+
+
+if __name__ == "__main__":
+    main()
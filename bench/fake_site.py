@@ -0,0 +1,462 @@
+# bench/fake_site.py
+"""
+DracoFusion 101 arayüzünün yerel taklidi (offline benchmark için).
+locators/okey101_locators.py'deki XPath'lerin beklediği DOM'u üretir:
+kayıt/giriş modalları, 101 banner'ı, lobi + masa listesi, masa oluşturma formu,
+nickname popup'ları ve `game_seconds` sonra biten bir oyun.
+"""
+import json
+import time
+import uuid
+import argparse
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_BANNER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="320" height="160">'
+    '<rect width="320" height="160" fill="#0a5"/>'
+    '<text x="160" y="95" font-size="48" text-anchor="middle" fill="#fff">101</text></svg>'
+)
+
+_INDEX_HTML = r"""<!doctype html>
+<html lang="tr">
+<head><meta charset="utf-8"><title>101 stand-in</title>
+<style>
+  body { font-family: sans-serif; margin: 0; }
+  section, form { padding: 12px; }
+  table { border-collapse: collapse; } td { border: 1px solid #ccc; padding: 4px 8px; }
+  img { width: 320px; height: 160px; display: block; }
+  #root > div > div:nth-child(2) > div { position: fixed; inset: 0; background: #fffe; }
+</style></head>
+<body><div id="root"></div>
+<script>
+var root = document.getElementById('root');
+var me = null;
+var pollTimer = null;
+
+function api(method, path, body) {
+  return fetch(path, {
+    method: method,
+    headers: {'Content-Type': 'application/json'},
+    body: body ? JSON.stringify(body) : undefined,
+    credentials: 'same-origin'
+  }).then(function (r) { return r.json().then(function (j) { j._status = r.status; return j; }); });
+}
+
+function esc(s) { return String(s).replace(/[&<>"']/g, function (c) { return '&#' + c.charCodeAt(0) + ';'; }); }
+
+function stopPolling() { if (pollTimer) { clearInterval(pollTimer); pollTimer = null; } }
+
+// ---------------- ANA SAYFA ----------------
+function renderHome() {
+  stopPolling();
+  var authNav = me
+    ? '<span>' + esc(me.username) + '</span>'
+    : '<button type="button" id="login-open">Giriş Yap</button><button type="button" id="register-open">Kayıt Ol</button>';
+  root.innerHTML =
+    '<main>' +
+      '<header><div><nav><span>DracoFusion</span></nav><nav>' + authNav + '</nav></div></header>' +
+      '<div>' +
+        '<div><h1>Oyunlar</h1></div>' +
+        '<div><div>' +
+          '<div>Popüler</div>' +
+          '<div><a href="/lobby"><img src="/static/101.svg" alt="101"></a><a href="#"><span>Okey</span></a></div>' +
+        '</div></div>' +
+      '</div>' +
+    '</main>' +
+    '<div></div>' +      // toast alanı (div[1])
+    '<div></div>';       // modal portal (div[2])
+  if (!me) {
+    document.getElementById('login-open').onclick = openLogin;
+    document.getElementById('register-open').onclick = openRegister;
+  }
+}
+
+function portal() { return root.children[2]; }
+
+function openRegister() {
+  portal().innerHTML =
+    '<div><section><div><form><div>' +
+      '<label>E-posta<input type="email"></label>' +
+      '<label>Kullanıcı adı<input type="text"></label>' +
+      '<label>Şifre<input type="password"></label>' +
+      '<button type="submit">Kayıt Ol</button>' +
+    '</div></form></div></section></div>';
+  var form = portal().querySelector('form');
+  form.onsubmit = function (e) {
+    e.preventDefault();
+    var inputs = form.querySelectorAll('input');
+    api('POST', '/api/register', {email: inputs[0].value, username: inputs[1].value, password: inputs[2].value})
+      .then(function (res) {
+        if (res._status !== 200) { return; }
+        portal().innerHTML = '';
+        me = res.user;
+        renderHome();
+      });
+  };
+}
+
+function openLogin() {
+  portal().innerHTML =
+    '<div><section><div><form>' +
+      '<div><label>Kullanıcı adı<input type="text"></label><label>Şifre<input type="password"></label></div>' +
+      '<button type="submit">Giriş Yap</button>' +
+    '</form></div></section></div>';
+  var form = portal().querySelector('form');
+  form.onsubmit = function (e) {
+    e.preventDefault();
+    var inputs = form.querySelectorAll('input');
+    api('POST', '/api/login', {username: inputs[0].value, password: inputs[1].value}).then(function (res) {
+      if (res._status !== 200) {
+        var error = form.querySelector('[role="alert"]') || form.appendChild(document.createElement('p'));
+        error.setAttribute('role', 'alert');
+        error.textContent = 'Kullanıcı adı veya şifre hatalı';
+        return;
+      }
+      me = res.user;
+      renderHome();
+    });
+  };
+}
+
+// ---------------- LOBİ ----------------
+function lobbyShell(content) {
+  root.innerHTML = '<div><div>' + content + '</div><div></div></div>';
+  return root.firstChild.children[1];   // overlay: //*[@id="root"]/div/div[2]
+}
+
+function renderLobby() {
+  stopPolling();
+  var overlay = lobbyShell(
+    '<h2>101 Lobi</h2>' +
+    '<button type="button" id="create-open"><div>Masa Oluştur</div></button>' +
+    '<table><thead><tr><th>Masa</th><th>Oyuncu</th><th></th></tr></thead><tbody></tbody></table>'
+  );
+  document.getElementById('create-open').onclick = function () { openCreateTable(overlay); };
+  if (!me.nickname) { openLobbyNickname(overlay); }
+  refreshTables();
+  pollTimer = setInterval(refreshTables, 1000);
+}
+
+function refreshTables() {
+  api('GET', '/api/tables').then(function (res) {
+    var tbody = root.querySelector('tbody');
+    if (!tbody) { return; }
+    var seen = {};
+    res.tables.forEach(function (t) {
+      seen[t.id] = true;
+      var row = tbody.querySelector('tr[data-id="' + t.id + '"]');
+      if (!row) {
+        // Satırlar yerinde güncellenir; mevcut elementler stale olmaz
+        row = document.createElement('tr');
+        row.setAttribute('data-id', t.id);
+        row.innerHTML = '<td>' + esc(t.name) + '</td><td></td><td><button type="button">Otur</button></td>';
+        row.querySelector('button').onclick = function () { joinTable(t.id); };
+        tbody.appendChild(row);
+      }
+      row.children[1].textContent = t.players + '/' + t.capacity;
+    });
+    Array.prototype.slice.call(tbody.children).forEach(function (row) {
+      if (!seen[row.getAttribute('data-id')]) { row.remove(); }
+    });
+  });
+}
+
+function openLobbyNickname(overlay) {
+  overlay.innerHTML =
+    '<div><div><form><label>Takma ad<input type="text"></label><nav><button type="submit">Kaydet</button></nav></form></div></div>';
+  var form = overlay.querySelector('form');
+  form.onsubmit = function (e) {
+    e.preventDefault();
+    api('POST', '/api/nickname', {nickname: form.querySelector('input').value}).then(function (res) {
+      me = res.user;
+      overlay.innerHTML = '';
+    });
+  };
+}
+
+function openCreateTable(overlay) {
+  overlay.innerHTML =
+    '<div><div><form>' +
+      '<label>Masa adı<input type="text"></label>' +
+      '<div><label>Bahis<input type="number"></label><label>Süre<input type="number" value="30"></label></div>' +
+      '<div><button type="button">TRY</button></div>' +
+      '<div><div>Oyuncu sayısı</div><div>' +
+        '<button type="button" data-count="2"><div>2</div></button>' +
+        '<button type="button" data-count="4"><div><div>4</div></div></button>' +
+      '</div></div>' +
+      '<nav><button type="button">Vazgeç</button><button type="submit"><div>Masa Oluştur</div></button></nav>' +
+    '</form></div></div>';
+  var form = overlay.querySelector('form');
+  var capacity = 4;
+  form.querySelectorAll('button[data-count]').forEach(function (b) {
+    b.onclick = function () { capacity = parseInt(b.getAttribute('data-count'), 10); };
+  });
+  form.querySelector('nav button').onclick = function () { overlay.innerHTML = ''; };
+  form.onsubmit = function (e) {
+    e.preventDefault();
+    var inputs = form.querySelectorAll('input');
+    api('POST', '/api/tables', {name: inputs[0].value, bet: inputs[1].value, capacity: capacity}).then(function (res) {
+      if (res._status === 200) { renderTable(); }
+    });
+  };
+}
+
+function joinTable(id) {
+  api('POST', '/api/tables/' + id + '/join', {}).then(function (res) {
+    if (res._status === 200) { renderTable(); }
+  });
+}
+
+// ---------------- MASA ----------------
+function renderTable() {
+  stopPolling();
+  var overlay = lobbyShell('<h2>Masa</h2><p id="status">Oyuncular bekleniyor...</p>');
+  overlay.innerHTML = '<div><form><input type="text" placeholder="Takma ad"><button type="submit">Otur</button></form></div>';
+  var form = overlay.querySelector('form');
+  form.onsubmit = function (e) {
+    e.preventDefault();
+    api('POST', '/api/nickname', {nickname: form.querySelector('input').value}).then(function (res) {
+      me = res.user;
+      overlay.innerHTML = '';
+    });
+  };
+  pollTimer = setInterval(function () {
+    api('GET', '/api/state').then(function (res) {
+      if (!res.table) { renderLobby(); return; }
+      var status = document.getElementById('status');
+      if (status) { status.textContent = res.table.status + ' (' + res.table.players + '/' + res.table.capacity + ')'; }
+    });
+  }, 1000);
+}
+
+// ---------------- ROUTER ----------------
+api('GET', '/api/me').then(function (res) {
+  me = res.user || null;
+  if (location.pathname === '/lobby') {
+    if (!me) { location.href = '/'; return; }
+    if (res.table) { renderTable(); } else { renderLobby(); }
+  } else {
+    renderHome();
+  }
+});
+</script>
+</body></html>
+"""
+
+
+class FakeState:
+    """Kullanıcılar, oturumlar ve masalar (bellekte, thread-safe)."""
+
+    def __init__(self, game_seconds: float, auto_login_after_register: bool):
+        self.game_seconds = game_seconds
+        self.auto_login_after_register = auto_login_after_register
+        self.users = {}
+        self.sessions = {}
+        self.tables = {}
+        self.seat_of = {}
+        self.lock = threading.Lock()
+
+    def _tick_locked(self) -> None:
+        now = time.time()
+        for table_id, t in list(self.tables.items()):
+            if t["status"] == "waiting" and len(t["players"]) >= t["capacity"]:
+                t["status"] = "playing"
+                t["ends_at"] = now + self.game_seconds
+            elif t["status"] == "playing" and now >= t["ends_at"]:
+                for username in t["players"]:
+                    self.seat_of.pop(username, None)
+                del self.tables[table_id]
+
+    def public_user(self, username):
+        if username is None:
+            return None
+        user = self.users[username]
+        return {"username": username, "nickname": user.get("nickname")}
+
+    def public_table(self, t):
+        return {
+            "id": t["id"],
+            "name": t["name"],
+            "players": len(t["players"]),
+            "capacity": t["capacity"],
+            "status": t["status"],
+        }
+
+
+class FakeSiteHandler(BaseHTTPRequestHandler):
+    state: FakeState = None
+    latency: float = 0.0
+
+    def log_message(self, fmt, *args):  # sessiz
+        pass
+
+    # ---------- yardımcılar ----------
+
+    def _session_user(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        sid = cookie.get("sid")
+        return self.state.sessions.get(sid.value) if sid else None
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _send(self, status: int, payload, content_type="application/json", cookie=None):
+        if self.latency:
+            time.sleep(self.latency)
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        if cookie:
+            self.send_header("Set-Cookie", f"sid={cookie}; Path=/; HttpOnly")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _login(self, username):
+        sid = uuid.uuid4().hex
+        self.state.sessions[sid] = username
+        return sid
+
+    # ---------- GET ----------
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        st = self.state
+
+        if path == "/static/101.svg":
+            return self._send(200, _BANNER_SVG.encode("utf-8"), "image/svg+xml")
+        if not path.startswith("/api/"):
+            return self._send(200, _INDEX_HTML.encode("utf-8"), "text/html; charset=utf-8")
+
+        with st.lock:
+            st._tick_locked()
+            username = self._session_user()
+
+            if path == "/api/me":
+                table_id = st.seat_of.get(username)
+                return self._send(200, {"user": st.public_user(username), "table": table_id})
+
+            if path == "/api/tables":
+                tables = [st.public_table(t) for t in st.tables.values() if t["status"] == "waiting"]
+                return self._send(200, {"tables": tables})
+
+            if path == "/api/state":
+                table = st.tables.get(st.seat_of.get(username))
+                return self._send(200, {"table": st.public_table(table) if table else None})
+
+        return self._send(404, {"error": "not found"})
+
+    # ---------- POST ----------
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        body = self._body()
+        st = self.state
+
+        with st.lock:
+            st._tick_locked()
+
+            if path == "/api/register":
+                username = body.get("username") or ""
+                if not username or username in st.users:
+                    return self._send(409, {"error": "username taken"})
+                st.users[username] = {"email": body.get("email"), "password": body.get("password")}
+                cookie = self._login(username) if st.auto_login_after_register else None
+                user = st.public_user(username) if cookie else None
+                return self._send(200, {"user": user}, cookie=cookie)
+
+            if path == "/api/login":
+                user = st.users.get(body.get("username"))
+                if not user or user["password"] != body.get("password"):
+                    return self._send(401, {"error": "bad credentials"})
+                return self._send(200, {"user": st.public_user(body["username"])}, cookie=self._login(body["username"]))
+
+            username = self._session_user()
+            if username is None:
+                return self._send(401, {"error": "login required"})
+
+            if path == "/api/nickname":
+                st.users[username]["nickname"] = body.get("nickname") or username
+                return self._send(200, {"user": st.public_user(username)})
+
+            if path == "/api/tables":
+                table_id = uuid.uuid4().hex[:8]
+                st.tables[table_id] = {
+                    "id": table_id,
+                    "name": body.get("name") or table_id,
+                    "capacity": int(body.get("capacity") or 4),
+                    "players": [username],
+                    "status": "waiting",
+                    "ends_at": None,
+                }
+                st.seat_of[username] = table_id
+                return self._send(200, {"table": st.public_table(st.tables[table_id])})
+
+            if path.startswith("/api/tables/") and path.endswith("/join"):
+                table = st.tables.get(path.split("/")[3])
+                if not table or table["status"] != "waiting":
+                    return self._send(409, {"error": "table not joinable"})
+                if username not in table["players"]:
+                    table["players"].append(username)
+                st.seat_of[username] = table["id"]
+                return self._send(200, {"table": st.public_table(table)})
+
+        return self._send(404, {"error": "not found"})
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    game_seconds: float = 30,
+    latency_ms: float = 0,
+    auto_login_after_register: bool = False,
+) -> ThreadingHTTPServer:
+    """Sunucuyu kurar (başlatmaz). port=0 => boş port; adres: server.server_address."""
+    handler = type(
+        "BoundFakeSiteHandler",
+        (FakeSiteHandler,),
+        {
+            "state": FakeState(game_seconds, auto_login_after_register),
+            "latency": latency_ms / 1000.0,
+        },
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local stand-in of the DracoFusion 101 UI.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--game-seconds", type=float, default=30, help="Game length once a table is full.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Artificial latency per response.")
+    parser.add_argument(
+        "--auto-login-after-register",
+        action="store_true",
+        help="Log the user in right after registration (default: user must log in).",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = make_server(args.host, args.port, args.game_seconds, args.latency_ms, args.auto_login_after_register)
+    print(f"INFO | 101 stand-in listening on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stand-in stopped by user.")
+
+
+if __name__ == "__main__":
+    main()
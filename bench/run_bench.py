@@ -0,0 +1,195 @@
+# bench/run_bench.py
+"""
+Yerel 101 taklidine karşı N masa koşturur ve kurulum gecikmesi, tables/hour
+ve process başına bellek raporlar. Repo kökünden: python -m bench.run_bench --tables 4
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+import importlib
+
+from bench.fake_site import make_server
+
+try:
+    import psutil
+except ImportError:  # opsiyonel; yoksa /proc okunur (Linux)
+    psutil = None
+
+
+def _descendant_rss_linux(root_pid: int) -> dict:
+    """/proc üzerinden root_pid ve tüm alt process'lerin RSS'i (MB)."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as fh:
+                stat = fh.read()
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    rss = {}
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.startswith("VmRSS:"):
+                        rss[pid] = int(line.split()[1]) / 1024.0
+                        break
+        except OSError:
+            continue
+    return rss
+
+
+def _descendant_rss(root_pid: int) -> dict:
+    if psutil is None:
+        return _descendant_rss_linux(root_pid)
+
+    rss = {}
+    try:
+        root = psutil.Process(root_pid)
+        procs = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return rss
+    for proc in procs:
+        try:
+            rss[proc.pid] = proc.memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            continue
+    return rss
+
+
+class MemorySampler(threading.Thread):
+    """Benchmark boyunca bu process + chromedriver/Chrome alt ağacının belleğini örnekler."""
+
+    def __init__(self, interval: float = 2.0):
+        super().__init__(name="bench-memory", daemon=True)
+        self.interval = interval
+        self.peak_total_mb = 0.0
+        self.peak_processes = 0
+        self.per_process_samples = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            rss = _descendant_rss(os.getpid())
+            if rss:
+                total = sum(rss.values())
+                self.peak_total_mb = max(self.peak_total_mb, total)
+                self.peak_processes = max(self.peak_processes, len(rss))
+                self.per_process_samples.append(total / len(rss))
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=self.interval * 2)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline 101 benchmark against the local stand-in UI.")
+    parser.add_argument("--tables", type=int, default=4, help="Total tables to run (default 4).")
+    parser.add_argument("--concurrency", type=int, default=2, help="Tables in flight at once (default 2).")
+    parser.add_argument("--guests", type=int, default=3, choices=(1, 3), help="Guests per table.")
+    parser.add_argument("--game-seconds", type=float, default=20, help="Game length on the stand-in.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Artificial server latency.")
+    parser.add_argument("--headed", action="store_true", help="Show browsers (default headless, CI=1).")
+    parser.add_argument("--out", help="Also write the report as JSON to this path.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    server = make_server(game_seconds=args.game_seconds, latency_ms=args.latency_ms)
+    threading.Thread(target=server.serve_forever, name="fake-site", daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    # 101.py / common modülleri bu değerleri import anında okuyor
+    timing_log = os.path.join(tempfile.mkdtemp(prefix="okey101-bench-"), "timings.jsonl")
+    os.environ["BASE_URL"] = base_url
+    os.environ["TIMING_LOG"] = timing_log
+    if not args.headed:
+        os.environ["CI"] = "1"
+
+    flows = importlib.import_module("101")
+    from orchestrator import TableOrchestrator
+    from timing_report import build_report, load_records, print_report
+    from common.driver_cache import resolve_chromedriver_path
+
+    print(f"INFO | Stand-in UI at {base_url}")
+    print(f"INFO | chromedriver: {resolve_chromedriver_path()}")
+    print(f"INFO | Running {args.tables} table(s), {args.concurrency} at a time, {args.guests} guest(s) each...")
+
+    orchestrator = TableOrchestrator(
+        flows,
+        guests=args.guests,
+        concurrency=max(1, args.concurrency),
+        setup_workers=flows.SETUP_WORKERS,
+        account_mode=flows.ACCOUNT_MODE,
+    )
+
+    sampler = MemorySampler()
+    sampler.start()
+    started = time.time()
+    try:
+        results = asyncio.run(orchestrator.run(args.tables))
+    finally:
+        elapsed = time.time() - started
+        sampler.stop()
+        server.shutdown()
+
+    report = build_report(load_records([timing_log]))
+    setup = report["phases"].get("player_setup", {})
+    ok = sum(1 for r in results if r.ok)
+    samples = sampler.per_process_samples
+
+    summary = {
+        "tables": args.tables,
+        "tables_ok": ok,
+        "concurrency": args.concurrency,
+        "guests": args.guests,
+        "game_seconds": args.game_seconds,
+        "elapsed_seconds": round(elapsed, 1),
+        "tables_per_hour": round(ok / max(elapsed, 1.0) * 3600, 1),
+        "setup_p50_seconds": setup.get("p50"),
+        "setup_p95_seconds": setup.get("p95"),
+        "peak_total_rss_mb": round(sampler.peak_total_mb, 1),
+        "peak_processes": sampler.peak_processes,
+        "avg_rss_per_process_mb": round(sum(samples) / len(samples), 1) if samples else None,
+        "phases": report["phases"],
+    }
+
+    print("\n=== Benchmark ===")
+    print_report(report)
+    print()
+    for key in (
+        "elapsed_seconds",
+        "tables_per_hour",
+        "setup_p50_seconds",
+        "setup_p95_seconds",
+        "peak_total_rss_mb",
+        "peak_processes",
+        "avg_rss_per_process_mb",
+    ):
+        print(f"{key:<24}: {summary[key]}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+        print(f"INFO | Report written to {args.out}")
+
+    sys.exit(0 if ok == args.tables else 1)
+
+
+if __name__ == "__main__":
+    main()
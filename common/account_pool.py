@@ -0,0 +1,150 @@
+import os
+import time
+import sqlite3
+from dataclasses import dataclass
+
+# Önceden kayıt edilmiş test hesaplarının tutulduğu SQLite dosyası
+DB_PATH = os.getenv("ACCOUNT_POOL_DB", "accounts.db")
+# Çöken job'ların kiraları bu süre sonunda otomatik serbest kalır (saniye)
+LEASE_TTL = float(os.getenv("ACCOUNT_LEASE_TTL", str(2 * 60 * 60)))
+# Üst üste bu kadar login hatası alan hesap 'broken' olur ve bir daha dağıtılmaz
+MAX_LOGIN_FAILURES = int(os.getenv("ACCOUNT_MAX_LOGIN_FAILURES", "2"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    username    TEXT PRIMARY KEY,
+    email       TEXT NOT NULL,
+    password    TEXT NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'free',   -- free | leased | broken
+    leased_by   TEXT,
+    leased_at   REAL,
+    last_used   REAL NOT NULL DEFAULT 0,
+    uses        INTEGER NOT NULL DEFAULT 0,
+    login_failures INTEGER NOT NULL DEFAULT 0,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_accounts_status ON accounts(status, last_used);
+"""
+
+
+@dataclass
+class Account:
+    email: str
+    username: str
+    password: str
+
+
+class AccountPool:
+    """
+    Kira/iade mantığıyla çalışan hesap havuzu.
+    Kiralama tek bir IMMEDIATE transaction içinde yapılır, böylece paralel
+    job'lar (thread ya da process) aynı hesabı asla birlikte almaz.
+    """
+
+    def __init__(self, path: str = DB_PATH, lease_ttl: float = LEASE_TTL):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(accounts)")}
+            if "login_failures" not in columns:
+                # login_failures sonradan eklendi; eski havuz dosyalarını yerinde güncelle
+                conn.execute("ALTER TABLE accounts ADD COLUMN login_failures INTEGER NOT NULL DEFAULT 0")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def add(self, account: Account, leased_by: str | None = None) -> None:
+        """Yeni hesabı havuza ekler; leased_by verilirse doğrudan kiralı eklenir."""
+        now = time.time()
+        status = "leased" if leased_by else "free"
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO accounts "
+                "(username, email, password, status, leased_by, leased_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (account.username, account.email, account.password, status,
+                 leased_by, now if leased_by else None, now),
+            )
+        finally:
+            conn.close()
+
+    def lease(self, owner: str) -> Account | None:
+        """En uzun süredir kullanılmayan boş hesabı kiralar; yoksa None."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Süresi dolmuş kiraları geri al
+            conn.execute(
+                "UPDATE accounts SET status='free', leased_by=NULL, leased_at=NULL "
+                "WHERE status='leased' AND leased_at < ?",
+                (now - self.lease_ttl,),
+            )
+            row = conn.execute(
+                "SELECT username, email, password FROM accounts "
+                "WHERE status='free' ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE accounts SET status='leased', leased_by=?, leased_at=?, "
+                "uses=uses+1 WHERE username=?",
+                (owner, now, row[0]),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        username, email, password = row
+        return Account(email=email, username=username, password=password)
+
+    def release(self, username: str, broken: bool = False) -> None:
+        """Kiralanan hesabı iade eder; broken=True ise tekrar dağıtılmaz. Login hata sayacı sıfırlanır."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE accounts SET status=?, leased_by=NULL, leased_at=NULL, last_used=?, "
+                "login_failures=0 WHERE username=?",
+                ("broken" if broken else "free", time.time(), username),
+            )
+        finally:
+            conn.close()
+
+    def release_failed_login(self, username: str, max_failures: int = MAX_LOGIN_FAILURES) -> bool:
+        """
+        Login'i site tarafından reddedilen hesabı iade eder (timeout'lar için release kullanılır). Üst üste max_failures hataya ulaştıysa
+        'broken' işaretler; True => hesap artık dağıtılmayacak.
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE accounts SET login_failures=login_failures+1, "
+                "status=CASE WHEN login_failures+1 >= ? THEN 'broken' ELSE 'free' END, "
+                "leased_by=NULL, leased_at=NULL, last_used=? WHERE username=?",
+                (max_failures, time.time(), username),
+            )
+            row = conn.execute("SELECT status FROM accounts WHERE username=?", (username,)).fetchone()
+        finally:
+            conn.close()
+        return row is not None and row[0] == "broken"
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) FROM accounts GROUP BY status").fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
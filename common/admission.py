@@ -0,0 +1,260 @@
+import os
+import json
+import time
+from collections import deque
+
+from common.log import get_logger
+from common.timing import TIMING_LOG
+
+try:
+    import psutil
+except ImportError:  # opsiyonel; yoksa /proc ve os.getloadavg kullanılır
+    psutil = None
+
+log = get_logger("admission")
+
+# Yük sinyali olarak izlenen kurulum fazları (timing.phase adları)
+SETUP_PHASES = (
+    "open_browser", "register_new_user", "restore_session", "login",
+    "go_to_101_lobby", "host_create_table", "guest_join_table",
+)
+# Timeout sayılan hata tipleri (timing kaydındaki error alanı)
+TIMEOUT_ERRORS = ("TimeoutException", "TableNotVisible")
+# Bir fazın p95'i hesaplanmadan önce pencerede olması gereken en az örnek
+MIN_SAMPLES_PER_PHASE = 5
+
+
+def _load_average() -> float | None:
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        pass
+    if psutil is not None:
+        try:
+            return psutil.getloadavg()[0]
+        except (AttributeError, OSError):
+            pass
+    return None
+
+
+def _available_memory_mb() -> float | None:
+    if psutil is not None:
+        return psutil.virtual_memory().available / (1024 * 1024)
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return None
+
+
+def _p95(values) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+class PhaseSignals:
+    """
+    Timing log'unu (TIMING_LOG) kaldığı yerden okuyup son `window` saniyedeki kurulum fazlarından
+    timeout oranı ve faz başına p95 süre çıkarır. Job çıkış kodundan dakikalar önce tepki verir.
+    """
+
+    def __init__(self, path: str = TIMING_LOG, window: float = 600):
+        self.path = path
+        self.window = window
+        self._offset = None
+        self._partial = ""
+        self._phases = deque()  # (ts, phase, duration, timed_out)
+
+    def _read_new(self) -> None:
+        if not self.path:
+            return
+        try:
+            size = os.path.getsize(self.path)
+            if self._offset is None or size < self._offset:
+                # İlk okumada geçmişi atla; dosya küçüldüyse (silindi/döndürüldü) baştan
+                self._offset = size if self._offset is None else 0
+                self._partial = ""
+            with open(self.path, encoding="utf-8") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read()
+                self._offset = fh.tell()
+        except OSError:
+            return
+
+        lines = (self._partial + chunk).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("kind") != "phase" or entry.get("phase") not in SETUP_PHASES:
+                continue
+            timed_out = not entry.get("ok", True) and entry.get("error") in TIMEOUT_ERRORS
+            self._phases.append(
+                (entry.get("ts", 0.0), entry["phase"], float(entry.get("duration") or 0.0), timed_out)
+            )
+
+    def sample(self) -> dict:
+        self._read_new()
+        cutoff = time.time() - self.window
+        while self._phases and self._phases[0][0] < cutoff:
+            self._phases.popleft()
+
+        by_phase = {}
+        for _, phase, duration, _ in self._phases:
+            by_phase.setdefault(phase, []).append(duration)
+
+        count = len(self._phases)
+        return {
+            "phase_samples": count,
+            "timeout_rate": sum(1 for p in self._phases if p[3]) / count if count else 0.0,
+            "setup_p95": _p95([p[2] for p in self._phases]),
+            # Fazların süreleri çok farklı (open_browser vs login); karşılaştırma faz başına yapılır
+            "phase_p95": {
+                phase: _p95(durations)
+                for phase, durations in by_phase.items()
+                if len(durations) >= MIN_SAMPLES_PER_PHASE
+            },
+        }
+
+
+class AdmissionController:
+    """
+    Aynı anda kaç masa koşacağını makinenin durumuna göre ayarlar (AIMD).
+    Yük/CPU, boş bellek, son kurulum fazlarının timeout oranı ya da herhangi bir fazın p95 süresi
+    (o fazın son baseline_windows ayarındaki en düşük p95'inin latency_factor katı),
+    ya da son job'ların hata oranı sınırı aşarsa hedef çarpımsal düşer; hepsi rahatsa her ayar periyodunda bir artar.
+    """
+
+    def __init__(
+        self,
+        min_jobs: int,
+        max_jobs: int,
+        start_jobs: int,
+        max_load_per_cpu: float = 1.5,
+        min_free_mem_mb: float = 1500,
+        max_failure_rate: float = 0.3,
+        adjust_every: float = 60,
+        window: int = 20,
+        max_timeout_rate: float = 0.15,
+        latency_factor: float = 2.0,
+        min_phase_samples: int = 20,
+        phase_window: float = 600,
+        baseline_windows: int = 30,
+    ):
+        self.min_jobs = min_jobs
+        self.max_jobs = max_jobs
+        self.current = max(min_jobs, min(start_jobs, max_jobs))
+
+        self.max_load_per_cpu = max_load_per_cpu
+        self.min_free_mem_mb = min_free_mem_mb
+        self.max_failure_rate = max_failure_rate
+        self.adjust_every = adjust_every
+        self.max_timeout_rate = max_timeout_rate
+        self.latency_factor = latency_factor
+        self.min_phase_samples = min_phase_samples
+
+        self.cpu_count = os.cpu_count() or 1
+        self._outcomes = deque(maxlen=window)
+        self._phases = PhaseSignals(window=phase_window)
+        # Faz başına son ayar periyotlarının p95'leri; taban bunların en düşüğü. Eski ölçümler
+        # pencereden düştükçe taban da güncellenir (site kalıcı yavaşladıysa sonsuza kadar ceza yok)
+        self._phase_history = {}
+        self.baseline_windows = baseline_windows
+        self._last_adjust = time.time()
+        self.last_sample = {}
+
+    def record_job(self, ok: bool) -> None:
+        """Biten job'un sonucunu bildirir (timeout/OOM'lar başarısız job olarak gelir)."""
+        self._outcomes.append(bool(ok))
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def sample(self) -> dict:
+        load = _load_average()
+        self.last_sample = {
+            "load_per_cpu": None if load is None else load / self.cpu_count,
+            "free_mem_mb": _available_memory_mb(),
+            "failure_rate": self.failure_rate(),
+        }
+        self.last_sample.update(self._phases.sample())
+        return self.last_sample
+
+    def _phase_pressure(self, s: dict) -> tuple:
+        """(aşırı yük, rahat) — yeterli faz örneği yoksa bu sinyal karar vermez."""
+        if s["phase_samples"] < self.min_phase_samples:
+            return False, True
+
+        slow = False
+        calm = True
+        for phase, p95 in s["phase_p95"].items():
+            history = self._phase_history.setdefault(phase, deque(maxlen=self.baseline_windows))
+            history.append(p95)
+            baseline = min(history)
+            slow = slow or p95 > self.latency_factor * baseline
+            calm = calm and p95 <= (1 + (self.latency_factor - 1) / 2) * baseline
+
+        overloaded = s["timeout_rate"] > self.max_timeout_rate or slow
+        relaxed = s["timeout_rate"] <= self.max_timeout_rate / 2 and calm
+        return overloaded, relaxed
+
+    def has_memory_headroom(self) -> bool:
+        """Yeni bir masa (4 Chrome) açmaya yetecek boş bellek var mı?"""
+        free_mb = _available_memory_mb()
+        return free_mb is None or free_mb >= self.min_free_mem_mb
+
+    def target(self) -> int:
+        """Şu an uçuşta olması gereken masa sayısı; gerekiyorsa önce hedefi günceller."""
+        now = time.time()
+        if now - self._last_adjust < self.adjust_every:
+            return self.current
+        self._last_adjust = now
+
+        s = self.sample()
+        load = s["load_per_cpu"]
+        free_mb = s["free_mem_mb"]
+        failures = s["failure_rate"]
+        phase_overloaded, phase_relaxed = self._phase_pressure(s)
+
+        overloaded = (
+            (load is not None and load > self.max_load_per_cpu)
+            or (free_mb is not None and free_mb < self.min_free_mem_mb)
+            or failures > self.max_failure_rate
+            or phase_overloaded
+        )
+        relaxed = (
+            (load is None or load < 0.7 * self.max_load_per_cpu)
+            and (free_mb is None or free_mb > 2 * self.min_free_mem_mb)
+            and failures <= self.max_failure_rate / 2
+            and phase_relaxed
+        )
+
+        previous = self.current
+        if overloaded:
+            self.current = max(self.min_jobs, int(self.current * 0.75))
+        elif relaxed:
+            self.current = min(self.max_jobs, self.current + 1)
+
+        if self.current != previous:
+            log.info(
+                "Admission: concurrency %s -> %s (load/cpu=%s, free_mem_mb=%s, failure_rate=%.2f, "
+                "phase timeout_rate=%.2f, setup p95=%ss over %s phase(s))",
+                previous,
+                self.current,
+                load,
+                free_mb,
+                failures,
+                s["timeout_rate"],
+                s["setup_p95"],
+                s["phase_samples"],
+            )
+        return self.current
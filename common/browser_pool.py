@@ -0,0 +1,227 @@
+import os
+import time
+import atexit
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field
+
+from common.browser_utils import BASE_URL, close_browser, open_browser, register_release_hook
+from common.lean_mode import resume_network_stats
+from common.log import get_logger
+
+# Havuzda hazır bekleyecek tarayıcı sayısı (0 => havuz kapalı, her oyuncuya yeni Chrome)
+POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "0"))
+# Bir tarayıcı en fazla kaç saniye yaşasın / kaç oyuncuya hizmet etsin
+POOL_MAX_AGE = float(os.getenv("BROWSER_POOL_MAX_AGE", "1800"))
+POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "5"))
+
+log = get_logger("browser_pool")
+
+
+@dataclass
+class PooledBrowser:
+    driver: object
+    wait: object
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+    def expired(self, max_age: float, max_uses: int) -> bool:
+        too_old = time.monotonic() - self.created_at >= max_age
+        return too_old or self.uses >= max_uses
+
+
+def _origin(url: str) -> str | None:
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _quit_quietly(driver) -> None:
+    try:
+        close_browser(driver)
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """
+    Önceden açılmış ve BASE_URL'e gitmiş Chrome'ları tutar.
+    Arka plandaki thread havuzu `size` seviyesinde tutar; geri verilen tarayıcılar
+    yaş/kullanım limitini aşmadıysa temizlenip havuza döner, aştıysa kapatılır.
+    """
+
+    def __init__(self, size: int, max_age: float = POOL_MAX_AGE, max_uses: int = POOL_MAX_USES):
+        self.size = size
+        self.max_age = max_age
+        self.max_uses = max_uses
+
+        self._idle = deque()
+        self._leased = {}
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._refill_loop, name="browser-pool", daemon=True)
+
+    def start(self) -> "BrowserPool":
+        self._thread.start()
+        return self
+
+    # ---------- arka plan doldurma ----------
+
+    def _prune_expired_locked(self) -> None:
+        fresh = deque()
+        while self._idle:
+            pb = self._idle.popleft()
+            if pb.expired(self.max_age, self.max_uses):
+                threading.Thread(target=_quit_quietly, args=(pb.driver,), daemon=True).start()
+            else:
+                fresh.append(pb)
+        self._idle = fresh
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    self._prune_expired_locked()
+                    if len(self._idle) + self._launching < self.size:
+                        break
+                    self._cond.wait(timeout=5)
+                if self._closed:
+                    return
+                self._launching += 1
+
+            pb = None
+            try:
+                driver, wait = open_browser()
+                pb = PooledBrowser(driver=driver, wait=wait)
+            except Exception as exc:
+                log.warning("Browser pool: warm-up launch failed: %r", exc)
+                time.sleep(5)
+
+            with self._cond:
+                self._launching -= 1
+                if pb is not None:
+                    if self._closed:
+                        _quit_quietly(pb.driver)
+                    else:
+                        self._idle.append(pb)
+                        log.debug("Browser pool: warm browser ready (%s/%s).", len(self._idle), self.size)
+                self._cond.notify_all()
+
+    # ---------- al / geri ver ----------
+
+    def acquire(self):
+        """Hazır bir tarayıcı döndürür; havuz boşsa beklemeden yeni bir tane açar."""
+        pb = None
+        while pb is None:
+            with self._cond:
+                self._prune_expired_locked()
+                candidate = self._idle.popleft() if self._idle else None
+                self._cond.notify_all()
+
+            if candidate is None:
+                log.debug("Browser pool empty; launching a cold browser.")
+                driver, wait = open_browser()
+                pb = PooledBrowser(driver=driver, wait=wait)
+                break
+
+            try:
+                # Ölü session'ı erkenden yakala
+                _ = candidate.driver.current_url
+                pb = candidate
+            except Exception:
+                _quit_quietly(candidate.driver)
+
+        pb.uses += 1
+        with self._cond:
+            self._leased[id(pb.driver)] = pb
+        register_release_hook(pb.driver, self.release)
+        return pb.driver, pb.wait
+
+    def release(self, driver) -> None:
+        """Kullanılmış tarayıcıyı temizleyip havuza döndürür ya da kapatır."""
+        with self._cond:
+            pb = self._leased.pop(id(driver), None)
+            keep = (
+                pb is not None
+                and not self._closed
+                and len(self._idle) < self.size
+                and not pb.expired(self.max_age, self.max_uses)
+            )
+
+        if not keep:
+            _quit_quietly(driver)
+            return
+
+        try:
+            self._recycle(driver)
+        except Exception as exc:
+            log.warning("Browser pool: recycle failed, quitting browser: %r", exc)
+            _quit_quietly(driver)
+            return
+
+        with self._cond:
+            if self._closed:
+                _quit_quietly(driver)
+                return
+            self._idle.append(pb)
+            self._cond.notify_all()
+
+    @staticmethod
+    def _recycle(driver) -> None:
+        """
+        Önceki oyuncunun oturumunu siler ve BASE_URL'i yeniden yükler.
+        delete_all_cookies sadece açık sayfanın domain'ini temizler; CDP ile tüm cookie'ler ve
+        origin'lerin tüm depoları (localStorage, IndexedDB, service worker, cache) silinir.
+        """
+        driver.switch_to.default_content()
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        origins = {_origin(BASE_URL), _origin(driver.current_url)}
+        for origin in filter(None, origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        # sessionStorage sekmeye bağlı, Storage domain'i kapsamıyor
+        driver.execute_script("window.sessionStorage.clear();")
+        resume_network_stats(driver)
+        driver.get(BASE_URL)
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for pb in idle:
+            _quit_quietly(pb.driver)
+
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool():
+    """
+    Süreç başına tek havuzu başlatır (ısınma hemen başlar); BROWSER_POOL_SIZE=0 ise None döner.
+    Sadece çok masa koşan uzun ömürlü süreçler (orchestrator, worker) çağırmalı;
+    tek masalık koşuda havuz, kullanılmayacak tarayıcıları ısıtıp kapatmaktan başka bir şey yapmaz.
+    """
+    global _POOL
+    if POOL_SIZE <= 0:
+        return None
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = BrowserPool(POOL_SIZE).start()
+            atexit.register(_POOL.shutdown)
+        return _POOL
+
+
+def acquire_browser():
+    """Havuz başlatılmışsa hazır tarayıcı, değilse open_browser() ile yeni tarayıcı döndürür."""
+    pool = _POOL
+    if pool is None:
+        return open_browser()
+    return pool.acquire()
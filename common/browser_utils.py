@@ -1,10 +1,14 @@
 import os
+import threading
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+from common.driver_cache import resolve_chromedriver_path
+from common.lean_mode import LEAN_MODE, apply_blocking, apply_session_prefs
 
 # CI ortamını basitçe tespit et
 CI_ENV = os.getenv("CI", "").lower() in ("1", "true", "yes")
@@ -12,8 +16,39 @@ CI_ENV = os.getenv("CI", "").lower() in ("1", "true", "yes")
 # Base URL ortam değişkeniyle değiştirilebilir
 # BASE_URL = os.getenv("BASE_URL", "https://skin.dracofusion.com/")
 BASE_URL = os.getenv("BASE_URL", "https://operator.ui-test.dracofusion.com/")
-def open_browser():
-    """Chrome WebDriver açar ve BASE_URL'e gider."""
+
+# >0 ise her oyuncu, paylaşılan bir Chrome içinde izole browser context alır.
+# Değer: bir Chrome'un aynı anda kaç oyuncu taşıyacağı (ör. 4 => masa başına bir Chrome)
+CONTEXTS_PER_CHROME = int(os.getenv("BROWSER_CONTEXTS_PER_CHROME", "0"))
+
+# Driver'ı quit etmek yerine geri almak isteyen kaynaklar (havuz, context vb.) için hook'lar.
+# Hook'lar yığın gibi çalışır: son kaydedilen ilk çağrılır.
+_RELEASE_HOOKS = {}
+_RELEASE_LOCK = threading.Lock()
+
+
+def register_release_hook(driver, hook) -> None:
+    """close_browser(driver) çağrıldığında quit yerine hook(driver) çalışsın."""
+    with _RELEASE_LOCK:
+        _RELEASE_HOOKS.setdefault(id(driver), []).append(hook)
+
+
+def close_browser(driver) -> None:
+    """Driver'ı geldiği kaynağa geri verir; hook yoksa düz quit eder."""
+    with _RELEASE_LOCK:
+        hooks = _RELEASE_HOOKS.get(id(driver))
+        hook = hooks.pop() if hooks else None
+        if hooks is not None and not hooks:
+            del _RELEASE_HOOKS[id(driver)]
+
+    if hook is None:
+        driver.quit()
+    else:
+        hook(driver)
+
+
+def build_chrome_options() -> Options:
+    """Tüm tarayıcı türleri için ortak Chrome ayarları."""
     options = Options()
     options.add_argument("--window-size=1920,1080")
     # CI'da headless ve gerekli flag'ler
@@ -21,13 +56,74 @@ def open_browser():
         options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+    # Lean modda arka plan işlerini ve sesi kapat
+    if LEAN_MODE:
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+    apply_session_prefs(options)
+    return options
+
 
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+class RemoteChrome(webdriver.Remote):
+    """
+    Başkasıyla paylaşılan bir chromedriver/endpoint üzerindeki session (remote havuz, paylaşılan servis).
+    execute_cdp_cmd eklenir (lean mod ve shared context'ler CDP kullanıyor).
+    """
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self) -> None:
+        # HTTP bağlantı havuzu diğer session'larla ortak; Remote.quit gibi kapatma
+        try:
+            self.execute(Command.QUIT)
+        finally:
+            self.stop_client()
+
+
+def launch_chrome(options: Options):
+    """
+    Yeni bir Chrome session başlatır. SHARED_DRIVER_SERVICE=1 ise süreçteki ortak chromedriver
+    kullanılır, değilse her session kendi chromedriver'ını açar.
+    """
+    from common.driver_service import get_driver_service
+
+    service = get_driver_service()
+    if service is not None:
+        return service.new_session(options)
+
+    return webdriver.Chrome(
+        service=Service(resolve_chromedriver_path()),
         options=options,
     )
 
-    driver.set_page_load_timeout(60)
-    driver.get(BASE_URL)
+
+def open_browser(shared_chrome: bool | None = None):
+    """
+    Chrome WebDriver açar ve BASE_URL'e gider.
+    shared_chrome=True (veya BROWSER_CONTEXTS_PER_CHROME > 0) ise ayrı bir Chrome yerine
+    paylaşılan Chrome içinde izole bir browser context döner.
+    REMOTE_WEBDRIVER_URLS tanımlıysa session yerel chromedriver yerine remote endpoint'lerden açılır.
+    """
+    if shared_chrome is None:
+        shared_chrome = CONTEXTS_PER_CHROME > 0
+
+    if shared_chrome:
+        from common.shared_chrome import open_context
+
+        driver = open_context()
+    else:
+        from common.remote_pool import get_remote_pool
+
+        remote = get_remote_pool()
+        if remote is not None:
+            driver = remote.open(build_chrome_options())
+        else:
+            driver = launch_chrome(build_chrome_options())
+        apply_blocking(driver)
+        driver.set_page_load_timeout(60)
+        driver.get(BASE_URL)
+
     wait = WebDriverWait(driver, 20)
     return driver, wait
@@ -0,0 +1,89 @@
+import os
+import time
+import random
+from collections import Counter
+from dataclasses import dataclass
+
+from common import timing
+
+# Bir oyuncunun bir fazı en fazla kaç kez yeniden denensin (0 => eski davranış: ilk hatada masa düşer)
+PHASE_RETRIES = int(os.getenv("PHASE_RETRIES", "2"))
+# Üstel backoff başlangıcı ve tavanı (saniye)
+PHASE_RETRY_BACKOFF = float(os.getenv("PHASE_RETRY_BACKOFF", "2"))
+PHASE_RETRY_MAX_BACKOFF = float(os.getenv("PHASE_RETRY_MAX_BACKOFF", "30"))
+# Kaçıncı yeniden denemede oyuncu (tarayıcı + hesap) tamamen yenisiyle değiştirilsin
+REPLACE_PLAYER_AFTER = int(os.getenv("REPLACE_PLAYER_AFTER", "2"))
+
+
+@dataclass
+class RetryPolicy:
+    retries: int = PHASE_RETRIES
+    base_delay: float = PHASE_RETRY_BACKOFF
+    max_delay: float = PHASE_RETRY_MAX_BACKOFF
+    replace_after: int = REPLACE_PLAYER_AFTER
+
+    def delay(self, attempt: int) -> float:
+        """attempt. yeniden denemeden önceki bekleme (1'den başlar), %20 jitter'lı."""
+        base = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return base * random.uniform(0.8, 1.2)
+
+    def backoff(self, attempt: int, cancel_event=None) -> None:
+        delay = self.delay(attempt)
+        if cancel_event is not None:
+            cancel_event.wait(delay)
+        else:
+            time.sleep(delay)
+
+    def should_replace(self, attempt: int) -> bool:
+        return attempt >= self.replace_after
+
+
+class TableCheckpoint:
+    """
+    Bir masada hangi oyuncunun hangi fazı bitirdiğini ve kaç kez yeniden denendiğini tutar.
+    Her geçiş timing log'una 'checkpoint' / 'retry' kaydı olarak düşer.
+    """
+
+    def __init__(self, table_id: str):
+        self.table_id = table_id
+        self.completed = {}
+        self.attempts = Counter()
+        self.replacements = Counter()
+
+    def done(self, role: str, step: str) -> None:
+        self.completed.setdefault(role, []).append(step)
+        timing.record(
+            "checkpoint",
+            table=self.table_id,
+            player=role,
+            step=step,
+            retries=self.attempts[(role, step)],
+        )
+
+    def has(self, role: str, step: str) -> bool:
+        return step in self.completed.get(role, [])
+
+    def failed(self, role: str, step: str, exc: BaseException) -> int:
+        """Hatayı kaydeder, bu faz için kaçıncı yeniden deneme olacağını döndürür."""
+        self.attempts[(role, step)] += 1
+        attempt = self.attempts[(role, step)]
+        timing.record(
+            "retry",
+            table=self.table_id,
+            player=role,
+            step=step,
+            attempt=attempt,
+            error=type(exc).__name__,
+        )
+        return attempt
+
+    def replaced(self, role: str) -> None:
+        """Oyuncu yenisiyle değişti; tamamladığı fazlar artık geçersiz."""
+        self.replacements[role] += 1
+        self.completed[role] = []
+
+    def summary(self) -> dict:
+        return {
+            "retries": sum(self.attempts.values()),
+            "replaced_players": sum(self.replacements.values()),
+        }
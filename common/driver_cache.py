@@ -0,0 +1,159 @@
+import os
+import re
+import sys
+import json
+import shutil
+import threading
+import subprocess
+
+from common.file_lock import file_lock
+from common.log import get_logger
+
+# Tek seferde çözülmüş chromedriver yolu; scheduler bunu child process'lere env ile geçirir
+DRIVER_PATH_ENV = "CHROMEDRIVER_PATH"
+
+# Chrome sürümüne göre anahtarlanmış kalıcı cache
+CACHE_DIR = os.getenv(
+    "CHROMEDRIVER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "okey101", "chromedriver"),
+)
+
+# Offline mod: ağa hiç çıkma, sadece cache'teki driver'ı kullan
+OFFLINE = os.getenv("CHROMEDRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+_CHROME_COMMANDS = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+_WINDOWS_REG_KEYS = (
+    r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+    r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon",
+)
+
+log = get_logger("driver_cache")
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def _run(cmd) -> str:
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def detect_chrome_major() -> str | None:
+    """Kurulu Chrome'un major sürümünü döndürür (ör. '131'); bulunamazsa None."""
+    override = os.getenv("CHROME_VERSION")
+    if override:
+        return override.split(".")[0]
+
+    outputs = []
+    if sys.platform.startswith("win"):
+        for key in _WINDOWS_REG_KEYS:
+            outputs.append(_run(["reg", "query", key, "/v", "version"]))
+    elif sys.platform == "darwin":
+        outputs.append(
+            _run(["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"])
+        )
+    else:
+        for cmd in _CHROME_COMMANDS:
+            if shutil.which(cmd):
+                outputs.append(_run([cmd, "--version"]))
+
+    for out in outputs:
+        match = re.search(r"(\d+)\.\d+\.\d+\.\d+", out)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _read_index() -> dict:
+    try:
+        with open(os.path.join(CACHE_DIR, "index.json"), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(index: dict) -> None:
+    path = os.path.join(CACHE_DIR, "index.json")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(index, fh, indent=2)
+    os.replace(tmp, path)
+
+
+def _download_into_cache(key: str) -> str:
+    """
+    webdriver-manager ile indirir ve sürüm klasörüne kopyalar.
+    Hedef zaten varsa üzerine yazılmaz: başka job'lar o binary'yi çalıştırıyor olabilir (ETXTBSY).
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    downloaded = ChromeDriverManager().install()
+    target_dir = os.path.join(CACHE_DIR, key)
+    os.makedirs(target_dir, exist_ok=True)
+    target = os.path.join(target_dir, os.path.basename(downloaded))
+    if not os.path.isfile(target):
+        tmp = f"{target}.tmp"
+        shutil.copy2(downloaded, tmp)
+        os.chmod(tmp, 0o755)
+        os.replace(tmp, target)
+    return target
+
+
+def _resolve_locked() -> str:
+    major = detect_chrome_major()
+    lock_path = os.path.join(CACHE_DIR, ".lock")
+
+    if major is None and not OFFLINE:
+        # Sürüm tespit edilemedi: cache'e yazma. Tek bir "unknown" kaydı Chrome güncellendikten
+        # sonra da eski driver'ı döndürürdü; webdriver-manager her koşuda sürümü kendisi çözer.
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager().install()
+
+    with file_lock(lock_path):
+        index = _read_index()
+
+        if major is not None and os.path.isfile(index.get(major, "")):
+            return index[major]
+
+        if OFFLINE:
+            versions = [k for k in index if k.isdigit()]
+            if major is None and versions:
+                # Sürüm tespit edilemedi; cache'teki en yeni driver'ı dene
+                newest = max(versions, key=int)
+                if os.path.isfile(index[newest]):
+                    return index[newest]
+            raise RuntimeError(
+                f"CHROMEDRIVER_OFFLINE is set but no cached chromedriver for Chrome {major} "
+                f"in {CACHE_DIR}."
+            )
+
+        path = _download_into_cache(major)
+        index[major] = path
+        _write_index(index)
+        return path
+
+
+def resolve_chromedriver_path() -> str:
+    """
+    chromedriver yolunu süreç başına bir kez çözer.
+    Sıra: CHROMEDRIVER_PATH env -> sürüm anahtarlı cache -> (online ise) indir.
+    Sonuç env'e yazılır, böylece bu süreçten başlatılan tüm child'lar aynı yolu kullanır.
+    """
+    global _resolved_path
+
+    with _resolve_lock:
+        if _resolved_path:
+            return _resolved_path
+
+        from_env = os.getenv(DRIVER_PATH_ENV)
+        if from_env and os.path.isfile(from_env):
+            _resolved_path = from_env
+        else:
+            _resolved_path = _resolve_locked()
+            log.debug("chromedriver resolved: %s", _resolved_path)
+
+        os.environ[DRIVER_PATH_ENV] = _resolved_path
+        return _resolved_path
@@ -0,0 +1,109 @@
+import os
+import atexit
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from common.browser_utils import RemoteChrome
+from common.driver_cache import resolve_chromedriver_path
+from common.log import get_logger
+
+# 1 => süreçteki tüm oyuncular tek bir chromedriver'ı paylaşır (oyuncu başına chromedriver spawn edilmez)
+SHARED_DRIVER_SERVICE = os.getenv("SHARED_DRIVER_SERVICE", "0") == "1"
+
+log = get_logger("driver_service")
+
+
+class SharedDriverService:
+    """
+    Süreç başına tek chromedriver. Session'lar ona ChromiumRemoteConnection ile bağlanan
+    RemoteChrome'lardır; quit sadece session'ı kapatır, servis ayakta kalır.
+    chromedriver çökerse bir sonraki session açılışında yeniden başlatılır.
+    """
+
+    def __init__(self):
+        self.service = None
+        self.connection = None
+        self.restarts = 0
+        self._lock = threading.Lock()
+
+    def _alive(self) -> bool:
+        service = self.service
+        process = getattr(service, "process", None)
+        if process is None or process.poll() is not None:
+            return False
+        return service.is_connectable()
+
+    def _ensure_started(self, failed_connection=None):
+        """
+        Canlı servisin bağlantısını döner, servis düşmüşse yeniden başlatır.
+        failed_connection: session açarken hata veren bağlantı; başka bir thread servisi
+        çoktan yeniden başlattıysa (bağlantı değişmişse) ikinci kez başlatılmaz.
+        """
+        with self._lock:
+            if failed_connection is not None and self.connection not in (None, failed_connection):
+                # Başka bir thread servisi zaten yeniden başlattı
+                return self.connection
+            if self._alive():
+                return self.connection
+
+            if self.service is not None:
+                self.restarts += 1
+                log.warning("Shared chromedriver is down; restarting (restart #%s).", self.restarts)
+                self._stop_locked()
+
+            service = Service(resolve_chromedriver_path())
+            service.start()
+            self.service = service
+            self.connection = ChromiumRemoteConnection(
+                remote_server_addr=service.service_url,
+                vendor_prefix="goog",
+                browser_name="chrome",
+                keep_alive=True,
+            )
+            return self.connection
+
+    def new_session(self, options):
+        connection = self._ensure_started()
+        try:
+            return RemoteChrome(command_executor=connection, options=options)
+        except WebDriverException:
+            if self._alive():
+                # chromedriver ayakta; hata Chrome/session tarafında, aynen yukarı ilet
+                raise
+        # Session açılırken chromedriver düşmüş; gerekiyorsa bir kez yeniden başlatıp dene
+        return RemoteChrome(command_executor=self._ensure_started(connection), options=options)
+
+    def _stop_locked(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+        if self.service is not None:
+            try:
+                self.service.stop()
+            except Exception:
+                pass
+        self.service = None
+        self.connection = None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._stop_locked()
+
+
+_SERVICE = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_driver_service():
+    """Süreç başına tek paylaşılan chromedriver; SHARED_DRIVER_SERVICE kapalıysa None döner."""
+    global _SERVICE
+    if not SHARED_DRIVER_SERVICE:
+        return None
+
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = SharedDriverService()
+            atexit.register(_SERVICE.shutdown)
+        return _SERVICE
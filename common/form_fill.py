@@ -0,0 +1,74 @@
+from selenium.common.exceptions import NoSuchElementException
+
+# Tek script çağrısında formu doldurur ve butonlara sırayla tıklar.
+# Her alan için LocatorRegistry'nin sıraladığı stratejiler ([by, değer] listesi) geçilir;
+# fallback tarayıcı içinde çözülür, hangi stratejinin bulduğu istatistik için geri döner.
+# React controlled input'lar için value native setter ile yazılır ve input/change event'leri atılır.
+_FILL_FORM_JS = """
+var fields = arguments[0];
+var clicks = arguments[1];
+var hits = [];
+
+function resolve(name, strategies) {
+    var started = performance.now();
+    for (var i = 0; i < strategies.length; i++) {
+        var by = strategies[i][0], value = strategies[i][1], el = null;
+        try {
+            if (by === 'xpath') {
+                el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                    .singleNodeValue;
+            } else if (by === 'css selector') {
+                el = document.querySelector(value);
+            }
+        } catch (e) { el = null; /* geçersiz selector */ }
+        if (el) {
+            hits.push([name, i, performance.now() - started]);
+            return el;
+        }
+    }
+    return null;
+}
+
+var elements = [];
+for (var i = 0; i < fields.length; i++) {
+    var el = resolve(fields[i][0], fields[i][1]);
+    if (!el) { return {missing: fields[i][0], hits: hits}; }
+    elements.push(el);
+}
+
+for (var k = 0; k < elements.length; k++) {
+    var input = elements[k];
+    var proto = input instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    input.focus();
+    setter.call(input, fields[k][2]);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    input.blur();
+}
+
+for (var j = 0; j < clicks.length; j++) {
+    var target = resolve(clicks[j][0], clicks[j][1]);
+    if (!target) { return {missing: clicks[j][0], hits: hits}; }
+    target.click();
+}
+return {missing: null, hits: hits};
+"""
+
+
+def fill_form(driver, registry, values: dict, clicks=()) -> None:
+    """
+    values: {locator adı: değer} eşlemesi, clicks: sırayla tıklanacak locator adları (ör. submit).
+    Stratejiler registry.ranked() sırasıyla tarayıcıda denenir; hepsi tek WebDriver çağrısında yapılır.
+    Bulunamayan alan varsa hiçbir şeye tıklamadan NoSuchElementException fırlatır.
+    """
+    order = {name: registry.ranked(name) for name in list(values) + list(clicks)}
+    result = driver.execute_script(
+        _FILL_FORM_JS,
+        [[name, order[name], value] for name, value in values.items()],
+        [[name, order[name]] for name in clicks],
+    )
+    for name, index, ms in result["hits"]:
+        registry.record_resolution(name, order[name], index, ms)
+    if result["missing"]:
+        raise NoSuchElementException(f"Form element not found by any strategy: {result['missing']}")
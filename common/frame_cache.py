@@ -0,0 +1,77 @@
+import threading
+
+from selenium.webdriver.common.by import By
+
+# default_content için context anahtarı; iframe'ler index (int) ile tutulur
+DEFAULT_CONTEXT = "default"
+
+
+class FrameCache:
+    """
+    Her ekranın (lobi, popup vb.) hangi context'te bulunduğunu hatırlar.
+    Sadece navigasyonda ya da stale/NoSuchFrame durumunda temizlenir.
+    """
+
+    def __init__(self):
+        self._contexts = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            return self._contexts.get(key)
+
+    def remember(self, key: str, context) -> None:
+        with self._lock:
+            self._contexts[key] = context
+
+    def invalidate(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._contexts.clear()
+            else:
+                self._contexts.pop(key, None)
+
+
+def switch_to_context(driver, context) -> None:
+    """DEFAULT_CONTEXT ya da iframe index'ine geçer."""
+    driver.switch_to.default_content()
+    if context != DEFAULT_CONTEXT:
+        driver.switch_to.frame(context)
+
+
+def iter_contexts(driver, cache: FrameCache | None = None, key: str | None = None, exclusive: bool = False):
+    """
+    Context'leri dolaşır ve her birine geçip context'i yield eder.
+    Cache'te `key` varsa önce o denenir; exclusive=True ise sadece o denenir.
+    """
+    cached = cache.get(key) if cache is not None and key else None
+
+    if cached is not None:
+        try:
+            switch_to_context(driver, cached)
+        except Exception:
+            # Frame kaybolmuş/yer değiştirmiş; cache'i düşür ve taramaya geç
+            cache.invalidate(key)
+            cached = None
+        else:
+            yield cached
+            if exclusive:
+                driver.switch_to.default_content()
+                return
+
+    driver.switch_to.default_content()
+    if cached != DEFAULT_CONTEXT:
+        yield DEFAULT_CONTEXT
+
+    driver.switch_to.default_content()
+    frame_count = len(driver.find_elements(By.TAG_NAME, "iframe"))
+    for idx in range(frame_count):
+        if idx == cached:
+            continue
+        try:
+            switch_to_context(driver, idx)
+        except Exception:
+            continue
+        yield idx
+
+    driver.switch_to.default_content()
@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import urllib.request
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Kuyruk adresi: SQLite dosya yolu ya da table_worker.py serve ile açılmış servis (http://host:port)
+JOB_QUEUE = os.getenv("JOB_QUEUE", os.path.join("runs", "jobs.db"))
+# Heartbeat gelmeyen kiralar bu süre sonunda kuyruğa geri döner (saniye)
+JOB_LEASE_TTL = float(os.getenv("JOB_LEASE_TTL", "300"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload      TEXT NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'queued',   -- queued | leased | done | failed
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker       TEXT,
+    leased_at    REAL,
+    expires_at   REAL,
+    result       TEXT,
+    created_at   REAL NOT NULL,
+    finished_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id);
+"""
+
+
+@dataclass
+class Job:
+    id: int
+    payload: dict
+    attempts: int
+    worker: str
+
+
+class JobQueue:
+    """
+    SQLite tabanlı masa iş kuyruğu. Kiralama tek bir IMMEDIATE transaction içinde yapılır;
+    aynı makinedeki worker'lar dosyayı doğrudan, diğer node'lar HTTP servis üzerinden kullanır.
+    """
+
+    def __init__(self, path: str = JOB_QUEUE, lease_ttl: float = JOB_LEASE_TTL):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def publish(self, payload: dict, count: int = 1, max_attempts: int = 3) -> list:
+        now = time.time()
+        body = json.dumps(payload)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            ids = [
+                conn.execute(
+                    "INSERT INTO jobs (payload, max_attempts, created_at) VALUES (?, ?, ?)",
+                    (body, max_attempts, now),
+                ).lastrowid
+                for _ in range(count)
+            ]
+            conn.execute("COMMIT")
+            return ids
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _requeue_expired(self, conn, now: float) -> None:
+        """Süresi dolan kiralar: hakkı kalan kuyruğa döner, kalmayan failed olur."""
+        conn.execute(
+            "UPDATE jobs SET status='failed', finished_at=?, result=? "
+            "WHERE status='leased' AND expires_at < ? AND attempts >= max_attempts",
+            (now, json.dumps({"error": "lease expired"}), now),
+        )
+        conn.execute(
+            "UPDATE jobs SET status='queued', worker=NULL, leased_at=NULL, expires_at=NULL "
+            "WHERE status='leased' AND expires_at < ?",
+            (now,),
+        )
+
+    def lease(self, worker: str) -> Job | None:
+        """En eski kuyruktaki işi kiralar; yoksa None."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._requeue_expired(conn, now)
+            row = conn.execute(
+                "SELECT id, payload, attempts FROM jobs WHERE status='queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status='leased', worker=?, leased_at=?, expires_at=?, "
+                "attempts=attempts+1 WHERE id=?",
+                (worker, now, now + self.lease_ttl, row[0]),
+            )
+            conn.execute("COMMIT")
+            return Job(id=row[0], payload=json.loads(row[1]), attempts=row[2] + 1, worker=worker)
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: int, worker: str) -> bool:
+        """Kirayı uzatır. False => kira kaybedildi (süresi doldu, iş başkasına gitti)."""
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "UPDATE jobs SET expires_at=? WHERE id=? AND worker=? AND status='leased'",
+                (time.time() + self.lease_ttl, job_id, worker),
+            )
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def complete(
+        self, job_id: int, worker: str, ok: bool, result: dict | None = None, requeue: bool = False
+    ) -> bool:
+        """
+        Sonucu yazar. Başarısız iş hakkı kaldıysa tekrar kuyruğa girer.
+        requeue=True: iş kullanıcı tarafından durduruldu; deneme hakkı yakmadan kuyruğa döner.
+        """
+        now = time.time()
+        body = json.dumps(result or {})
+        conn = self._connect()
+        try:
+            if requeue:
+                cur = conn.execute(
+                    "UPDATE jobs SET status='queued', attempts=MAX(attempts - 1, 0), finished_at=NULL, "
+                    "worker=NULL, leased_at=NULL, expires_at=NULL, result=? "
+                    "WHERE id=? AND worker=? AND status='leased'",
+                    (body, job_id, worker),
+                )
+            elif ok:
+                cur = conn.execute(
+                    "UPDATE jobs SET status='done', finished_at=?, result=? "
+                    "WHERE id=? AND worker=? AND status='leased'",
+                    (now, body, job_id, worker),
+                )
+            else:
+                cur = conn.execute(
+                    "UPDATE jobs SET "
+                    "status=CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END, "
+                    "finished_at=CASE WHEN attempts >= max_attempts THEN ? ELSE NULL END, "
+                    "worker=NULL, leased_at=NULL, expires_at=NULL, result=? "
+                    "WHERE id=? AND worker=? AND status='leased'",
+                    (now, body, job_id, worker),
+                )
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._requeue_expired(conn, time.time())
+            conn.execute("COMMIT")
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            workers = dict(
+                conn.execute(
+                    "SELECT worker, COUNT(*) FROM jobs WHERE status='leased' GROUP BY worker"
+                ).fetchall()
+            )
+        finally:
+            conn.close()
+        return {
+            "queued": counts.get("queued", 0),
+            "leased": counts.get("leased", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "workers": workers,
+        }
+
+
+class HttpJobQueue:
+    """Başka node'daki `table_worker.py serve` servisine konuşan, JobQueue ile aynı arayüzlü istemci."""
+
+    def __init__(self, url: str, timeout: float = 30):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _call(self, method: str, body: dict | None = None):
+        data = json.dumps(body or {}).encode("utf-8")
+        req = urllib.request.Request(
+            f"{self.url}/{method}", data=data, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def publish(self, payload: dict, count: int = 1, max_attempts: int = 3) -> list:
+        return self._call("publish", {"payload": payload, "count": count, "max_attempts": max_attempts})
+
+    def lease(self, worker: str) -> Job | None:
+        job = self._call("lease", {"worker": worker})
+        return Job(**job) if job else None
+
+    def heartbeat(self, job_id: int, worker: str) -> bool:
+        return self._call("heartbeat", {"job_id": job_id, "worker": worker})
+
+    def complete(
+        self, job_id: int, worker: str, ok: bool, result: dict | None = None, requeue: bool = False
+    ) -> bool:
+        return self._call(
+            "complete",
+            {"job_id": job_id, "worker": worker, "ok": ok, "result": result, "requeue": requeue},
+        )
+
+    def stats(self) -> dict:
+        return self._call("stats")
+
+
+def open_queue(spec: str = JOB_QUEUE):
+    """http(s):// ile başlıyorsa servis istemcisi, değilse yerel SQLite kuyruğu."""
+    if spec.startswith(("http://", "https://")):
+        return HttpJobQueue(spec)
+    return JobQueue(spec)
+
+
+def make_server(queue: JobQueue, host: str = "0.0.0.0", port: int = 8765) -> ThreadingHTTPServer:
+    """JobQueue'yu POST /publish|lease|heartbeat|complete|stats (JSON) olarak dışarı açar."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+                method = self.path.strip("/")
+                if method == "publish":
+                    out = queue.publish(body["payload"], body.get("count", 1), body.get("max_attempts", 3))
+                elif method == "lease":
+                    job = queue.lease(body["worker"])
+                    out = asdict(job) if job else None
+                elif method == "heartbeat":
+                    out = queue.heartbeat(body["job_id"], body["worker"])
+                elif method == "complete":
+                    out = queue.complete(
+                        body["job_id"],
+                        body["worker"],
+                        body["ok"],
+                        body.get("result"),
+                        requeue=body.get("requeue", False),
+                    )
+                elif method == "stats":
+                    out = queue.stats()
+                else:
+                    self.send_error(404)
+                    return
+            except (KeyError, ValueError) as exc:
+                self.send_error(400, str(exc))
+                return
+            except Exception as exc:
+                # Örn. SQLite kilit zaman aşımı; istemci bağlantı kopması yerine anlamlı hata görsün
+                self.send_error(500, repr(exc))
+                return
+
+            data = json.dumps(out).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
@@ -0,0 +1,105 @@
+import os
+import json
+from collections import Counter
+
+# Lean mod: font/medya/analitik isteklerini DevTools ile engelle, sayfa yüklemesinde bunları bekleme
+LEAN_MODE = os.getenv("LEAN_MODE", "0") == "1"
+
+# Oyuncu başına istek/byte istatistiği topla (lean ve normal koşuları karşılaştırmak için).
+# Sadece ölçüm koşularında açın: performance log her Network olayını (websocket frame'leri dahil)
+# chromedriver'da biriktirir. İstatistik oyuncu masaya oturunca alınıp toplama durdurulur
+# (havuzdan tekrar kiralanan tarayıcıda resume_network_stats yeniden açar);
+# lean modda Network domain'i URL bloklama için açık kalmak zorunda, o yüzden orada durdurulamaz.
+NETWORK_STATS = os.getenv("NETWORK_STATS", "0") == "1"
+
+# Varsayılan blok listesi. Görseller bilerek yok: akışlar BANNER_101 <img>'ine tıklıyor.
+# LEAN_BLOCK_URLS ile virgüllü ek pattern verilebilir, LEAN_ALLOW_URLS ile listeden pattern çıkarılabilir.
+DEFAULT_BLOCK_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav", "*.m4a",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*yandex.ru/metrika*",
+]
+
+
+def _env_list(name: str) -> list:
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+def block_patterns() -> list:
+    allow = set(_env_list("LEAN_ALLOW_URLS"))
+    patterns = DEFAULT_BLOCK_PATTERNS + _env_list("LEAN_BLOCK_URLS")
+    return [p for p in patterns if p not in allow]
+
+
+def apply_session_prefs(options) -> None:
+    """Session açılmadan önce Options'a lean/istatistik ayarlarını ekler."""
+    if LEAN_MODE:
+        # DOMContentLoaded yeter; akışlar zaten elementleri açıkça bekliyor
+        options.page_load_strategy = "eager"
+    if NETWORK_STATS:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def apply_blocking(driver) -> None:
+    """Lean moddaysa blok listesini DevTools üzerinden aktif eder (ilk get'ten önce çağrılmalı)."""
+    if not LEAN_MODE:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": block_patterns()})
+
+
+def collect_network_stats(driver) -> dict:
+    """
+    Performance log'unu okuyup (ve boşaltıp) istek sayısı, indirilen byte,
+    engellenen istek sayısı ve engellenenlerin türlerini döndürür.
+    """
+    requests = 0
+    bytes_loaded = 0
+    blocked = Counter()
+    types = {}
+
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            requests += 1
+            types[params.get("requestId")] = params.get("type", "Other")
+        elif method == "Network.loadingFinished":
+            bytes_loaded += int(params.get("encodedDataLength") or 0)
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked[types.get(params.get("requestId"), params.get("type", "Other"))] += 1
+
+    return {
+        "requests": requests,
+        "bytes": bytes_loaded,
+        "blocked_requests": sum(blocked.values()),
+        "blocked_by_type": dict(blocked),
+    }
+
+
+def finish_network_stats(driver) -> dict:
+    """
+    Kurulum bitince çağrılır: log'u boşaltıp istatistiği döndürür ve (lean mod değilse)
+    Network domain'ini kapatarak oyun boyunca olay birikmesini durdurur.
+    """
+    stats = collect_network_stats(driver)
+    if not LEAN_MODE:
+        driver.execute_cdp_cmd("Network.disable", {})
+    return stats
+
+
+def resume_network_stats(driver) -> None:
+    """
+    finish_network_stats'in kapattığı Network domain'ini yeniden açar. Yeniden kullanılan tarayıcıda
+    (havuz, paylaşılan Chrome) kapalı kalırsa sonraki oyuncunun istatistiği boş gelir; BASE_URL'e
+    gitmeden önce çağrılmalı ki giriş sayfası da sayılsın (yeni açılan tarayıcıdaki gibi).
+    """
+    if NETWORK_STATS and not LEAN_MODE:
+        driver.execute_cdp_cmd("Network.enable", {})
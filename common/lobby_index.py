@@ -0,0 +1,187 @@
+import os
+import time
+
+from common.page_watch import script_timeout
+
+# Lobi sayfalıysa "sonraki sayfa" butonunun XPath'i (boşsa sadece sanal liste kaydırması denenir)
+LOBBY_NEXT_PAGE_XPATH = os.getenv("LOBBY_NEXT_PAGE_XPATH", "")
+# Son sayfadan başa dönmek için "ilk sayfa" butonu (boşsa her turda bir kez "önceki sayfa"ya basılarak
+# geri dönülür; geri dönerken geçilen sayfalar da taranır)
+LOBBY_FIRST_PAGE_XPATH = os.getenv("LOBBY_FIRST_PAGE_XPATH", "")
+LOBBY_PREV_PAGE_XPATH = os.getenv("LOBBY_PREV_PAGE_XPATH", "")
+
+# Sayfada bir kez kurulan indeks: masa adı (ilk hücre) -> <tr>.
+# MutationObserver eklenen satırları ve ilk hücresi değişen satırları (sanal listelerde
+# satırlar yeniden kullanılır) günceller; silinen satırlar lookup sırasında (isConnected) düşer.
+_INSTALL_JS = """
+if (!window.__okeyLobbyIndex) {
+    var idx = {byName: new Map(), nameOf: new WeakMap(), waiters: new Map()};
+
+    idx.nameCell = function (tr) {
+        var td = tr.querySelector('td');
+        return td ? td.textContent.trim() : null;
+    };
+    idx.joinButton = function (tr) {
+        var cells = tr.querySelectorAll('td');
+        return cells.length ? cells[cells.length - 1].querySelector('button') : null;
+    };
+    idx.put = function (tr) {
+        var old = idx.nameOf.get(tr);
+        var name = idx.nameCell(tr);
+        if (old !== undefined && old !== name && idx.byName.get(old) === tr) { idx.byName.delete(old); }
+        if (!name) { return; }
+        idx.nameOf.set(tr, name);
+        idx.byName.set(name, tr);
+
+        var waiting = idx.waiters.get(name);
+        if (waiting) {
+            waiting = waiting.filter(function (w) { return !w(tr); });
+            if (waiting.length) { idx.waiters.set(name, waiting); } else { idx.waiters.delete(name); }
+        }
+    };
+    idx.scan = function (root) {
+        if (root.nodeType !== 1) { return; }
+        if (root.tagName === 'TR') { idx.put(root); return; }
+        var rows = root.querySelectorAll('table tr');
+        for (var i = 0; i < rows.length; i++) { idx.put(rows[i]); }
+    };
+    idx.lookup = function (name) {
+        var tr = idx.byName.get(name);
+        if (tr && (!tr.isConnected || idx.nameOf.get(tr) !== name)) {
+            idx.byName.delete(name);
+            tr = null;
+        }
+        return tr || null;
+    };
+
+    idx.observer = new MutationObserver(function (mutations) {
+        mutations.forEach(function (m) {
+            var el = m.target.nodeType === 1 ? m.target : m.target.parentElement;
+            var tr = el && el.closest ? el.closest('tr') : null;
+            if (tr) { idx.put(tr); }
+            m.addedNodes.forEach(function (n) { idx.scan(n); });
+        });
+    });
+    idx.scan(document.body);
+    idx.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    window.__okeyLobbyIndex = idx;
+}
+var idx = window.__okeyLobbyIndex;
+"""
+
+_FIND_JS = _INSTALL_JS + """
+var tr = idx.lookup(arguments[0]);
+return tr ? idx.joinButton(tr) : null;
+"""
+
+_WAIT_JS = _INSTALL_JS + """
+var name = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+
+var tr = idx.lookup(name);
+var button = tr ? idx.joinButton(tr) : null;
+if (button) { done(button); return; }
+
+var finished = false;
+var waiter = function (row) {
+    var btn = idx.joinButton(row);
+    if (!btn || finished) { return finished; }
+    finished = true;
+    clearTimeout(timer);
+    done(btn);
+    return true;
+};
+var timer = setTimeout(function () {
+    finished = true;
+    done(null);
+}, timeoutMs);
+var list = idx.waiters.get(name) || [];
+list.push(waiter);
+idx.waiters.set(name, list);
+"""
+
+# Sayfalı lobi: sonraki sayfa butonuna bas; sanal liste: tablo kaydırıcısını bir ekran aşağı kaydır.
+# Sona gelindiyse başa sar (ilk sayfa / scrollTop=0): host'un satırı geç gelmiş olabilir ve
+# sanal listede üstteki satırlar kaydırınca DOM'dan düşer. 'next' / 'wrap' / null döner.
+_ADVANCE_JS = """
+var nextXpath = arguments[0], firstXpath = arguments[1], prevXpath = arguments[2], rewinding = arguments[3];
+function byXpath(xpath) {
+    if (!xpath) { return null; }
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function enabled(btn) {
+    return btn && !btn.disabled && btn.getAttribute('aria-disabled') !== 'true';
+}
+
+// Çağrı başına en fazla bir tıklama: sayfa değişimini ve yeni satırları bekleyici döngü karşılar.
+// 'prev' => başa dönülüyor, bir sonraki çağrıda rewinding=true geçilir (ilk sayfaya kadar geri).
+var next = byXpath(nextXpath);
+if (next) {
+    var prev = byXpath(prevXpath);
+    if (rewinding && enabled(prev)) { prev.click(); return 'prev'; }
+    if (enabled(next)) { next.click(); return 'next'; }
+    var first = byXpath(firstXpath);
+    if (enabled(first)) { first.click(); return 'wrap'; }
+    if (enabled(prev)) { prev.click(); return 'prev'; }
+}
+
+var table = document.querySelector('table');
+for (var el = table; el && el !== document.body; el = el.parentElement) {
+    var style = window.getComputedStyle(el);
+    if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && el.scrollHeight > el.clientHeight) {
+        if (el.scrollTop + el.clientHeight >= el.scrollHeight - 1) {
+            el.scrollTop = 0;
+            return 'wrap';
+        }
+        el.scrollTop += el.clientHeight;
+        return 'next';
+    }
+}
+return null;
+"""
+
+_RELEASE_JS = """
+if (window.__okeyLobbyIndex) {
+    window.__okeyLobbyIndex.observer.disconnect();
+    delete window.__okeyLobbyIndex;
+}
+"""
+
+
+def find_join_button(driver, table_name: str):
+    """İndeksten (gerekirse kurup) masanın katıl butonunu döndürür; yoksa None."""
+    return driver.execute_script(_FIND_JS, table_name)
+
+
+def wait_for_join_button(driver, table_name: str, timeout: float):
+    """
+    Masa satırı indekse düşene kadar tarayıcı içinde bekler (tek WebDriver çağrısı).
+    Katıl butonunu ya da timeout'ta None döndürür. Sayfa değişirse WebDriverException fırlar.
+    """
+    with script_timeout(driver, timeout + 10):
+        return driver.execute_async_script(_WAIT_JS, table_name, int(timeout * 1000))
+
+
+def locate_table(driver, table_name: str, timeout: float, chunk: float = 5.0):
+    """
+    wait_for_join_button + sayfalama/sanal liste desteği: her chunk saniyede bir
+    bulunamazsa sonraki sayfaya geçer ya da listeyi kaydırır; sona gelince başa sarıp
+    lobiyi baştan tekrar tarar ("ilk sayfa" butonu yoksa her chunk'ta bir sayfa geri giderek).
+    """
+    deadline = time.monotonic() + timeout
+    rewinding = False
+    while True:
+        remaining = deadline - time.monotonic()
+        button = wait_for_join_button(driver, table_name, max(0.0, min(chunk, remaining)))
+        if button is not None or remaining <= chunk:
+            return button
+        moved = driver.execute_script(
+            _ADVANCE_JS, LOBBY_NEXT_PAGE_XPATH, LOBBY_FIRST_PAGE_XPATH, LOBBY_PREV_PAGE_XPATH, rewinding
+        )
+        rewinding = moved == "prev"
+
+
+def release_index(driver) -> None:
+    """Observer'ı söker; masaya oturduktan sonra oyun ekranında boşuna çalışmasın."""
+    driver.execute_script(_RELEASE_JS)
@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import atexit
+import threading
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException,
+    StaleElementReferenceException,
+)
+
+from common.file_lock import file_lock
+from common.log import get_logger
+
+# Strateji istatistikleri (isabet/ıska/süre) koşular arasında burada saklanır
+LOCATOR_STATS = os.getenv("LOCATOR_STATS", os.path.join("runs", "locator_stats.json"))
+
+# Bir stratejinin hit+miss toplamı bunu aşınca sayaçlar yarıya indirilir (eski veri unutulsun)
+STATS_WINDOW = 200
+
+log = get_logger("locators")
+
+
+def _key(name: str, by: str, value: str) -> str:
+    return f"{name}|{by}|{value}"
+
+
+def _is_clickable(element) -> bool:
+    return element.is_displayed() and element.is_enabled()
+
+
+class LocatorRegistry:
+    """
+    Mantıksal element adı -> birden fazla bulucu (By, değer).
+    find() tüm stratejileri aynı anda yoklar: biri bozulsa bile diğeri bulunca
+    tam timeout ödenmez. Daha hızlı ve güvenilir olanlar sonraki aramalarda önce denenir.
+    """
+
+    def __init__(self, strategies: dict, stats_path: str = LOCATOR_STATS, poll: float = 0.2):
+        self.strategies = strategies
+        self.stats_path = stats_path
+        self.poll = poll
+        self._lock = threading.Lock()
+        self._stats = self._load()
+        self._delta = {}
+        atexit.register(self.save)
+
+    # ---- istatistik ----
+
+    def _load(self) -> dict:
+        try:
+            with open(self.stats_path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, name: str, by: str, value: str, hit: bool, ms: float = 0.0) -> None:
+        key = _key(name, by, value)
+        with self._lock:
+            for bucket in (self._stats, self._delta):
+                row = bucket.setdefault(key, {"hits": 0, "misses": 0, "total_ms": 0.0})
+                if hit:
+                    row["hits"] += 1
+                    row["total_ms"] += ms
+                else:
+                    row["misses"] += 1
+
+    def record_resolution(self, name: str, order: list, index: int, ms: float = 0.0) -> None:
+        """Tarayıcı içinde çözülen bir arama: order[index] isabet, ondan öncekiler ıska."""
+        for by, value in order[:index]:
+            self._record(name, by, value, hit=False)
+        by, value = order[index]
+        self._record(name, by, value, hit=True, ms=ms)
+
+    def save(self) -> None:
+        """Bu process'teki yeni sayımları dosyadakilerle birleştirip yazar."""
+        with self._lock:
+            delta, self._delta = self._delta, {}
+        if not delta:
+            return
+
+        try:
+            with file_lock(f"{self.stats_path}.lock"):
+                merged = self._load()
+                for key, row in delta.items():
+                    dst = merged.setdefault(key, {"hits": 0, "misses": 0, "total_ms": 0.0})
+                    for field in ("hits", "misses", "total_ms"):
+                        dst[field] += row[field]
+                    if dst["hits"] + dst["misses"] > STATS_WINDOW:
+                        for field in ("hits", "misses", "total_ms"):
+                            dst[field] /= 2
+
+                tmp = f"{self.stats_path}.tmp"
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(merged, fh, indent=1, sort_keys=True)
+                os.replace(tmp, self.stats_path)
+        except (OSError, TimeoutError) as exc:
+            log.warning("Could not save locator stats to %s: %r", self.stats_path, exc)
+            return
+
+        with self._lock:
+            # Bu arada gelen sayımlar _stats'ta zaten var; dosyadaki diğer process verisini ekle
+            for key, row in merged.items():
+                self._stats.setdefault(key, row)
+
+    def ranked(self, name: str) -> list:
+        """
+        Stratejileri deneme sırasına dizer:
+        önce çoğunlukla bulanlar (ortalama süreye göre), sonra hiç denenmemişler,
+        en sonda çoğunlukla ıskalayanlar. Eşitlikte tanımlama sırası korunur.
+        """
+        def score(item):
+            by, value = item
+            row = self._stats.get(_key(name, by, value))
+            if not row or row["hits"] + row["misses"] == 0:
+                return (1, 0.0)
+            if row["misses"] > row["hits"]:
+                return (2, 0.0)
+            return (0, row["total_ms"] / max(row["hits"], 1))
+
+        with self._lock:
+            return sorted(self.strategies[name], key=score)
+
+    # ---- arama ----
+
+    def find(self, driver, name: str, timeout: float = 20.0, clickable: bool = False):
+        """
+        Element bulunana (clickable=True ise tıklanabilir olana) kadar tüm stratejileri yoklar.
+        Bulan stratejiye isabet, aynı turda ıskalayanlara ıska yazılır.
+        Hiçbiri timeout içinde bulamazsa TimeoutException fırlar (istatistiğe yazılmaz).
+        """
+        order = self.ranked(name)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            missed = []
+            for by, value in order:
+                started = time.perf_counter()
+                try:
+                    candidates = driver.find_elements(by, value)
+                    element = next((e for e in candidates if not clickable or _is_clickable(e)), None)
+                except StaleElementReferenceException:
+                    element = None
+                except WebDriverException:
+                    # Geçersiz selector vb.; bu strateji bu sayfada işe yaramıyor
+                    element = None
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                if element is not None:
+                    self._record(name, by, value, hit=True, ms=elapsed_ms)
+                    for miss_by, miss_value in missed:
+                        self._record(name, miss_by, miss_value, hit=False)
+                    return element
+                missed.append((by, value))
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(
+                    f"{name}: none of {len(order)} locator strategies matched within {timeout}s"
+                )
+            time.sleep(self.poll)
+
+    def find_now(self, driver, name: str):
+        """Beklemeden tek tur arar; yoksa None döner."""
+        try:
+            return self.find(driver, name, timeout=0)
+        except TimeoutException:
+            return None
@@ -0,0 +1,163 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+from collections import OrderedDict
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+# Seviye: CI'da varsayılan INFO (DEBUG kapalı), lokalde DEBUG
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO" if os.getenv("CI", "0") == "1" else "DEBUG").upper()
+
+# Masa başına JSONL log dosyaları buraya yazılır (logs/<table_id>.jsonl); boş string => kapalı
+LOG_DIR = os.getenv("LOG_DIR", "logs")
+
+# Aynı anda açık tutulacak en fazla masa log dosyası
+MAX_OPEN_TABLE_LOGS = 64
+
+_table = contextvars.ContextVar("log_table", default=None)
+_player = contextvars.ContextVar("log_player", default=None)
+
+_SHORT_LEVELS = {"WARNING": "WARN", "CRITICAL": "FATAL"}
+
+_setup_lock = threading.Lock()
+_listener = None
+
+
+@contextmanager
+def log_context(table: str | None = None, player: str | None = None):
+    """
+    Blok içindeki log kayıtlarına masa/oyuncu alanlarını ekler.
+    ThreadPoolExecutor context'i kopyalamaz; worker fonksiyonu kendi içinde çağırmalı.
+    """
+    tokens = []
+    if table is not None:
+        tokens.append((_table, _table.set(table)))
+    if player is not None:
+        tokens.append((_player, _player.set(player)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Kaydı üreten thread'de context alanlarını kayda kopyalar (kuyruktan önce)."""
+
+    def filter(self, record):
+        record.table = getattr(record, "table", None) or _table.get()
+        record.player = getattr(record, "player", None) or _player.get()
+        return True
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Eski print formatına yakın: 'DEBUG | [table/player] mesaj'."""
+
+    def format(self, record):
+        level = _SHORT_LEVELS.get(record.levelname, record.levelname)
+        tags = "/".join(t for t in (record.table, record.player) if t)
+        prefix = f"[{tags}] " if tags else ""
+        # QueueHandler traceback'i zaten mesaja eklemiş oluyor
+        return f"{level:5} | {prefix}{record.getMessage()}"
+
+
+class _TableFileHandler(logging.Handler):
+    """Masa alanı olan kayıtları LOG_DIR/<table>.jsonl dosyasına JSON satırı olarak yazar."""
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self._files = OrderedDict()
+
+    def _file_for(self, table: str):
+        fh = self._files.get(table)
+        if fh is not None:
+            self._files.move_to_end(table)
+            return fh
+
+        os.makedirs(self.directory, exist_ok=True)
+        fh = open(os.path.join(self.directory, f"{table}.jsonl"), "a", encoding="utf-8")
+        self._files[table] = fh
+        if len(self._files) > MAX_OPEN_TABLE_LOGS:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+        return fh
+
+    def emit(self, record):
+        if not record.table:
+            return
+        try:
+            entry = {
+                "ts": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "table": record.table,
+                "player": record.player,
+                "pid": record.process,
+                "thread": record.threadName,
+                "msg": record.getMessage(),
+            }
+            fh = self._file_for(record.table)
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fh.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        for fh in self._files.values():
+            fh.close()
+        self._files.clear()
+        super().close()
+
+
+def setup_logging() -> None:
+    """
+    'okey101' logger'ını kuyruk tabanlı hale getirir: çağıran thread sadece kuyruğa koyar,
+    konsol ve masa dosyalarına yazım arka plandaki QueueListener thread'inde olur.
+    Birden çok kez çağrılabilir.
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(_ConsoleFormatter())
+        handlers = [console]
+        if LOG_DIR:
+            handlers.append(_TableFileHandler(LOG_DIR))
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(_ContextFilter())
+
+        root = logging.getLogger("okey101")
+        root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+        root.addHandler(queue_handler)
+        root.propagate = False
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Kuyrukta kalanları yazar ve dosyaları kapatır."""
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    setup_logging()
+    return logging.getLogger(f"okey101.{name}")
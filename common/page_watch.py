@@ -0,0 +1,81 @@
+from contextlib import contextmanager
+
+# Sayfaya enjekte edilen bekleyici: XPath eşleşene kadar MutationObserver ile bekler.
+# Aynı origin'deki iframe'lerin dokümanlarına da bakar. Sonuç: true (bulundu) / false (süre doldu).
+_WAIT_FOR_XPATH_JS = """
+var xpath = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+
+function docs() {
+    var list = [document];
+    var frames = document.querySelectorAll('iframe');
+    for (var i = 0; i < frames.length; i++) {
+        try {
+            if (frames[i].contentDocument) { list.push(frames[i].contentDocument); }
+        } catch (e) { /* cross-origin */ }
+    }
+    return list;
+}
+
+function present() {
+    return docs().some(function (doc) {
+        return doc.evaluate(xpath, doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+            .singleNodeValue !== null;
+    });
+}
+
+if (present()) { done(true); return; }
+
+var finished = false;
+var observer, fallback, timer, pending = null;
+function finish(value) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(fallback);
+    clearTimeout(timer);
+    clearTimeout(pending);
+    done(value);
+}
+
+// Oyun sırasında DOM sürekli değişiyor: her mutasyon partisinde XPath koşturmak yerine
+// kontrolü debounce et (en fazla ~250ms'de bir). Lobi butonu childList değişikliği olarak gelir.
+function schedule() {
+    if (pending !== null || finished) { return; }
+    pending = setTimeout(function () {
+        pending = null;
+        if (present()) { finish(true); }
+    }, 250);
+}
+
+observer = new MutationObserver(schedule);
+observer.observe(document, {childList: true, subtree: true});
+// iframe içi değişiklikler üst dokümanın observer'ına düşmez; seyrek bir kontrol yeterli
+fallback = setInterval(function () { if (present()) { finish(true); } }, 2000);
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+"""
+
+
+@contextmanager
+def script_timeout(driver, seconds: float):
+    """
+    Async script'ler için script timeout'unu geçici olarak ayarlar, çıkışta eskisine döner.
+    Aksi halde sonraki execute_async_script çağrıları bizim uzun timeout'umuzla kalırdı.
+    """
+    previous = driver.timeouts.script
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+
+def wait_for_xpath_event(driver, xpath: str, timeout: float) -> bool:
+    """
+    XPath mevcut context'te (veya aynı origin iframe'lerinde) görünene kadar
+    tarayıcı içinde bekler; tek bir WebDriver çağrısı kullanır.
+    True => bulundu, False => timeout. Sayfa değişirse WebDriverException fırlar.
+    """
+    with script_timeout(driver, timeout + 10):
+        return bool(driver.execute_async_script(_WAIT_FOR_XPATH_JS, xpath, int(timeout * 1000)))
@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import threading
+import urllib.request
+
+from urllib3.exceptions import HTTPError as Urllib3Error
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from common.browser_utils import RemoteChrome, register_release_hook
+from common.log import get_logger
+
+# Virgüllü remote WebDriver adresleri (Selenium Grid ya da `chromedriver --port=...` sunucuları).
+# Boşsa open_browser her zaman yerel Chrome açar.
+REMOTE_WEBDRIVER_URLS = [u.strip().rstrip("/") for u in os.getenv("REMOTE_WEBDRIVER_URLS", "").split(",") if u.strip()]
+# Endpoint başına bizim açacağımız en fazla session (Grid /status slot bilgisi verirse o da dikkate alınır)
+REMOTE_MAX_SESSIONS = int(os.getenv("REMOTE_MAX_SESSIONS", "10"))
+# /status kontrol aralığı ve başarısız endpoint'in dinlenme süresi (saniye)
+REMOTE_HEALTH_INTERVAL = float(os.getenv("REMOTE_HEALTH_INTERVAL", "30"))
+REMOTE_COOLDOWN = float(os.getenv("REMOTE_COOLDOWN", "60"))
+
+log = get_logger("remote_pool")
+
+
+class Endpoint:
+    def __init__(self, url: str, max_sessions: int):
+        self.url = url
+        self.max_sessions = max_sessions
+        # Aynı endpoint'e giden tüm session'lar tek keep-alive HTTP bağlantı havuzunu paylaşır
+        self.connection = ChromiumRemoteConnection(
+            remote_server_addr=url, vendor_prefix="goog", browser_name="chrome", keep_alive=True
+        )
+        self.active = 0
+        self.free_slots = None
+        self.healthy = True
+        self.down_until = 0.0
+        self.checked_at = 0.0
+
+    def load(self) -> float:
+        return self.active / max(self.max_sessions, 1)
+
+    def has_capacity(self) -> bool:
+        if self.active >= self.max_sessions:
+            return False
+        return self.free_slots is None or self.free_slots > 0
+
+    def check_health(self, timeout: float = 5.0) -> None:
+        """
+        GET /status. chromedriver 'ready' döner; Grid ayrıca node slot'larını verir,
+        ondan boş slot sayısı hesaplanır.
+        """
+        self.checked_at = time.time()
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=timeout) as resp:
+                value = json.loads(resp.read().decode("utf-8")).get("value", {})
+        except (OSError, ValueError) as exc:
+            self.mark_down(f"/status failed: {exc!r}")
+            return
+
+        nodes = value.get("nodes")
+        if nodes is not None:
+            slots = [slot for node in nodes for slot in node.get("slots", [])]
+            self.free_slots = sum(1 for slot in slots if not slot.get("session"))
+        # Grid dolunca ready=false dönebilir; bunu sağlıksız değil dolu say
+        self.healthy = bool(value.get("ready", True)) or bool(nodes)
+        if self.healthy:
+            self.down_until = 0.0
+
+    def mark_down(self, reason: str) -> None:
+        self.healthy = False
+        self.down_until = time.time() + REMOTE_COOLDOWN
+        log.warning("Remote WebDriver %s unavailable for %.0fs: %s", self.url, REMOTE_COOLDOWN, reason)
+
+
+class RemoteDriverPool:
+    """
+    Remote endpoint'ler arasında session dağıtır: sağlıklı ve yeri olanlar arasından
+    en az yüklü olan seçilir, session açılamazsa sıradakine geçilir.
+    Session'lar close_browser ile kapanınca sayaç düşer (release hook).
+    """
+
+    def __init__(self, urls, max_sessions: int = REMOTE_MAX_SESSIONS):
+        self.endpoints = [Endpoint(url, max_sessions) for url in urls]
+        self._lock = threading.Lock()
+
+    def _candidates(self) -> list:
+        now = time.time()
+        for ep in self.endpoints:
+            if now - ep.checked_at >= REMOTE_HEALTH_INTERVAL and now >= ep.down_until:
+                ep.check_health()
+
+        with self._lock:
+            usable = [ep for ep in self.endpoints if ep.healthy and now >= ep.down_until and ep.has_capacity()]
+            return sorted(usable, key=Endpoint.load)
+
+    def _reserve(self, ep: Endpoint) -> bool:
+        with self._lock:
+            if not ep.has_capacity():
+                return False
+            ep.active += 1
+            if ep.free_slots is not None:
+                ep.free_slots -= 1
+            return True
+
+    def _unreserve(self, ep: Endpoint) -> None:
+        with self._lock:
+            ep.active = max(0, ep.active - 1)
+            # Grid slot'u da boşaldı; bir sonraki /status zaten gerçek değeri yazar
+            if ep.free_slots is not None:
+                ep.free_slots += 1
+
+    def open(self, options):
+        """En az yüklü sağlıklı endpoint'te session açar; hepsi dolu/düşükse WebDriverException."""
+        errors = []
+        for ep in self._candidates():
+            if not self._reserve(ep):
+                continue
+            try:
+                driver = RemoteChrome(command_executor=ep.connection, options=options)
+            except (Urllib3Error, OSError) as exc:
+                # Endpoint'e bağlanılamadı: dinlenmeye al, sıradakine geç
+                self._unreserve(ep)
+                ep.mark_down(repr(exc))
+                errors.append(f"{ep.url}: {exc.__class__.__name__}")
+                continue
+            except WebDriverException as exc:
+                # Endpoint cevap verdi ama session açılmadı (dolu, Chrome açılamadı...);
+                # endpoint sağlıklı, sadece bu denemede sıradakine geç
+                self._unreserve(ep)
+                log.warning("Remote WebDriver %s could not create a session: %s", ep.url, exc.msg or repr(exc))
+                errors.append(f"{ep.url}: {exc.__class__.__name__}")
+                continue
+
+            register_release_hook(driver, lambda d, ep=ep: self._release(ep, d))
+            return driver
+
+        raise WebDriverException(
+            "No remote WebDriver endpoint could take a new session"
+            + (f" ({'; '.join(errors)})" if errors else " (all unhealthy or at capacity)")
+        )
+
+    def _release(self, ep: Endpoint, driver) -> None:
+        try:
+            driver.quit()
+        finally:
+            self._unreserve(ep)
+
+    def stats(self) -> list:
+        with self._lock:
+            return [
+                {"url": ep.url, "active": ep.active, "free_slots": ep.free_slots, "healthy": ep.healthy}
+                for ep in self.endpoints
+            ]
+
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_remote_pool():
+    """Süreç başına tek remote havuz; REMOTE_WEBDRIVER_URLS boşsa None döner."""
+    global _POOL
+    if not REMOTE_WEBDRIVER_URLS:
+        return None
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = RemoteDriverPool(REMOTE_WEBDRIVER_URLS)
+        return _POOL
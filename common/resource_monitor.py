@@ -0,0 +1,361 @@
+import os
+import json
+import time
+import atexit
+import threading
+from collections import Counter
+
+from common import timing
+from common.log import get_logger
+
+try:
+    import psutil
+except ImportError:  # opsiyonel; yoksa /proc okunur (Linux)
+    psutil = None
+
+# Masa/oyuncu başına chromedriver + Chrome process ağacı RSS/CPU örneklemesi
+RESOURCE_MONITOR = os.getenv("RESOURCE_MONITOR", "0") == "1"
+RESOURCE_INTERVAL = float(os.getenv("RESOURCE_INTERVAL", "15"))
+# Masa başına JSON zaman serisi + process başına Prometheus textfile buraya yazılır
+RESOURCE_DIR = os.getenv("RESOURCE_DIR", os.path.join("runs", "resources"))
+
+# Sızıntı: son üçte birlik dilimin ortalama RSS'i ilk dilimden bu kadar MB fazlaysa
+LEAK_GROWTH_MB = float(os.getenv("RESOURCE_LEAK_GROWTH_MB", "300"))
+# Dönme: bu kadar ardışık örnekte CPU bu yüzdenin üstündeyse
+SPIN_CPU_PERCENT = float(os.getenv("RESOURCE_SPIN_CPU_PERCENT", "90"))
+SPIN_SAMPLES = int(os.getenv("RESOURCE_SPIN_SAMPLES", "8"))
+
+log = get_logger("resources")
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+# -------------------- process okuma --------------------
+
+
+def _proc_table() -> dict:
+    """pid -> (ppid, cmdline) tüm process'ler için."""
+    table = {}
+    if psutil is not None:
+        for proc in psutil.process_iter(["ppid", "cmdline"]):
+            info = proc.info
+            table[proc.pid] = (info.get("ppid"), " ".join(info.get("cmdline") or []))
+        return table
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as fh:
+                ppid = int(fh.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as fh:
+                cmdline = fh.read().replace(b"\0", b" ").decode("utf-8", "replace")
+        except (OSError, ValueError, IndexError):
+            continue
+        table[int(entry)] = (ppid, cmdline)
+    return table
+
+
+def _usage(pid: int):
+    """(rss_mb, cpu_seconds) ya da process yoksa None."""
+    if psutil is not None:
+        try:
+            proc = psutil.Process(pid)
+            cpu = proc.cpu_times()
+            return proc.memory_info().rss / (1024 * 1024), cpu.user + cpu.system
+        except psutil.Error:
+            return None
+
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as fh:
+            fields = fh.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/status", encoding="utf-8") as fh:
+            rss_kb = next((int(line.split()[1]) for line in fh if line.startswith("VmRSS:")), 0)
+    except (OSError, ValueError, IndexError):
+        return None
+    # stat'ta ')' sonrası: state=0, ..., utime=11, stime=12
+    return rss_kb / 1024.0, (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+def _tree_pids(proc_table: dict, root_pid: int | None, user_data_dir: str | None) -> set:
+    """chromedriver pid'inin alt ağacı + cmdline'ında user-data-dir geçen Chrome process'leri."""
+    children = {}
+    for pid, (ppid, _) in proc_table.items():
+        children.setdefault(ppid, []).append(pid)
+
+    pids = set()
+    stack = [root_pid] if root_pid in proc_table else []
+    if user_data_dir:
+        stack += [pid for pid, (_, cmd) in proc_table.items() if f"--user-data-dir={user_data_dir}" in cmd]
+    while stack:
+        pid = stack.pop()
+        if pid in pids:
+            continue
+        pids.add(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def _driver_handles(driver):
+    """
+    Driver'dan chromedriver pid'i ve Chrome profil dizini (ikisi de olmayabilir).
+    Paylaşılan chromedriver / remote session'larda driver.service yok; o zaman sadece profil dizini
+    kullanılır (ortak chromedriver'ın ağacı tüm oyuncuları kapsardı).
+    """
+    root_pid = None
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        pass
+
+    user_data_dir = None
+    try:
+        user_data_dir = driver.capabilities.get("chrome", {}).get("userDataDir")
+    except Exception:
+        pass
+    return root_pid, user_data_dir
+
+
+# -------------------- monitor --------------------
+
+
+class _Tracked:
+    def __init__(self, table: str, player: str, root_pid, user_data_dir):
+        self.table = table
+        self.player = player
+        self.root_pid = root_pid
+        self.user_data_dir = user_data_dir
+        self.cpu_seen = {}
+        self.last_ts = None
+        self.samples = []
+        self.peak_rss_mb = 0.0
+        self.peak_cpu_percent = 0.0
+        self.spin_streak = 0
+        self.flags = set()
+
+
+class ResourceMonitor(threading.Thread):
+    """
+    Kayıtlı her oyuncunun tarayıcı process ağacını RESOURCE_INTERVAL'da bir örnekler.
+    Masa bittiğinde RESOURCE_DIR/<table>.json yazar; Prometheus textfile her turda güncellenir.
+    """
+
+    def __init__(self, interval: float = RESOURCE_INTERVAL, directory: str = RESOURCE_DIR):
+        super().__init__(name="resource-monitor", daemon=True)
+        self.interval = interval
+        self.directory = directory
+        self.prom_path = os.path.join(directory, f"okey101_{os.getpid()}.prom")
+        self._lock = threading.Lock()
+        self._tracked = {}
+        self._phases = {}
+        self._finished = {}
+        self._stop_event = threading.Event()
+
+    # ---- kayıt ----
+
+    def register(self, table: str, player: str, driver) -> None:
+        root_pid, user_data_dir = _driver_handles(driver)
+        if root_pid is None and not user_data_dir:
+            log.debug("%s: No chromedriver pid or profile dir; resources not tracked.", player)
+            return
+        with self._lock:
+            self._tracked[(table, player)] = _Tracked(table, player, root_pid, user_data_dir)
+
+    def set_phase(self, table: str, player: str | None, phase: str) -> None:
+        """player=None => masa seviyesindeki faz (oyuncunun kendi fazı yoksa o kullanılır)."""
+        with self._lock:
+            self._phases[(table, player)] = phase
+
+    def unregister(self, table: str, player: str) -> None:
+        """Oyuncu bırakıldı; masada kimse kalmadıysa masa raporunu yaz."""
+        with self._lock:
+            tracked = self._tracked.pop((table, player), None)
+            self._phases.pop((table, player), None)
+            if tracked is None:
+                return
+            self._finished.setdefault(table, []).append(tracked)
+            if any(key[0] == table for key in self._tracked):
+                return
+            finished = self._finished.pop(table)
+            self._phases.pop((table, None), None)
+        self._write_table_report(table, finished)
+
+    # ---- örnekleme ----
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception as exc:
+                log.warning("Resource sampling failed: %r", exc)
+
+    def sample_once(self) -> None:
+        with self._lock:
+            tracked = list(self._tracked.values())
+            phases = dict(self._phases)
+        if not tracked:
+            return
+
+        proc_table = _proc_table()
+        now = time.time()
+        tree_of = {id(t): _tree_pids(proc_table, t.root_pid, t.user_data_dir) for t in tracked}
+        # Paylaşılan Chrome'daki context'ler aynı process'leri görür (aynı userDataDir);
+        # her process'in maliyeti onu gören oyuncular arasında bölünür, masa toplamı şişmez.
+        sharers = Counter(pid for pids in tree_of.values() for pid in pids)
+        usages = {pid: _usage(pid) for pid in sharers}
+        for t in tracked:
+            rss_mb = 0.0
+            tree_rss_mb = 0.0
+            cpu_delta = 0.0
+            pids = tree_of[id(t)]
+            for pid in pids:
+                usage = usages[pid]
+                if usage is None:
+                    continue
+                rss_mb += usage[0] / sharers[pid]
+                tree_rss_mb += usage[0]
+                cpu_delta += max(0.0, usage[1] - t.cpu_seen.get(pid, usage[1])) / sharers[pid]
+                t.cpu_seen[pid] = usage[1]
+
+            cpu_percent = 0.0
+            if t.last_ts is not None:
+                cpu_percent = 100.0 * cpu_delta / max(now - t.last_ts, 1e-6)
+            t.last_ts = now
+
+            t.samples.append({
+                "ts": round(now, 1),
+                "phase": phases.get((t.table, t.player), phases.get((t.table, None))),
+                "rss_mb": round(rss_mb, 1),
+                "tree_rss_mb": round(tree_rss_mb, 1),
+                "cpu_percent": round(cpu_percent, 1),
+                "processes": len(pids),
+                "shared_processes": sum(1 for pid in pids if sharers[pid] > 1),
+            })
+            t.peak_rss_mb = max(t.peak_rss_mb, rss_mb)
+            t.peak_cpu_percent = max(t.peak_cpu_percent, cpu_percent)
+            self._check_flags(t, cpu_percent)
+
+        self._write_prometheus(tracked)
+
+    def _check_flags(self, t: _Tracked, cpu_percent: float) -> None:
+        t.spin_streak = t.spin_streak + 1 if cpu_percent >= SPIN_CPU_PERCENT else 0
+        if t.spin_streak >= SPIN_SAMPLES and "spin" not in t.flags:
+            self._flag(t, "spin", f"CPU >= {SPIN_CPU_PERCENT:.0f}% for {t.spin_streak} samples")
+
+        if len(t.samples) >= 9 and "leak" not in t.flags:
+            # Bölünmemiş ağaç RSS'i: paylaşan oyuncu sayısı değişince pay artışı sızıntı sanılmasın
+            third = len(t.samples) // 3
+            first = sum(s["tree_rss_mb"] for s in t.samples[:third]) / third
+            last = sum(s["tree_rss_mb"] for s in t.samples[-third:]) / third
+            if last - first >= LEAK_GROWTH_MB:
+                self._flag(t, "leak", f"RSS grew {first:.0f} -> {last:.0f} MB")
+
+    def _flag(self, t: _Tracked, kind: str, detail: str) -> None:
+        t.flags.add(kind)
+        log.warning("%s: Browser flagged as %s (%s).", t.player, kind, detail)
+        timing.record("resource_flag", table=t.table, player=t.player, flag=kind, detail=detail)
+
+    # ---- export ----
+
+    def _write_prometheus(self, tracked) -> None:
+        lines = []
+        metrics = {
+            "okey101_browser_rss_bytes": lambda t: t.samples[-1]["rss_mb"] * 1024 * 1024,
+            "okey101_browser_peak_rss_bytes": lambda t: t.peak_rss_mb * 1024 * 1024,
+            "okey101_browser_cpu_percent": lambda t: t.samples[-1]["cpu_percent"],
+            "okey101_browser_processes": lambda t: t.samples[-1]["processes"],
+        }
+        for name, value in metrics.items():
+            lines.append(f"# TYPE {name} gauge")
+            for t in tracked:
+                if t.samples:
+                    lines.append(f'{name}{{table="{t.table}",player="{t.player}"}} {value(t):.0f}')
+
+        lines.append("# TYPE okey101_browser_flag gauge")
+        for t in tracked:
+            for kind in sorted(t.flags):
+                lines.append(f'okey101_browser_flag{{table="{t.table}",player="{t.player}",kind="{kind}"}} 1')
+
+        self._atomic_write(self.prom_path, "\n".join(lines) + "\n")
+
+    def _write_table_report(self, table: str, finished) -> None:
+        report = {
+            "table": table,
+            "peak_rss_mb": round(sum(t.peak_rss_mb for t in finished), 1),
+            "flags": sorted({kind for t in finished for kind in t.flags}),
+            "players": {
+                t.player: {
+                    "peak_rss_mb": round(t.peak_rss_mb, 1),
+                    "peak_cpu_percent": round(t.peak_cpu_percent, 1),
+                    "flags": sorted(t.flags),
+                    "samples": t.samples,
+                }
+                for t in finished
+            },
+        }
+        self._atomic_write(os.path.join(self.directory, f"{table}.json"), json.dumps(report, indent=1))
+        timing.record(
+            "resources",
+            table=table,
+            peak_rss_mb=report["peak_rss_mb"],
+            flags=report["flags"],
+        )
+
+    def _atomic_write(self, path: str, content: str) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(content)
+            os.replace(tmp, path)
+        except OSError as exc:
+            log.warning("Could not write %s: %r", path, exc)
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=self.interval + 5)
+        try:
+            os.remove(self.prom_path)
+        except OSError:
+            pass
+
+
+_MONITOR = None
+_MONITOR_LOCK = threading.Lock()
+
+
+def get_monitor():
+    """Süreç başına tek monitor; RESOURCE_MONITOR kapalıysa None döner."""
+    global _MONITOR
+    if not RESOURCE_MONITOR:
+        return None
+
+    with _MONITOR_LOCK:
+        if _MONITOR is None:
+            _MONITOR = ResourceMonitor()
+            _MONITOR.start()
+            # Örnekler hangi fazda alındığını taşısın
+            timing.add_phase_listener(lambda name, table, player: table and _MONITOR.set_phase(table, player, name))
+            atexit.register(_MONITOR.shutdown)
+        return _MONITOR
+
+
+def load_table_reports(directory: str = RESOURCE_DIR, since: float = 0.0) -> list:
+    """since'ten sonra yazılmış masa raporları (scheduler özetleri için)."""
+    reports = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return reports
+    for name in names:
+        path = os.path.join(directory, name)
+        if not name.endswith(".json"):
+            continue
+        try:
+            if os.path.getmtime(path) < since:
+                continue
+            with open(path, encoding="utf-8") as fh:
+                reports.append(json.load(fh))
+        except (OSError, ValueError):
+            continue
+    return reports
@@ -0,0 +1,101 @@
+import os
+import re
+import json
+import time
+
+# Hesap başına oturum (cookie + local/sessionStorage) snapshot'ları
+SESSION_SNAPSHOTS = os.getenv("SESSION_SNAPSHOTS", "0") == "1"
+SESSION_DIR = os.getenv("SESSION_DIR", os.path.join("runs", "sessions"))
+# Bundan eski snapshot'lar kullanılmaz (saniye)
+SESSION_MAX_AGE = float(os.getenv("SESSION_MAX_AGE", str(12 * 60 * 60)))
+
+_READ_STORAGE_JS = """
+function dump(storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        out[key] = storage.getItem(key);
+    }
+    return out;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_WRITE_STORAGE_JS = """
+var data = arguments[0];
+window.localStorage.clear();
+window.sessionStorage.clear();
+Object.keys(data.local).forEach(function (k) { window.localStorage.setItem(k, data.local[k]); });
+Object.keys(data.session).forEach(function (k) { window.sessionStorage.setItem(k, data.session[k]); });
+"""
+
+
+def _path_for(username: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", username)
+    return os.path.join(SESSION_DIR, f"{safe}.json")
+
+
+def save_session(driver, username: str) -> None:
+    """Login olmuş tarayıcının cookie ve storage'ını diske yazar."""
+    storage = driver.execute_script(_READ_STORAGE_JS)
+    snapshot = {
+        "username": username,
+        "saved_at": time.time(),
+        "url": driver.current_url,
+        "cookies": driver.get_cookies(),
+        "local_storage": storage.get("local", {}),
+        "session_storage": storage.get("session", {}),
+    }
+
+    os.makedirs(SESSION_DIR, exist_ok=True)
+    path = _path_for(username)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(snapshot, fh)
+    os.replace(tmp, path)
+
+
+def discard_session(username: str) -> None:
+    try:
+        os.remove(_path_for(username))
+    except OSError:
+        pass
+
+
+def restore_session(driver, username: str) -> bool:
+    """
+    Snapshot'ı şu an açık sayfanın origin'ine yükler ve sayfayı yeniler.
+    Snapshot yoksa, çok eskiyse ya da tüm cookie'leri süresi dolmuşsa False döner.
+    Oturumun gerçekten geçerli olup olmadığını çağıran taraf UI'dan doğrulamalı.
+    """
+    try:
+        with open(_path_for(username), encoding="utf-8") as fh:
+            snapshot = json.load(fh)
+    except (OSError, ValueError):
+        return False
+
+    now = time.time()
+    if now - snapshot.get("saved_at", 0) > SESSION_MAX_AGE:
+        discard_session(username)
+        return False
+
+    cookies = [c for c in snapshot.get("cookies", []) if c.get("expiry") is None or c["expiry"] > now]
+    if not cookies and not snapshot.get("local_storage"):
+        discard_session(username)
+        return False
+
+    driver.delete_all_cookies()
+    for cookie in cookies:
+        # Domain farkı (ör. www / alt domain) add_cookie'yi patlatmasın
+        cookie = {k: v for k, v in cookie.items() if k != "domain"}
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+
+    driver.execute_script(
+        _WRITE_STORAGE_JS,
+        {"local": snapshot.get("local_storage", {}), "session": snapshot.get("session_storage", {})},
+    )
+    driver.refresh()
+    return True
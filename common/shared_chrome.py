@@ -0,0 +1,190 @@
+import threading
+
+from selenium.webdriver.chrome.options import Options
+
+from common.browser_utils import (
+    BASE_URL,
+    CONTEXTS_PER_CHROME,
+    build_chrome_options,
+    close_browser,
+    launch_chrome,
+    register_release_hook,
+)
+from common.lean_mode import apply_blocking, apply_session_prefs, resume_network_stats
+from common.log import get_logger
+
+log = get_logger("shared_chrome")
+
+
+class SharedChrome:
+    """
+    Tek bir Chrome süreci; her oyuncu bunun içinde ayrı bir browser context
+    (ayrı cookie/localStorage) ve o context'e ait tek bir sekme alır.
+    Oyuncu driver'ı aynı Chrome'a debuggerAddress ile bağlanan ayrı bir session'dır,
+    bu yüzden Player.driver / Player.wait arayüzü değişmez.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.active = 0
+        self._lock = threading.Lock()
+
+        # Root session sadece CDP komutları için; hiçbir sayfaya gitmez
+        self.root = launch_chrome(build_chrome_options())
+        self.debugger_address = self.root.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        self._contexts = {}
+
+    @property
+    def has_room(self) -> bool:
+        return self.active < self.capacity
+
+    def new_context(self):
+        with self._lock:
+            context_id = self.root.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": False}
+            )["browserContextId"]
+            target_id = self.root.execute_cdp_cmd(
+                "Target.createTarget",
+                {
+                    "url": "about:blank",
+                    "browserContextId": context_id,
+                    "width": 1920,
+                    "height": 1080,
+                },
+            )["targetId"]
+
+        # debuggerAddress ile bağlanırken Chrome açılış argümanları geçersiz; sadece adres yeter
+        options = Options()
+        options.debugger_address = self.debugger_address
+        apply_session_prefs(options)
+
+        try:
+            driver = launch_chrome(options)
+            # chromedriver'da window handle == CDP target id
+            driver.switch_to.window(target_id)
+        except Exception:
+            self._dispose(context_id)
+            raise
+
+        self._contexts[id(driver)] = context_id
+        return driver
+
+    def close_context(self, driver) -> None:
+        context_id = self._contexts.pop(id(driver), None)
+        try:
+            # Bağlı session'ı kapatmak Chrome'u öldürmez, sadece chromedriver'ı kapatır
+            driver.quit()
+        except Exception:
+            pass
+        if context_id:
+            self._dispose(context_id)
+
+    def _dispose(self, context_id: str) -> None:
+        with self._lock:
+            try:
+                self.root.execute_cdp_cmd(
+                    "Target.disposeBrowserContext", {"browserContextId": context_id}
+                )
+            except Exception as exc:
+                log.warning("Could not dispose browser context %s: %r", context_id, exc)
+
+    def quit(self) -> None:
+        try:
+            self.root.quit()
+        except Exception:
+            pass
+
+
+class SharedChromeGroup:
+    """
+    Oyuncuları boş yeri olan paylaşılan Chrome'lara dağıtır; hepsi doluysa yenisini açar.
+    Son context'i kapanan Chrome hemen kapatılır ki bellek boşta tutulmasın.
+    """
+
+    def __init__(self, contexts_per_chrome: int):
+        self.contexts_per_chrome = contexts_per_chrome
+        self._chromes = []
+        self._lock = threading.Lock()
+        # Aynı anda gelen oyuncular için birden fazla Chrome açılmasın
+        self._launch_lock = threading.Lock()
+
+    def _take_room_locked(self):
+        for chrome in self._chromes:
+            if chrome.has_room:
+                chrome.active += 1
+                return chrome
+        return None
+
+    def _reserve_slot(self) -> SharedChrome:
+        with self._lock:
+            chrome = self._take_room_locked()
+        if chrome is not None:
+            return chrome
+
+        with self._launch_lock:
+            # Biz beklerken başka bir thread yeni Chrome açmış olabilir
+            with self._lock:
+                chrome = self._take_room_locked()
+            if chrome is not None:
+                return chrome
+
+            chrome = SharedChrome(self.contexts_per_chrome)
+            log.debug(
+                "Launched shared Chrome at %s (up to %s players).",
+                chrome.debugger_address,
+                self.contexts_per_chrome,
+            )
+            with self._lock:
+                chrome.active += 1
+                self._chromes.append(chrome)
+            return chrome
+
+    def _release_slot(self, chrome: SharedChrome) -> None:
+        with self._lock:
+            chrome.active -= 1
+            retire = chrome.active == 0
+            if retire:
+                self._chromes.remove(chrome)
+        if retire:
+            chrome.quit()
+
+    def open_context(self):
+        chrome = self._reserve_slot()
+        try:
+            driver = chrome.new_context()
+        except Exception:
+            self._release_slot(chrome)
+            raise
+
+        def _release(drv):
+            chrome.close_context(drv)
+            self._release_slot(chrome)
+
+        register_release_hook(driver, _release)
+        return driver
+
+
+_GROUP = None
+_GROUP_LOCK = threading.Lock()
+
+
+def get_group() -> SharedChromeGroup:
+    global _GROUP
+    with _GROUP_LOCK:
+        if _GROUP is None:
+            _GROUP = SharedChromeGroup(max(1, CONTEXTS_PER_CHROME))
+        return _GROUP
+
+
+def open_context():
+    """Paylaşılan Chrome'da izole context açar, BASE_URL'e gider ve driver'ı döndürür."""
+    driver = get_group().open_context()
+    try:
+        apply_blocking(driver)
+        resume_network_stats(driver)
+        driver.set_page_load_timeout(60)
+        driver.get(BASE_URL)
+    except Exception:
+        close_browser(driver)
+        raise
+    return driver
@@ -0,0 +1,68 @@
+import os
+import json
+import time
+import socket
+import threading
+from contextlib import contextmanager
+
+# Faz süreleri JSON Lines olarak buraya eklenir; boş string => kayıt kapalı
+TIMING_LOG = os.getenv("TIMING_LOG", os.path.join("runs", "timings.jsonl"))
+
+_write_lock = threading.Lock()
+_HOST = socket.gethostname()
+
+# Faz başlarken çağrılan dinleyiciler: fn(name, table, player)
+_phase_listeners = []
+
+
+def add_phase_listener(fn) -> None:
+    _phase_listeners.append(fn)
+
+
+def record(kind: str, **fields) -> None:
+    """Tek satırlık makine-okunur kayıt yazar (kind: 'phase' ya da 'table')."""
+    if not TIMING_LOG:
+        return
+
+    entry = {"kind": kind, "ts": time.time(), "host": _HOST, "pid": os.getpid()}
+    entry.update(fields)
+    line = json.dumps(entry, ensure_ascii=False) + "\n"
+
+    with _write_lock:
+        directory = os.path.dirname(TIMING_LOG)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Append modunda tek write; paralel process'ler satır satır ekleyebilir
+        with open(TIMING_LOG, "a", encoding="utf-8") as fh:
+            fh.write(line)
+
+
+@contextmanager
+def phase(name: str, table: str | None = None, player: str | None = None):
+    """
+    Bloğun süresini ölçer ve bir 'phase' kaydı yazar.
+    Blok exception ile çıkarsa kayıt ok=false ve hata tipiyle yazılır; exception yutulmaz.
+    """
+    for fn in _phase_listeners:
+        fn(name, table, player)
+
+    start = time.time()
+    ok = True
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        ok = False
+        error = type(exc).__name__
+        raise
+    finally:
+        record(
+            "phase",
+            phase=name,
+            table=table,
+            player=player,
+            start=start,
+            duration=round(time.time() - start, 3),
+            ok=ok,
+            error=error,
+        )
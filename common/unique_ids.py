@@ -0,0 +1,61 @@
+import os
+import time
+import socket
+import hashlib
+
+from common.file_lock import file_lock
+
+# Sayaç dosyası: aynı makinedeki tüm process'ler bunu paylaşır
+STATE_PATH = os.getenv(
+    "UNIQUE_ID_STATE",
+    os.path.join(os.path.expanduser("~"), ".cache", "okey101", "id_counter"),
+)
+
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _base36(n: int) -> str:
+    out = ""
+    while True:
+        n, rem = divmod(n, 36)
+        out = _ALPHABET[rem] + out
+        if n == 0:
+            return out
+
+
+# Önek sabit genişlikte olmalı: sayaç değişken uzunlukta ve araya ayraç konmuyor
+PREFIX_LEN = 6
+
+
+def node_prefix() -> str:
+    """
+    Makineye özel sabit genişlikli (PREFIX_LEN) base36 önek: NODE_ID env verilirse onun,
+    yoksa hostname'in hash'i. 36^6 ~ 2 milyar kova, node çiftliklerinde çakışma pratikte yok.
+    """
+    node_id = os.getenv("NODE_ID") or socket.gethostname()
+    digest = hashlib.sha1(node_id.encode("utf-8")).digest()
+    return _base36(int.from_bytes(digest[:8], "big") % (36 ** PREFIX_LEN)).rjust(PREFIX_LEN, "0")
+
+
+def next_id() -> str:
+    """
+    Süreçler arası monoton sayaçtan yeni bir id üretir: <node><counter>.
+    Sayaç en az epoch saniyesi kadar tutulur, böylece silinen dosya sayacı sıfıra döndürmez.
+    Ancak saniyede birden fazla id üretildiyse sayaç saatin önündedir; dosya o sırada silinirse
+    saat o değere yetişene kadar üretilen id'ler öncekilerle çakışabilir. Dosyayı silmeyin.
+    """
+    with file_lock(f"{STATE_PATH}.lock"):
+        try:
+            with open(STATE_PATH, encoding="utf-8") as fh:
+                last = int(fh.read().strip() or 0)
+        except (OSError, ValueError):
+            last = 0
+
+        value = max(last + 1, int(time.time()))
+
+        tmp = f"{STATE_PATH}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(str(value))
+        os.replace(tmp, STATE_PATH)
+
+    return f"{node_prefix()}{_base36(value)}"
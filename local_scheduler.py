@@ -3,6 +3,12 @@ import sys
 import time
 import subprocess
 import datetime as dt
+from collections import deque
+
+from common.admission import AdmissionController
+from common.driver_cache import resolve_chromedriver_path
+from common.resource_monitor import RESOURCE_MONITOR, load_table_reports
+from common.job_queue import JOB_QUEUE, open_queue
 
 # ================== CONFIG ==================
 GUESTS = 3               # 1 -> 2 player table, 3 -> 4 player table
@@ -14,6 +20,23 @@ ACTIVE_START = "00:00"     # Ör: "13:00"
 ACTIVE_END = "23:59"       # Ör: "23:00"
 
 USE_CI_MODE = True         # True => CI=1 (human delay kapalı, headless için uygun)
+
+# "rolling" => sürekli PARALLEL_JOBS masa uçuşta tutulur, biten masanın yerine hemen yenisi başlar
+# "batch"   => eski davranış: INTERVAL_MINUTES'ta bir PARALLEL_JOBS masa, hepsi bitene kadar bekle
+# "queue"   => koordinatör: kendisi masa açmaz, JOB_QUEUE'da (kuyrukta + uçuşta) PARALLEL_JOBS iş tutar;
+#              işleri farklı node'lardaki `table_worker.py worker` process'leri koşturur
+SCHEDULER_MODE = "rolling"
+REPORT_EVERY_SECONDS = 60  # rolling modda tables/hour raporu sıklığı
+
+# Rolling modda eşzamanlı masa sayısını makine yüküne göre ayarla (PARALLEL_JOBS başlangıç değeri olur)
+ADAPTIVE_CONCURRENCY = True
+MIN_PARALLEL_JOBS = 2
+MAX_PARALLEL_JOBS = 60
+MAX_LOAD_PER_CPU = 1.5       # 1 dk load average / CPU sayısı
+MIN_FREE_MEMORY_MB = 1500    # bunun altına düşerse yeni masa açma, hedefi düşür
+MAX_FAILURE_RATE = 0.3       # son 20 job'daki hata oranı (timeout/OOM göstergesi)
+MAX_PHASE_TIMEOUT_RATE = 0.15  # son 10 dk'daki kurulum fazlarında timeout oranı (TIMING_LOG'dan)
+SETUP_LATENCY_FACTOR = 2.0     # kurulum fazı p95'i en iyi görülen p95'in bu katını aşarsa hedefi düşür
 # ============================================
 
 
@@ -34,20 +57,23 @@ def in_active_window(now: dt.time) -> bool:
         return now >= START_TIME or now <= END_TIME
 
 
+def start_job(label: str) -> subprocess.Popen:
+    """Tek bir 101 senaryosunu (main.py) ayrı process olarak başlatır."""
+    env = os.environ.copy()
+    if USE_CI_MODE:
+        env["CI"] = "1"
+
+    cmd = [sys.executable, "main.py", "--guests", str(GUESTS)]
+    print(f"[{dt.datetime.now()}] Starting job {label}: {' '.join(cmd)}")
+    return subprocess.Popen(cmd, env=env)
+
+
 def run_one_batch():
     """Tek periyotta PARALLEL_JOBS kadar 101 senaryosu başlatır."""
     procs = []
 
     for i in range(PARALLEL_JOBS):
-        env = os.environ.copy()
-        if USE_CI_MODE:
-            env["CI"] = "1"
-
-        cmd = [sys.executable, "main.py", "--guests", str(GUESTS)]
-        print(f"[{dt.datetime.now()}] Starting job {i+1}/{PARALLEL_JOBS}: {' '.join(cmd)}")
-
-        p = subprocess.Popen(cmd, env=env)
-        procs.append(p)
+        procs.append(start_job(f"{i+1}/{PARALLEL_JOBS}"))
 
     # Hepsinin bitmesini bekle (gerçek paralel, ama bir sonraki batch bunlar bitince gelecek)
     for p in procs:
@@ -55,16 +81,156 @@ def run_one_batch():
         print(f"[{dt.datetime.now()}] Job PID={p.pid} finished with code {p.returncode}")
 
 
+def print_resource_summary(since: float) -> None:
+    """Biten masaların tarayıcı bellek tepe değerleri (PARALLEL_JOBS boyutlandırmak için)."""
+    reports = load_table_reports(since=since)
+    if not reports:
+        return
+    peaks = sorted(r["peak_rss_mb"] for r in reports)
+    flagged = [r["table"] for r in reports if r["flags"]]
+    print(
+        f"[{dt.datetime.now()}] Browser RSS per table: avg {sum(peaks) / len(peaks):.0f} MB, "
+        f"max {peaks[-1]:.0f} MB over {len(peaks)} table(s) | flagged (leak/spin): {len(flagged)}"
+    )
+
+
+def run_rolling():
+    """
+    Sürekli PARALLEL_JOBS masayı uçuşta tutar: bir job bittiği an (aktif pencere
+    içindeysek) yerine yenisi başlar. Periyodik olarak tables/hour raporlar.
+    """
+    controller = None
+    if ADAPTIVE_CONCURRENCY:
+        controller = AdmissionController(
+            min_jobs=MIN_PARALLEL_JOBS,
+            max_jobs=MAX_PARALLEL_JOBS,
+            start_jobs=PARALLEL_JOBS,
+            max_load_per_cpu=MAX_LOAD_PER_CPU,
+            min_free_mem_mb=MIN_FREE_MEMORY_MB,
+            max_failure_rate=MAX_FAILURE_RATE,
+            max_timeout_rate=MAX_PHASE_TIMEOUT_RATE,
+            latency_factor=SETUP_LATENCY_FACTOR,
+        )
+
+    running = {}             # pid -> (Popen, başlangıç zamanı)
+    finished_ok = deque()    # son bir saatte başarıyla biten job'ların bitiş zamanları
+    started_total = ok_total = failed_total = 0
+
+    t0 = time.time()
+    last_report = t0
+
+    while True:
+        # Biten job'ları topla
+        for pid, (p, started) in list(running.items()):
+            if p.poll() is None:
+                continue
+            del running[pid]
+            duration_min = (time.time() - started) / 60.0
+            print(
+                f"[{dt.datetime.now()}] Job PID={pid} finished with code {p.returncode} "
+                f"after {duration_min:.1f} min"
+            )
+            if p.returncode == 0:
+                ok_total += 1
+                finished_ok.append(time.time())
+            else:
+                failed_total += 1
+            if controller is not None:
+                controller.record_job(p.returncode == 0)
+
+        target = controller.target() if controller is not None else PARALLEL_JOBS
+
+        # Boşalan slotları doldur (bellek yetmiyorsa bu tur yeni masa açma)
+        if in_active_window(dt.datetime.now().time()):
+            while len(running) < target:
+                if controller is not None and not controller.has_memory_headroom():
+                    break
+                started_total += 1
+                p = start_job(f"#{started_total} (in flight: {len(running) + 1}/{target})")
+                running[p.pid] = (p, time.time())
+
+        now = time.time()
+        while finished_ok and now - finished_ok[0] > 3600:
+            finished_ok.popleft()
+
+        if now - last_report >= REPORT_EVERY_SECONDS:
+            last_report = now
+            window_h = min(now - t0, 3600) / 3600.0
+            overall_h = (now - t0) / 3600.0
+            print(
+                f"[{dt.datetime.now()}] In flight: {len(running)}/{target} | "
+                f"started: {started_total} ok: {ok_total} failed: {failed_total} | "
+                f"tables/hour (last 60 min): {len(finished_ok) / window_h:.1f} | "
+                f"tables/hour (overall): {ok_total / overall_h:.1f}"
+            )
+            if RESOURCE_MONITOR:
+                print_resource_summary(t0)
+
+        time.sleep(1)
+
+
+def run_coordinator():
+    """
+    Aktif pencere içinde kuyruktaki + kiralanmış iş sayısını PARALLEL_JOBS'ta tutar.
+    Tüm node'lar aynı kuyruktan beslendiği için uçuştaki masa sayısı globaldir.
+    """
+    queue = open_queue(JOB_QUEUE)
+    t0 = time.time()
+    last_report = 0.0
+    done_at_start = None
+
+    while True:
+        stats = queue.stats()
+        if done_at_start is None:
+            done_at_start = stats["done"]
+
+        outstanding = stats["queued"] + stats["leased"]
+        if in_active_window(dt.datetime.now().time()) and outstanding < PARALLEL_JOBS:
+            queue.publish({"guests": GUESTS}, count=PARALLEL_JOBS - outstanding)
+
+        now = time.time()
+        if now - last_report >= REPORT_EVERY_SECONDS:
+            last_report = now
+            overall_h = max(now - t0, 1.0) / 3600.0
+            print(
+                f"[{dt.datetime.now()}] Queue {JOB_QUEUE} | queued: {stats['queued']} "
+                f"in flight: {stats['leased']} on {len(stats['workers'])} worker(s) | "
+                f"done: {stats['done']} failed: {stats['failed']} | "
+                f"tables/hour (overall): {(stats['done'] - done_at_start) / overall_h:.1f}"
+            )
+            if RESOURCE_MONITOR:
+                print_resource_summary(t0)
+
+        time.sleep(5)
+
+
 def main():
     print("Local DracoFusion 101 scheduler starting...")
-    print(f"Interval: every {INTERVAL_MINUTES} minutes")
+    print(f"Mode: {SCHEDULER_MODE}")
+    if SCHEDULER_MODE == "queue":
+        print(f"Coordinator: keeping {PARALLEL_JOBS} table job(s) queued or in flight in {JOB_QUEUE}")
+    elif SCHEDULER_MODE == "rolling":
+        print(f"Target tables in flight: {PARALLEL_JOBS}")
+    else:
+        print(f"Interval: every {INTERVAL_MINUTES} minutes")
+        print(f"Parallel jobs per batch: {PARALLEL_JOBS}")
     print(f"Active window: {ACTIVE_START} - {ACTIVE_END}")
-    print(f"Parallel jobs per batch: {PARALLEL_JOBS}")
     print(f"GUESTS per run: {GUESTS}")
 
+    # chromedriver'ı bir kez çöz; CHROMEDRIVER_PATH env'i ile tüm job'lara geçer
+    try:
+        print(f"chromedriver: {resolve_chromedriver_path()}")
+    except Exception as exc:
+        print(f"WARN  | chromedriver could not be resolved up front ({exc!r}); jobs will resolve it.")
+
     interval_sec = INTERVAL_MINUTES * 60
 
     try:
+        if SCHEDULER_MODE == "queue":
+            run_coordinator()
+        if SCHEDULER_MODE == "rolling":
+            run_rolling()
+
         while True:
             now = dt.datetime.now()
             if in_active_window(now.time()):
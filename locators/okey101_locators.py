@@ -1,4 +1,5 @@
 ﻿# locators/okey101_locators.py
+from selenium.webdriver.common.by import By
 
 class RegisterLocators:
     # Header "Kayıt Ol" butonu
@@ -23,6 +24,8 @@ class LoginLocators:
     PASSWORD_INPUT = '//*[@id="root"]/div[2]/div/section/div/form/div/label[2]/input'
     # Submit
     LOGIN_SUBMIT_BUTTON = '//*[@id="root"]/div[2]/div/section/div/form/button'
+    # Yanlış kullanıcı adı/şifre sonrası modalda çıkan hata mesajı
+    LOGIN_ERROR_MESSAGE = '//*[@id="root"]/div[2]/div/section//*[@role="alert"]'
 
 
 class Okey101Locators:
@@ -57,3 +60,99 @@ class Okey101Locators:
     # Oda içi nickname ekranı
     TABLE_NICKNAME_INPUT = '//*[@id="root"]/div/div[2]/div/form/input'
     TABLE_NICKNAME_SUBMIT = '//*[@id="root"]/div/div[2]/div/form/button'
+
+
+# Mantıksal element -> alternatif bulucular (CSS, metin, ARIA, XPath).
+# İlk sıradaki her zaman yukarıdaki mutlak XPath; LocatorRegistry deneme sırasını
+# ölçülen hız/başarıya göre kendisi belirler.
+def _text_xpath(tag: str, *texts: str) -> str:
+    cond = " or ".join(f"normalize-space()='{t}'" for t in texts)
+    return f"//{tag}[{cond}]"
+
+
+def _aria_css(tag: str, *labels: str) -> str:
+    return ", ".join(f"{tag}[aria-label='{label}']" for label in labels)
+
+
+LOCATOR_STRATEGIES = {
+    "register_button": [
+        (By.XPATH, RegisterLocators.REGISTER_BUTTON),
+        (By.CSS_SELECTOR, "header nav:nth-of-type(2) button:nth-of-type(2)"),
+        (By.XPATH, _text_xpath("header//button", "Kayıt Ol", "Register", "Sign Up")),
+        (By.CSS_SELECTOR, _aria_css("header button", "Kayıt Ol", "Register")),
+    ],
+    "register_email_input": [
+        (By.XPATH, RegisterLocators.EMAIL_INPUT),
+        (By.CSS_SELECTOR, "section form input[type='email']"),
+        (By.CSS_SELECTOR, "section form label:nth-of-type(1) input"),
+    ],
+    "register_username_input": [
+        (By.XPATH, RegisterLocators.USERNAME_INPUT),
+        (By.CSS_SELECTOR, "section form label:nth-of-type(2) input"),
+    ],
+    "register_password_input": [
+        (By.XPATH, RegisterLocators.PASSWORD_INPUT),
+        (By.CSS_SELECTOR, "section form input[type='password']"),
+    ],
+    "register_submit": [
+        (By.XPATH, RegisterLocators.SUBMIT_BUTTON),
+        (By.CSS_SELECTOR, "section form button[type='submit']"),
+        (By.XPATH, _text_xpath("section//form//button", "Kayıt Ol", "Register", "Sign Up")),
+    ],
+    "login_button_header": [
+        (By.XPATH, LoginLocators.LOGIN_BUTTON_HEADER),
+        (By.CSS_SELECTOR, "header nav:nth-of-type(2) button:nth-of-type(1)"),
+        (By.XPATH, _text_xpath("header//button", "Giriş Yap", "Login", "Log In", "Sign In")),
+        (By.CSS_SELECTOR, _aria_css("header button", "Giriş Yap", "Login")),
+    ],
+    "login_username_input": [
+        (By.XPATH, LoginLocators.USERNAME_INPUT),
+        (By.CSS_SELECTOR, "section form input[type='text']"),
+        (By.CSS_SELECTOR, "section form label:nth-of-type(1) input"),
+    ],
+    "login_password_input": [
+        (By.XPATH, LoginLocators.PASSWORD_INPUT),
+        (By.CSS_SELECTOR, "section form input[type='password']"),
+    ],
+    "login_submit": [
+        (By.XPATH, LoginLocators.LOGIN_SUBMIT_BUTTON),
+        (By.CSS_SELECTOR, "section form button[type='submit']"),
+        (By.XPATH, _text_xpath("section//form//button", "Giriş Yap", "Login", "Log In")),
+    ],
+    "login_error": [
+        (By.XPATH, LoginLocators.LOGIN_ERROR_MESSAGE),
+        (By.CSS_SELECTOR, "section form [aria-live='assertive'], section form [aria-live='polite']"),
+        (By.CSS_SELECTOR, "section form [class*='error']"),
+    ],
+    "banner_101": [
+        (By.XPATH, Okey101Locators.BANNER_101),
+        (By.CSS_SELECTOR, "main img[alt='101']"),
+        (By.CSS_SELECTOR, "main a[href*='101'] img, main a[href*='lobby'] img"),
+    ],
+    "create_table_button": [
+        (By.XPATH, Okey101Locators.CREATE_TABLE_BUTTON),
+        (By.CSS_SELECTOR, _aria_css("button", "Masa Oluştur", "Create Table")),
+    ],
+    "table_name_input": [
+        (By.XPATH, Okey101Locators.TABLE_NAME_INPUT),
+        (By.CSS_SELECTOR, "form > label input[type='text']"),
+    ],
+    "bet_amount_input": [
+        (By.XPATH, Okey101Locators.BET_AMOUNT_INPUT),
+        (By.CSS_SELECTOR, "form > div:nth-of-type(1) label:nth-of-type(1) input"),
+        (By.CSS_SELECTOR, "form input[type='number']"),
+    ],
+    "player_count_2": [
+        (By.XPATH, Okey101Locators.PLAYER_COUNT_2),
+        (By.XPATH, "//form//button[.//div[normalize-space()='2']]"),
+    ],
+    "player_count_4": [
+        (By.XPATH, Okey101Locators.PLAYER_COUNT_4),
+        (By.XPATH, "//form//button[.//div[normalize-space()='4']]"),
+    ],
+    "create_table_submit": [
+        (By.XPATH, Okey101Locators.CREATE_TABLE_SUBMIT_BUTTON),
+        (By.CSS_SELECTOR, "form nav button[type='submit']"),
+        (By.XPATH, "//form//nav//button[.//div[normalize-space()='Masa Oluştur' or normalize-space()='Create Table']]"),
+    ],
+}
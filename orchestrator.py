@@ -0,0 +1,183 @@
+# orchestrator.py
+import os
+import sys
+import time
+import asyncio
+import argparse
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+@dataclass
+class TableResult:
+    table_id: int
+    ok: bool = False
+    cancelled: bool = False
+    table_name: str | None = None
+    error: str | None = None
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.finished_at - self.started_at)
+
+
+class TableOrchestrator:
+    """
+    Birden fazla 101 masasını tek process içinde, en fazla `concurrency` tanesi
+    aynı anda olacak şekilde koşturur. Her masa 101.run_table'ı bir worker thread'de
+    çalıştırır; chromedriver yolu, tarayıcı/hesap havuzları process içinde paylaşılır.
+    """
+
+    def __init__(self, flows, guests: int, concurrency: int, setup_workers: int, account_mode: str):
+        self.flows = flows
+        self.guests = guests
+        self.concurrency = concurrency
+        self.setup_workers = setup_workers
+        self.account_mode = account_mode
+
+        self._semaphore = None
+        self._cancel_events = {}
+        self.results = {}
+
+    async def run_one(self, table_id: int) -> TableResult:
+        result = TableResult(table_id=table_id)
+        self.results[table_id] = result
+        cancel_event = self._cancel_events.setdefault(table_id, threading.Event())
+
+        try:
+            async with self._semaphore:
+                if cancel_event.is_set():
+                    result.cancelled = True
+                    return result
+
+                result.started_at = time.time()
+                print(f"[{time.strftime('%H:%M:%S')}] Table {table_id}: starting.")
+                try:
+                    result.table_name = await asyncio.to_thread(
+                        self.flows.run_table,
+                        self.guests,
+                        setup_workers=self.setup_workers,
+                        account_mode=self.account_mode,
+                        cancel_event=cancel_event,
+                    )
+                    result.ok = True
+                except self.flows.TableCancelled:
+                    result.cancelled = True
+                except Exception as exc:
+                    result.error = repr(exc)
+                finally:
+                    result.finished_at = time.time()
+        except asyncio.CancelledError:
+            # Ctrl+C / görev iptali: özet bu masayı başarısız değil iptal saymalı;
+            # thread'deki run_table da bir sonraki faz sınırında dursun
+            result.cancelled = True
+            cancel_event.set()
+            raise
+
+        status = "ok" if result.ok else ("cancelled" if result.cancelled else f"failed: {result.error}")
+        print(f"[{time.strftime('%H:%M:%S')}] Table {table_id}: {status} ({result.duration:.0f}s).")
+        return result
+
+    def cancel(self, table_id: int) -> None:
+        """Masayı bir sonraki faz sınırında durdurur; tarayıcıları run_table kapatır."""
+        self._cancel_events.setdefault(table_id, threading.Event()).set()
+
+    def cancel_all(self) -> None:
+        for event in self._cancel_events.values():
+            event.set()
+
+    async def run(self, table_count: int) -> list:
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        # Varsayılan executor en fazla ~32 thread açar; her masa bir thread tutuyor
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="table")
+        )
+
+        tasks = [asyncio.create_task(self.run_one(i + 1)) for i in range(table_count)]
+        try:
+            return await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            self.cancel_all()
+            raise
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Runs many 101 table scenarios concurrently in a single process."
+    )
+    parser.add_argument("--tables", type=int, required=True, help="How many tables to run in total.")
+    parser.add_argument("--concurrency", type=int, default=5, help="Tables in flight at once (default 5).")
+    parser.add_argument(
+        "--guests",
+        type=int,
+        default=3,
+        help="Guests per table (must be 1 or 3). Total players = 1 host + guests.",
+    )
+    parser.add_argument("--setup-workers", type=int, default=None, help="Parallel player setup per table.")
+    parser.add_argument("--account-mode", choices=("register", "pool"), default=None)
+    parser.add_argument("--ci", action="store_true", help="Set CI=1 (headless, no human delays).")
+    args = parser.parse_args()
+
+    if args.guests not in (1, 3):
+        print(
+            f"INFO | Invalid --guests value: {args.guests}. "
+            "It must be 1 or 3 (1 host + guests = 2 or 4 players)."
+        )
+        sys.exit(1)
+
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.ci:
+        # 101.py ve browser_utils CI bayrağını import anında okuyor
+        os.environ["CI"] = "1"
+
+    flows = importlib.import_module("101")
+    from common.browser_pool import get_pool
+    from common.driver_cache import resolve_chromedriver_path
+
+    print("=== 101 table orchestrator ===")
+    print(f"Tables: {args.tables} | concurrency: {args.concurrency} | guests per table: {args.guests}")
+    print(f"chromedriver: {resolve_chromedriver_path()}")
+    # BROWSER_POOL_SIZE > 0 ise ısınmayı hemen başlat; masalar havuzu paylaşır
+    get_pool()
+
+    orchestrator = TableOrchestrator(
+        flows,
+        guests=args.guests,
+        concurrency=max(1, args.concurrency),
+        setup_workers=args.setup_workers or flows.SETUP_WORKERS,
+        account_mode=args.account_mode or flows.ACCOUNT_MODE,
+    )
+
+    started = time.time()
+    try:
+        results = asyncio.run(orchestrator.run(args.tables))
+    except KeyboardInterrupt:
+        print("Orchestrator stopped by user; cancelling running tables...")
+        orchestrator.cancel_all()
+        results = list(orchestrator.results.values())
+
+    elapsed_h = max(time.time() - started, 1.0) / 3600.0
+    ok = sum(1 for r in results if r.ok)
+    failed = [r for r in results if not r.ok and not r.cancelled]
+
+    print("\n=== Orchestrator Summary ===")
+    print(f"Finished ok : {ok}/{len(results)}")
+    print(f"Failed      : {len(failed)}")
+    print(f"Tables/hour : {ok / elapsed_h:.1f}")
+    for r in failed:
+        print(f"  table {r.table_id}: {r.error}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
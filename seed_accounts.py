@@ -0,0 +1,52 @@
+# seed_accounts.py
+import argparse
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from common.browser_utils import close_browser, open_browser
+from common.account_pool import Account, AccountPool
+
+# 101.py rakamla başladığı için normal import ile alınamıyor
+flows = importlib.import_module("101")
+
+
+def register_one(pool: AccountPool) -> str:
+    driver, wait = open_browser()
+    try:
+        email, username, password = flows.register_new_user(driver, wait)
+    finally:
+        close_browser(driver)
+
+    pool.add(Account(email=email, username=username, password=password))
+    return username
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Registers test accounts in bulk and stores them in the account pool."
+    )
+    parser.add_argument("--count", type=int, required=True, help="How many accounts to register.")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel browsers (default 4).")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pool = AccountPool()
+    print(f"INFO | Registering {args.count} account(s) into {pool.path} with {args.workers} worker(s)...")
+
+    ok = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = [executor.submit(register_one, pool) for _ in range(args.count)]
+        for future in as_completed(futures):
+            try:
+                print(f"INFO | Registered {future.result()}")
+                ok += 1
+            except Exception as exc:
+                print(f"ERROR | Registration failed: {exc!r}")
+
+    print(f"INFO | Done: {ok}/{args.count} registered. Pool status: {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
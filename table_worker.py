@@ -0,0 +1,202 @@
+# table_worker.py
+"""
+Çok node'lu koşu için kuyruk komutları:
+  publish  - kuyruğa N masa işi ekler
+  worker   - kuyruktan iş kiralayıp 101.run_table ile koşturur (heartbeat'li)
+  status   - kuyruk durumunu basar
+  serve    - SQLite kuyruğunu diğer node'lara HTTP ile açar
+Kuyruk adresi: --queue ya da JOB_QUEUE env (SQLite yolu veya http://host:port).
+"""
+import os
+import sys
+import time
+import json
+import socket
+import argparse
+import importlib
+import threading
+
+from common.job_queue import JOB_LEASE_TTL, JOB_QUEUE, JobQueue, make_server, open_queue
+from common.log import get_logger
+
+log = get_logger("table_worker")
+
+
+def cmd_publish(args):
+    queue = open_queue(args.queue)
+    ids = queue.publish({"guests": args.guests}, count=args.tables, max_attempts=args.max_attempts)
+    print(f"INFO | Published {len(ids)} table job(s) to {args.queue}.")
+
+
+def cmd_status(args):
+    stats = open_queue(args.queue).stats()
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+    print(
+        f"queued: {stats['queued']} | in flight: {stats['leased']} | "
+        f"done: {stats['done']} | failed: {stats['failed']}"
+    )
+    for worker, count in sorted(stats["workers"].items()):
+        print(f"  {worker}: {count} in flight")
+
+
+def cmd_serve(args):
+    server = make_server(JobQueue(args.db), host=args.host, port=args.port)
+    print(f"INFO | Job queue ({args.db}) listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Queue service stopped by user.")
+
+
+def _heartbeat_loop(queue, job, cancel_event, done_event, lease_lost, interval: float) -> None:
+    """
+    Kirayı canlı tutar; kira kaybedilirse masayı iptal eder (iş başka worker'a geçmiştir).
+    Masa iptal edildiyse kira artık yenilenmez.
+    """
+    while not done_event.wait(interval):
+        if cancel_event.is_set():
+            return
+        try:
+            if not queue.heartbeat(job.id, job.worker):
+                log.warning("Job %s: lease lost; cancelling table.", job.id)
+                lease_lost.set()
+                cancel_event.set()
+                return
+        except Exception as exc:
+            # Geçici ağ hatası; kira TTL'i dolmadan tekrar denenir
+            log.warning("Job %s: heartbeat failed: %r", job.id, exc)
+
+
+def _run_job(flows, queue, job, args, cancel_event) -> None:
+    done_event = threading.Event()
+    lease_lost = threading.Event()
+    beat = threading.Thread(
+        target=_heartbeat_loop,
+        args=(queue, job, cancel_event, done_event, lease_lost, JOB_LEASE_TTL / 3),
+        name=f"heartbeat-{job.id}",
+        daemon=True,
+    )
+    beat.start()
+
+    started = time.time()
+    ok = False
+    result = {}
+    try:
+        result["table_name"] = flows.run_table(
+            job.payload.get("guests", 3),
+            setup_workers=args.setup_workers or flows.SETUP_WORKERS,
+            account_mode=args.account_mode or flows.ACCOUNT_MODE,
+            cancel_event=cancel_event,
+        )
+        ok = True
+    except Exception as exc:
+        result["error"] = repr(exc)
+    finally:
+        done_event.set()
+        result["duration"] = round(time.time() - started, 1)
+
+    if lease_lost.is_set() and not ok:
+        # Kira zaten elimizde değil; sonucu yazmaya çalışma
+        return
+    # Kira kaybı yukarıda döndü; burada set edilmiş cancel_event kullanıcının durdurması demek.
+    # O iş başarısız sayılmaz: deneme hakkı yakılmadan kuyruğa döner
+    requeue = not ok and cancel_event.is_set()
+    try:
+        queue.complete(job.id, job.worker, ok, result, requeue=requeue)
+    except Exception as exc:
+        log.warning("Job %s: could not report result: %r", job.id, exc)
+    status = "ok" if ok else ("cancelled, requeued" if requeue else f"failed: {result.get('error')}")
+    print(f"[{time.strftime('%H:%M:%S')}] Job {job.id} (attempt {job.attempts}): {status} ({result['duration']:.0f}s).")
+
+
+def cmd_worker(args):
+    if args.ci:
+        # 101.py ve browser_utils CI bayrağını import anında okuyor
+        os.environ["CI"] = "1"
+
+    flows = importlib.import_module("101")
+    from common.browser_pool import get_pool
+    from common.driver_cache import resolve_chromedriver_path
+
+    queue = open_queue(args.queue)
+    worker_id = args.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    print(f"=== 101 table worker {worker_id} ===")
+    print(f"Queue: {args.queue} | concurrency: {args.concurrency}")
+    print(f"chromedriver: {resolve_chromedriver_path()}")
+    # BROWSER_POOL_SIZE > 0 ise ısınmayı hemen başlat; masalar havuzu paylaşır
+    get_pool()
+
+    # (thread, cancel_event) çiftleri
+    running = []
+    try:
+        while True:
+            running = [(t, ev) for t, ev in running if t.is_alive()]
+            leased = False
+            while len(running) < args.concurrency:
+                job = queue.lease(worker_id)
+                if job is None:
+                    break
+                leased = True
+                cancel_event = threading.Event()
+                t = threading.Thread(
+                    target=_run_job, args=(flows, queue, job, args, cancel_event), name=f"job-{job.id}"
+                )
+                t.start()
+                running.append((t, cancel_event))
+
+            if not running and not leased and not args.wait:
+                print("INFO | Queue is empty; worker exiting.")
+                return
+            time.sleep(args.poll)
+    except KeyboardInterrupt:
+        print(f"Worker stopped by user; cancelling {len(running)} running table(s) and returning their jobs to the queue.")
+        for _, cancel_event in running:
+            cancel_event.set()
+        for t, _ in running:
+            t.join()
+        sys.exit(1)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Shared job queue for multi-node 101 table runs.")
+    parser.add_argument("--queue", default=JOB_QUEUE, help=f"SQLite path or http://host:port (default: {JOB_QUEUE}).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("publish", help="Add table jobs to the queue.")
+    p.add_argument("--tables", type=int, required=True, help="How many table jobs to publish.")
+    p.add_argument("--guests", type=int, default=3, choices=(1, 3), help="Guests per table.")
+    p.add_argument("--max-attempts", type=int, default=3, help="Attempts per job before it is marked failed.")
+    p.set_defaults(func=cmd_publish)
+
+    p = sub.add_parser("worker", help="Lease and run table jobs.")
+    p.add_argument("--concurrency", type=int, default=5, help="Tables in flight on this node (default 5).")
+    p.add_argument("--setup-workers", type=int, default=None, help="Parallel player setup per table.")
+    p.add_argument("--account-mode", choices=("register", "pool"), default=None)
+    p.add_argument("--worker-id", help="Worker name in the queue (default host:pid).")
+    p.add_argument("--poll", type=float, default=5, help="Seconds between lease attempts.")
+    p.add_argument("--wait", action="store_true", help="Keep polling when the queue is empty.")
+    p.add_argument("--ci", action="store_true", help="Set CI=1 (headless, no human delays).")
+    p.set_defaults(func=cmd_worker)
+
+    p = sub.add_parser("status", help="Show queue counts and per-worker jobs in flight.")
+    p.add_argument("--json", action="store_true", help="Print as JSON.")
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser("serve", help="Expose a SQLite queue to other nodes over HTTP.")
+    p.add_argument("--db", default=os.path.join("runs", "jobs.db"), help="SQLite queue file to serve.")
+    p.add_argument("--host", default="0.0.0.0")
+    p.add_argument("--port", type=int, default=8765)
+    p.set_defaults(func=cmd_serve)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
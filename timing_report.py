@@ -0,0 +1,186 @@
+# timing_report.py
+import sys
+import glob
+import json
+import argparse
+from collections import defaultdict
+
+from common.timing import TIMING_LOG
+
+# Rapor sırası: senaryodaki faz sırası
+PHASE_ORDER = [
+    "open_browser",
+    "register_new_user",
+    "restore_session",
+    "login",
+    "player_setup",
+    "go_to_101_lobby",
+    "host_create_table",
+    "guest_join_table",
+    "wait_for_game_end",
+]
+
+
+def percentile(sorted_values, pct: float) -> float | None:
+    """Doğrusal interpolasyonlu yüzdelik (sorted_values sıralı olmalı); örnek yoksa None."""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def load_records(patterns):
+    records = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+    return records
+
+
+def build_report(records) -> dict:
+    phases = defaultdict(lambda: {"ok": [], "failed": 0})
+    for r in records:
+        if r.get("kind") != "phase":
+            continue
+        bucket = phases[r["phase"]]
+        if r.get("ok"):
+            bucket["ok"].append(r["duration"])
+        else:
+            bucket["failed"] += 1
+
+    phase_rows = {}
+    names = [p for p in PHASE_ORDER if p in phases] + sorted(set(phases) - set(PHASE_ORDER))
+    for name in names:
+        durations = sorted(phases[name]["ok"])
+        total = len(durations) + phases[name]["failed"]
+        phase_rows[name] = {
+            "count": total,
+            "success_rate": len(durations) / total if total else 0.0,
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "p99": percentile(durations, 99),
+        }
+
+    tables = [r for r in records if r.get("kind") == "table"]
+    ok_tables = [t for t in tables if t.get("ok")]
+    table_summary = {
+        "count": len(tables),
+        "ok": len(ok_tables),
+        "tables_per_hour": 0.0,
+        "retries": sum(t.get("retries", 0) for t in tables),
+        "replaced_players": sum(t.get("replaced_players", 0) for t in tables),
+    }
+    if tables:
+        first_start = min(t["start"] for t in tables)
+        last_end = max(t["start"] + t["duration"] for t in tables)
+        span_h = max(last_end - first_start, 1.0) / 3600.0
+        table_summary["success_rate"] = len(ok_tables) / len(tables)
+        table_summary["tables_per_hour"] = len(ok_tables) / span_h
+        table_summary["p50_duration"] = percentile(sorted(t["duration"] for t in ok_tables), 50)
+
+    return {"phases": phase_rows, "tables": table_summary, "network": build_network_summary(records)}
+
+
+def build_network_summary(records) -> dict:
+    """Oyuncu başına ortalama istek/byte; lean ve normal koşular ayrı gruplanır."""
+    groups = defaultdict(list)
+    for r in records:
+        if r.get("kind") == "network":
+            groups["lean" if r.get("lean") else "normal"].append(r)
+
+    summary = {}
+    for mode, rows in groups.items():
+        summary[mode] = {
+            "players": len(rows),
+            "avg_requests": sum(r["requests"] for r in rows) / len(rows),
+            "avg_bytes": sum(r["bytes"] for r in rows) / len(rows),
+            "avg_blocked_requests": sum(r["blocked_requests"] for r in rows) / len(rows),
+        }
+
+    if "lean" in summary and "normal" in summary:
+        summary["saved_per_player"] = {
+            "requests": summary["normal"]["avg_requests"] - summary["lean"]["avg_requests"],
+            "bytes": summary["normal"]["avg_bytes"] - summary["lean"]["avg_bytes"],
+        }
+    return summary
+
+
+def _seconds(value, width: int = 7, digits: int = 1) -> str:
+    """Süre hücresi; örnek yoksa (hepsi başarısız faz) NaN yerine n/a."""
+    if value is None:
+        return f"{'n/a':>{width + 1}}"
+    return f"{value:>{width}.{digits}f}s"
+
+
+def print_report(report: dict) -> None:
+    print(f"{'phase':<20} {'count':>6} {'ok%':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, row in report["phases"].items():
+        print(
+            f"{name:<20} {row['count']:>6} {row['success_rate'] * 100:>5.1f}% "
+            f"{_seconds(row['p50'])} {_seconds(row['p95'])} {_seconds(row['p99'])}"
+        )
+
+    t = report["tables"]
+    print()
+    print(f"Tables      : {t['ok']}/{t['count']} ok")
+    if t["count"]:
+        print(f"Success rate: {t['success_rate'] * 100:.1f}%")
+        print(f"Tables/hour : {t['tables_per_hour']:.1f}")
+        print(f"p50 table   : {_seconds(t['p50_duration'], width=0, digits=0)}")
+        print(f"Retries     : {t['retries']} ({t['replaced_players']} player(s) replaced)")
+
+    net = report.get("network") or {}
+    for mode in ("normal", "lean"):
+        if mode in net:
+            n = net[mode]
+            print(
+                f"Network ({mode:6}): {n['players']} player(s), avg {n['avg_requests']:.0f} requests, "
+                f"{n['avg_bytes'] / 1024:.0f} KiB, {n['avg_blocked_requests']:.0f} blocked"
+            )
+    if "saved_per_player" in net:
+        saved = net["saved_per_player"]
+        print(
+            f"Lean saves per player: {saved['requests']:.0f} requests, {saved['bytes'] / 1024:.0f} KiB"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Aggregates timing JSONL files into per-phase p50/p95/p99 and table throughput."
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=[TIMING_LOG],
+        help=f"Timing JSONL files or globs (default: {TIMING_LOG}).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    records = load_records(args.files)
+    if not records:
+        print(f"INFO | No timing records found in: {', '.join(args.files)}")
+        sys.exit(1)
+
+    report = build_report(records)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()